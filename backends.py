@@ -0,0 +1,288 @@
+"""Platform sampling backends used by the dashboard collectors.
+
+``PsutilBackend`` is the portable path (psutil, plus ``GetPerformanceInfo``
+on Windows). ``LinuxProcBackend`` reads ``/proc`` and ``/sys`` directly: every
+file is opened once and re-read with ``os.pread`` at offset 0 on each tick,
+so sampling costs no ``open()``/``close()`` calls and allocates no psutil
+result objects.
+
+All backends expose the same counters (cumulative I/O counters are turned
+into rates by ``rates.RateEngine``):
+
+    cpu_percent()      -> total CPU busy % since the previous call
+    memory()           -> (total, used, percent, available, cached) in bytes/%
+    nic_counters()     -> {nic: {bytes_sent, bytes_recv}}
+    disk_counters()    -> {disk: {read_bytes, write_bytes, read_count,
+                           write_count, read_time, write_time, busy_time}}
+    task_counts()      -> (processes, threads)
+    cpu_temperature()  -> °C or None
+"""
+import ctypes
+import os
+
+import psutil
+
+SECTOR_SIZE = 512  # /proc/diskstats always counts 512-byte sectors
+MEMINFO_KEYS = (b"MemTotal", b"MemAvailable", b"Cached", b"SReclaimable")
+
+# hwmon chip names that report the CPU package/die temperature
+CPU_HWMON_CHIPS = ("coretemp", "k10temp", "zenpower", "cpu_thermal", "acpitz")
+
+
+class PsutilBackend:
+    """Portable backend built on psutil."""
+
+    name = "psutil"
+
+    def __init__(self):
+        psutil.cpu_percent(interval=None)  # Prime the non-blocking counter
+        self._get_performance_info = None
+        if os.name == 'nt':
+            # Bound once: memory() and task_counts() call it on every tick
+            self._get_performance_info = ctypes.WinDLL('psapi.dll').GetPerformanceInfo
+            self._get_performance_info.argtypes = [ctypes.POINTER(_PERFORMANCE_INFORMATION),
+                                                   ctypes.c_ulong]
+
+    def _performance_info(self):
+        """Windows PERFORMANCE_INFORMATION, or None elsewhere / on failure."""
+        if self._get_performance_info is None:
+            return None
+        pi = _PERFORMANCE_INFORMATION()
+        pi.cb = ctypes.sizeof(pi)
+        return pi if self._get_performance_info(ctypes.byref(pi), pi.cb) else None
+
+    def cpu_percent(self):
+        return psutil.cpu_percent(interval=None)
+
+    def memory(self):
+        mem = psutil.virtual_memory()
+        cached = getattr(mem, "cached", None)
+        # Standby/system cache from Windows PERFORMANCE_INFORMATION
+        pi = self._performance_info()
+        if pi is not None:
+            cached = pi.SystemCache * pi.PageSize
+        if cached is None:
+            cached = max(0, mem.available - mem.free)
+        return mem.total, mem.used, mem.percent, mem.available, cached
+
+    def nic_counters(self):
+        return psutil.net_io_counters(pernic=True)
+
+    def disk_counters(self):
+        return psutil.disk_io_counters(perdisk=True) or {}
+
+    def task_counts(self):
+        # One kernel call instead of walking every process
+        pi = self._performance_info()
+        if pi is not None:
+            return pi.ProcessCount, pi.ThreadCount
+        return len(psutil.pids()), 0
+
+    def cpu_temperature(self):
+        if not hasattr(psutil, "sensors_temperatures"):
+            return None
+        temps = psutil.sensors_temperatures()
+        for chip in CPU_HWMON_CHIPS:
+            for entry in temps.get(chip, []):
+                if entry.current:
+                    return entry.current
+        return None
+
+    def close(self):
+        pass
+
+
+class _PERFORMANCE_INFORMATION(ctypes.Structure):
+    _fields_ = [
+        ('cb', ctypes.c_ulong),
+        ('CommitTotal', ctypes.c_size_t),
+        ('CommitLimit', ctypes.c_size_t),
+        ('CommitPeak', ctypes.c_size_t),
+        ('PhysicalTotal', ctypes.c_size_t),
+        ('PhysicalAvailable', ctypes.c_size_t),
+        ('SystemCache', ctypes.c_size_t),
+        ('KernelTotal', ctypes.c_size_t),
+        ('KernelPaged', ctypes.c_size_t),
+        ('KernelNonPaged', ctypes.c_size_t),
+        ('PageSize', ctypes.c_size_t),
+        ('HandleCount', ctypes.c_ulong),
+        ('ProcessCount', ctypes.c_ulong),
+        ('ThreadCount', ctypes.c_ulong),
+    ]
+
+
+class LinuxProcBackend:
+    """Reads /proc and /sys through file descriptors kept open for its lifetime."""
+
+    name = "procfs"
+
+    def __init__(self, proc="/proc", sys="/sys"):
+        self.proc = proc
+        self.sys = sys
+        self._fds = {}
+        for key in ("stat", "meminfo", "diskstats", "net/dev", "loadavg"):
+            self._fds[key] = os.open(os.path.join(proc, key), os.O_RDONLY)
+
+        self._whole_disks = self._find_whole_disks()
+        self._temp_fd = self._open_cpu_temp()
+        self._last_cpu = self._read_cpu_times()
+
+    # --- Setup ---
+    def _find_whole_disks(self):
+        """Block devices that are disks, not partitions (None = count everything)."""
+        try:
+            return set(os.listdir(os.path.join(self.sys, "block")))
+        except OSError:
+            return None
+
+    def _open_cpu_temp(self):
+        """Open the first CPU temperature input under hwmon, then thermal zones."""
+        hwmon = os.path.join(self.sys, "class", "hwmon")
+        try:
+            chips = sorted(os.listdir(hwmon))
+        except OSError:
+            chips = []
+        for chip in chips:
+            base = os.path.join(hwmon, chip)
+            try:
+                with open(os.path.join(base, "name")) as f:
+                    name = f.read().strip()
+            except OSError:
+                continue
+            if name not in CPU_HWMON_CHIPS:
+                continue
+            # temp1_input is the package / Tctl sensor on the common drivers
+            for entry in sorted(os.listdir(base)):
+                if entry.startswith("temp") and entry.endswith("_input"):
+                    try:
+                        return os.open(os.path.join(base, entry), os.O_RDONLY)
+                    except OSError:
+                        pass
+
+        zones = os.path.join(self.sys, "class", "thermal")
+        try:
+            entries = sorted(os.listdir(zones))
+        except OSError:
+            entries = []
+        for zone in entries:
+            if zone.startswith("thermal_zone"):
+                try:
+                    return os.open(os.path.join(zones, zone, "temp"), os.O_RDONLY)
+                except OSError:
+                    pass
+        return None
+
+    # --- Raw reads ---
+    @staticmethod
+    def _pread(fd, chunk=65536):
+        """Whole contents of an already open file, read from offset 0."""
+        data = os.pread(fd, chunk, 0)
+        if len(data) < chunk:
+            return data
+        parts = [data]
+        offset = len(data)
+        while True:
+            more = os.pread(fd, chunk, offset)
+            if not more:
+                break
+            parts.append(more)
+            offset += len(more)
+        return b"".join(parts)
+
+    def _read_cpu_times(self):
+        # First line: "cpu  user nice system idle iowait irq softirq steal ..."
+        data = self._pread(self._fds["stat"], 4096)
+        fields = data[:data.index(b"\n")].split()[1:]
+        times = [int(v) for v in fields[:8]]
+        idle = times[3] + times[4]  # idle + iowait
+        return sum(times), idle
+
+    # --- Backend API ---
+    def cpu_percent(self):
+        total, idle = self._read_cpu_times()
+        last_total, last_idle = self._last_cpu
+        self._last_cpu = (total, idle)
+        dt = total - last_total
+        if dt <= 0:
+            return 0.0
+        return round(100.0 * (dt - (idle - last_idle)) / dt, 1)
+
+    def memory(self):
+        info = {}
+        for line in self._pread(self._fds["meminfo"]).splitlines():
+            key, _, rest = line.partition(b":")
+            if key in MEMINFO_KEYS:
+                info[key] = int(rest.split()[0]) * 1024
+                if len(info) == len(MEMINFO_KEYS):
+                    break
+        total = info[b"MemTotal"]
+        available = info[b"MemAvailable"]
+        used = total - available
+        # Same definition as psutil: page cache plus reclaimable slab
+        cached = info.get(b"Cached", 0) + info.get(b"SReclaimable", 0)
+        return total, used, round(100.0 * used / total, 1), available, cached
+
+    def nic_counters(self):
+        nics = {}
+        # Two header lines, then "iface: rx_bytes ... (8 rx fields) tx_bytes ..."
+        for line in self._pread(self._fds["net/dev"]).splitlines()[2:]:
+            name, _, counters = line.partition(b":")
+            fields = counters.split()
+            nics[name.strip().decode()] = {"bytes_recv": int(fields[0]), "bytes_sent": int(fields[8])}
+        return nics
+
+    def disk_counters(self):
+        disks = {}
+        whole = self._whole_disks
+        # "major minor name reads merged sectors_read ms_reading
+        #  writes merged sectors_written ms_writing in_flight ms_busy ..."
+        for line in self._pread(self._fds["diskstats"]).splitlines():
+            fields = line.split()
+            name = fields[2].decode()
+            if whole is not None and name not in whole:
+                continue
+            disks[name] = {
+                "read_count": int(fields[3]),
+                "read_bytes": int(fields[5]) * SECTOR_SIZE,
+                "read_time": int(fields[6]),
+                "write_count": int(fields[7]),
+                "write_bytes": int(fields[9]) * SECTOR_SIZE,
+                "write_time": int(fields[10]),
+                "busy_time": int(fields[12]),
+            }
+        return disks
+
+    def task_counts(self):
+        # loadavg: "0.00 0.01 0.05 running/total_threads last_pid"
+        threads = int(self._pread(self._fds["loadavg"], 256).split()[3].split(b"/")[1])
+        processes = 0
+        with os.scandir(self.proc) as it:
+            for entry in it:
+                if entry.name.isdigit():
+                    processes += 1
+        return processes, threads
+
+    def cpu_temperature(self):
+        if self._temp_fd is None:
+            return None
+        return int(self._pread(self._temp_fd, 32)) / 1000.0  # millidegrees
+
+    def close(self):
+        for fd in list(self._fds.values()) + [self._temp_fd]:
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        self._fds = {}
+        self._temp_fd = None
+
+
+def get_backend(preferred="auto"):
+    """Best backend for this platform (``preferred``: auto, procfs or psutil)."""
+    if preferred in ("auto", "procfs") and os.name == 'posix' and os.path.exists("/proc/stat"):
+        try:
+            return LinuxProcBackend()
+        except OSError as e:
+            print(f"procfs backend unavailable, using psutil: {e}")
+    return PsutilBackend()
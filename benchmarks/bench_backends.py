@@ -0,0 +1,49 @@
+"""Per-tick sampling cost of each metrics backend.
+
+Usage:
+    python benchmarks/bench_backends.py [ticks]
+
+One tick reads everything the dashboard collectors sample: CPU, memory,
+network and disk counters, process/thread counts and CPU temperature. The
+procfs backend is only measured on Linux.
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backends import LinuxProcBackend, PsutilBackend
+
+
+def tick(backend):
+    backend.cpu_percent()
+    backend.memory()
+    backend.nic_counters()
+    backend.disk_counters()
+    backend.task_counts()
+    backend.cpu_temperature()
+
+
+def bench(backend, n):
+    tick(backend)  # Warm up (first temperature / pid scan)
+    start = time.perf_counter()
+    for _ in range(n):
+        tick(backend)
+    return (time.perf_counter() - start) / n
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    backends = [PsutilBackend()]
+    if os.path.exists("/proc/stat"):
+        backends.append(LinuxProcBackend())
+
+    print(f"{n} ticks")
+    results = {}
+    for b in backends:
+        results[b.name] = bench(b, n)
+        print(f"  {b.name:8s}: {results[b.name] * 1e6:8.1f} us/tick")
+        b.close()
+    if len(results) == 2:
+        print(f"  speedup : {results['psutil'] / results['procfs']:8.1f}x")
@@ -0,0 +1,91 @@
+"""Parse time of log_reader vs csv.reader on a synthetic performance log.
+
+Compares the bare csv.reader split, the same split with every cell converted
+row by row (what a straightforward reader does), read_log with all columns
+and read_log with only the fields a chart needs.
+
+Usage:
+    python benchmarks/bench_log_reader.py [rows]
+
+The file mixes the RAM cleaner layout with a block of legacy rows under
+their own header, like the logs written by older versions of the apps.
+"""
+import csv
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from log_reader import read_log, to_bool, to_float
+
+
+def write_log(path, n):
+    start = time.time() - n
+    with open(path, "w", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(["Timestamp", "RAM%", "CPU%", "Battery%", "DiskSpeed(MB/s)", "NetSpeed(KB/s)", "Opt"])
+        for i in range(n):
+            ts = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(start + i))
+            if i % 1000 == 999:
+                w.writerow([ts, "91.2", "12.0", "80%", "0.50", "12.25", "Auto: high_ram 91%"])
+            else:
+                w.writerow([ts, f"{50 + i % 40}.5", f"{i % 100}.0", "80%", "1.02", "320.53", ""])
+        w.writerow(["Timestamp", "RAM_Usage(%)", "CPU_Usage(%)", "Active_Processes",
+                    "Disk_Read_Speed(MB/s)", "Disk_Write_Speed(MB/s)", "GPU_Usage", "Optimized", "Reason"])
+        for i in range(n // 100):
+            w.writerow([ts, "81.1", "22.4", "534", "3.31", "0.53", "1%", "False", ""])
+        f.write("2026-01-10 11:00:2\n")    # Truncated line
+
+
+def bench_csv(path):
+    with open(path, newline="") as f:
+        return sum(1 for _ in csv.reader(f))
+
+
+def bench_per_row(path):
+    """csv.reader plus per-cell conversion, switching layout on header lines."""
+    kinds, rows = None, []
+    with open(path, newline="") as f:
+        for row in csv.reader(f):
+            if row[0] == "Timestamp":
+                kinds = ["float"] * (len(row) - 1)
+                if "Optimized" in row:
+                    kinds[row.index("Optimized") - 1] = "bool"
+                    kinds[row.index("Reason") - 1] = "str"
+                else:
+                    kinds[-1] = "str"
+                continue
+            try:
+                ts = time.mktime(time.strptime(row[0], "%Y-%m-%d %H:%M:%S"))
+            except ValueError:
+                continue
+            rows.append([ts] + [to_float(v) if k == "float" else to_bool(v) if k == "bool" else v
+                                for k, v in zip(kinds, row[1:])])
+    return len(rows)
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "log.csv")
+        write_log(path, n)
+        print(f"{n} rows, {os.path.getsize(path) / 1e6:.1f} MB")
+
+        start = time.perf_counter()
+        rows = bench_csv(path)
+        print(f"  csv.reader (split only): {time.perf_counter() - start:6.3f} s ({rows} rows)")
+
+        start = time.perf_counter()
+        rows = bench_per_row(path)
+        print(f"  csv.reader + per-cell conversion: {time.perf_counter() - start:6.3f} s ({rows} rows)")
+
+        start = time.perf_counter()
+        data = read_log(path)
+        print(f"  read_log (all columns): {time.perf_counter() - start:6.3f} s "
+              f"({len(data)} rows, {data.bad} bad, {dict(data.schemas)})")
+
+        start = time.perf_counter()
+        data = read_log(path, fields=("ram_p", "cpu_p"))
+        print(f"  read_log (ram_p, cpu_p): {time.perf_counter() - start:6.3f} s ({len(data)} rows)")
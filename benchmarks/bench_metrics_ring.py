@@ -0,0 +1,58 @@
+"""Append and read-back cost: CSV log vs the mmap ring file.
+
+Usage:
+    python benchmarks/bench_metrics_ring.py [rows]
+
+"csv" opens, appends one row and closes the file per sample (the old
+log_csv); "ring" is one struct pack into the mapping. The read side is what
+the log viewer needs: the newest 100 rows.
+"""
+import csv
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metrics_ring import MetricsRing
+
+FIELDS = ("ram_p", "cpu_p", "battery_p", "disk_mb_s", "net_kb_s")
+
+
+def bench_csv(path, n):
+    start = time.perf_counter()
+    for i in range(n):
+        with open(path, mode='a', newline='') as f:
+            csv.writer(f).writerow([datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                                    50.0, 12.5, "80%", f"{i * 0.01:.2f}", f"{i * 0.1:.2f}", ""])
+    append = (time.perf_counter() - start) / n
+
+    start = time.perf_counter()
+    with open(path, mode='r') as f:
+        rows = list(csv.reader(f))[-100:]
+    return append, time.perf_counter() - start, len(rows)
+
+
+def bench_ring(path, n):
+    ring = MetricsRing(path, FIELDS, capacity=n + 1)
+    start = time.perf_counter()
+    for i in range(n):
+        ring.append(time.time(), (50.0, 12.5, 80.0, i * 0.01, i * 0.1))
+    append = (time.perf_counter() - start) / n
+
+    start = time.perf_counter()
+    rows = ring.last(100)
+    read = time.perf_counter() - start
+    ring.close()
+    return append, read, len(rows)
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{n} rows")
+        for name, fn, path in (("csv", bench_csv, "log.csv"), ("ring", bench_ring, "log.ring")):
+            append, read, rows = fn(os.path.join(tmp, path), n)
+            print(f"  {name:5s}: append {append * 1e6:7.1f} us/row, last {rows} rows {read * 1e3:7.2f} ms")
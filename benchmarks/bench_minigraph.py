@@ -0,0 +1,77 @@
+"""Per-frame cost of MiniGraph: delete/recreate vs. retained canvas items.
+
+Usage:
+    python benchmarks/bench_minigraph.py [frames]
+
+For 50, 500 and 5000 points, feeds the same samples to the previous
+implementation (``delete("all")`` plus new polygon and line on every value)
+and to the current retained-mode ``MiniGraph``, forcing Tk to redraw after
+each frame. Both run with the same ``smooth`` setting, first smoothed (as
+the old graph always was), then straight, so the speedup is the retained
+items alone. The last column is what the default ``smooth=None`` picks at
+this width (straight above ``SMOOTH_MAX_DENSITY`` points per pixel). Needs
+a display (on Linux, run under Xvfb).
+"""
+import os
+import random
+import sys
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from system_dashboard_pro import MiniGraph, ModernTheme
+
+
+class LegacyMiniGraph(MiniGraph):
+    """The old draw(): clears the canvas and rebuilds both items every frame."""
+
+    def add_value(self, value):
+        self.data.append(max(0, min(100, value)))
+        self.draw()
+
+    def draw(self):
+        self.delete("all")
+        points = []
+        step = self.width / (len(self.data) - 1)
+        for i, val in enumerate(self.data):
+            points.extend([i * step, self.height - (val / 100 * self.height)])
+        fill_points = points + [self.width, self.height, 0, self.height]
+        self.create_polygon(fill_points, fill=ModernTheme.BG_HOVER, outline="", smooth=self.smooth)
+        self.create_line(points, fill=self.color, width=2, smooth=self.smooth)
+
+
+WIDTH = 350
+
+
+def bench(root, cls, points, frames, smooth):
+    graph = cls(root, width=WIDTH, height=100, points=points, smooth=smooth)
+    graph.pack()
+    root.update()
+    samples = [random.uniform(0, 100) for _ in range(frames)]
+    start = time.perf_counter()
+    for v in samples:
+        graph.add_value(v)
+        root.update_idletasks()  # Include the canvas repaint
+    elapsed = (time.perf_counter() - start) / frames
+    graph.destroy()
+    return elapsed
+
+
+if __name__ == "__main__":
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        sys.exit(f"No display available: {e}")
+
+    print(f"{frames} frames per run, width {WIDTH}")
+    print(f"  {'points':>6s}  {'smooth':>6s}  {'legacy':>10s}  {'retained':>10s}  speedup  default")
+    for points in (50, 500, 5000):
+        default = "smooth" if points <= WIDTH * MiniGraph.SMOOTH_MAX_DENSITY else "straight"
+        for smooth in (True, False):
+            legacy = bench(root, LegacyMiniGraph, points, frames, smooth)
+            retained = bench(root, MiniGraph, points, frames, smooth)
+            print(f"  {points:6d}  {str(smooth):>6s}  {legacy * 1e3:7.3f} ms  {retained * 1e3:7.3f} ms  "
+                  f"{legacy / retained:6.1f}x  {default}")
+    root.destroy()
@@ -0,0 +1,51 @@
+"""Compare a process spawn per query with the persistent ShellBroker session.
+
+Usage:
+    python benchmarks/bench_shell_broker.py [iterations]
+
+On Windows this runs the Memory Compression query the RAM cleaner issues
+every tick. Elsewhere it uses ``sh`` as a stand-in interpreter.
+"""
+import os
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shell_broker import DEFAULT_ARGV, ShellBroker
+
+if os.name == 'nt':
+    QUERY = "Get-Process -Name 'Memory Compression' -ErrorAction SilentlyContinue | Select-Object -ExpandProperty WorkingSet"
+    SPAWN = ['powershell', '-Command', QUERY]
+else:
+    QUERY = "cat /proc/loadavg"
+    SPAWN = ['sh', '-c', QUERY]
+
+
+def bench_spawn(n):
+    start = time.perf_counter()
+    for _ in range(n):
+        subprocess.run(SPAWN, capture_output=True, text=True)
+    return (time.perf_counter() - start) / n
+
+
+def bench_broker(n):
+    broker = ShellBroker()
+    broker.query(QUERY)  # Session startup is paid once, outside the loop
+    start = time.perf_counter()
+    for _ in range(n):
+        broker.query(QUERY)
+    elapsed = (time.perf_counter() - start) / n
+    broker.close()
+    return elapsed
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    print(f"Interpreter: {' '.join(DEFAULT_ARGV)}  ({n} queries)")
+    spawn = bench_spawn(n)
+    broker = bench_broker(n)
+    print(f"  spawn per query : {spawn * 1000:8.2f} ms/query")
+    print(f"  persistent      : {broker * 1000:8.2f} ms/query")
+    print(f"  speedup         : {spawn / broker:8.1f}x")
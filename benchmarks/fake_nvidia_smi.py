@@ -0,0 +1,37 @@
+"""Stand-in for ``nvidia-smi --query-gpu=... --format=csv,noheader,nounits -lms N``.
+
+Emits one CSV line per fake GPU every N ms so GpuTelemetry can be exercised
+without NVIDIA hardware:
+
+    NVIDIA_SMI="python benchmarks/fake_nvidia_smi.py" python system_dashboard_pro.py
+
+FAKE_GPU_COUNT sets the number of GPUs (default 2).
+"""
+import math
+import os
+import sys
+import time
+
+
+def main(argv):
+    interval_ms = 1000
+    if "-lms" in argv:
+        interval_ms = int(argv[argv.index("-lms") + 1])
+    count = int(os.environ.get("FAKE_GPU_COUNT", "2"))
+
+    tick = 0
+    while True:
+        for i in range(count):
+            util = 50 + 45 * math.sin((tick + i * 7) / 10.0)
+            used = 2048 + 1024 * math.sin((tick + i) / 25.0)
+            temp = 55 + 10 * math.sin((tick + i * 3) / 30.0)
+            print(f"{i}, Fake GPU {i}, {util:.0f}, {used:.0f}, 8192, {temp:.0f}", flush=True)
+        tick += 1
+        time.sleep(interval_ms / 1000.0)
+
+
+if __name__ == "__main__":
+    try:
+        main(sys.argv[1:])
+    except (KeyboardInterrupt, BrokenPipeError):
+        pass
@@ -0,0 +1,283 @@
+"""Background metric collectors with independent sampling cadences.
+
+Each source (CPU, memory, sensors, GPU, ...) is wrapped in a ``Collector``
+that owns its interval, timeout and last good value. ``CollectorRegistry``
+runs every collector on its own daemon thread, so a slow or hung probe only
+delays its own value instead of the whole monitoring loop. The probe itself
+runs on a second, persistent worker thread per collector (so thread-bound
+handles such as COM objects stay valid); a call that takes longer than
+``timeout`` is given up on and counted in ``timeouts``, and no new call is
+started until the stuck one returns. ``SourceCascade``
+picks between several ways of reading the same value. ``MetricSnapshot`` is
+the immutable per-tick result the sampler hands to the UI.
+"""
+import threading
+import time
+from dataclasses import dataclass
+
+
+class Collector:
+    """A single metric source sampled on its own interval."""
+
+    def __init__(self, name, probe=None, interval=1.0, timeout=None, default=None):
+        self.name = name
+        self.interval = interval
+        # How long run_once() waits for a probe before giving up on it
+        self.timeout = timeout if timeout is not None else max(1.0, interval * 4)
+        self.value = default
+        self.default = default
+        self._probe = probe
+
+        # Bookkeeping (monotonic seconds)
+        self.last_ok = None
+        self.last_error = None
+        self.last_duration = 0.0
+        self.samples = 0
+        self.errors = 0
+        self.timeouts = 0
+        self._running_since = None
+        self._worker = None
+        self._request = threading.Event()
+        self._done = threading.Event()
+        self._lock = threading.Lock()   # Starting a call vs. the worker finishing one
+
+    def probe(self):
+        """Return a fresh value. Override or pass ``probe=`` to the constructor."""
+        return self._probe()
+
+    def run_once(self):
+        """Run the probe once on the worker, keeping the last good value on failure.
+
+        Waits at most ``timeout``. A probe that overruns keeps running and
+        still delivers its value when it returns, but until then every call
+        counts as a timeout instead of queueing another probe behind it.
+        """
+        with self._lock:
+            idle = self._running_since is None
+            if idle:
+                if self._worker is None:
+                    self._worker = threading.Thread(target=self._work, name=f"probe-{self.name}",
+                                                    daemon=True)
+                    self._worker.start()
+                self._done.clear()
+                self._running_since = time.monotonic()
+                self._request.set()
+        if idle and self._done.wait(self.timeout):
+            return self.value
+        self.timeouts += 1
+        self.errors += 1
+        self.last_error = TimeoutError(f"{self.name} probe running for more than {self.timeout:g}s")
+        return self.value
+
+    def _work(self):
+        while True:
+            self._request.wait()
+            self._request.clear()
+            start = self._running_since
+            try:
+                value = self.probe()
+            except Exception as e:
+                self.errors += 1
+                self.last_error = e
+            else:
+                self.value = value
+                self.last_ok = time.monotonic()
+                self.last_error = None
+                self.samples += 1
+            finally:
+                with self._lock:
+                    self.last_duration = time.monotonic() - start
+                    self._running_since = None
+                    self._done.set()
+
+    def is_hung(self, now=None):
+        """True while a probe has been running for longer than its timeout."""
+        started = self._running_since
+        if started is None:
+            return False
+        return ((now or time.monotonic()) - started) > self.timeout
+
+    def is_stale(self, now=None):
+        """True if no good value arrived within one interval plus the timeout."""
+        if self.last_ok is None:
+            return True
+        return ((now or time.monotonic()) - self.last_ok) > (self.interval + self.timeout)
+
+    def status(self):
+        now = time.monotonic()
+        return {
+            "name": self.name,
+            "interval": self.interval,
+            "timeout": self.timeout,
+            "samples": self.samples,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "last_duration_ms": round(self.last_duration * 1000, 1),
+            "age": round(now - self.last_ok, 2) if self.last_ok is not None else None,
+            "hung": self.is_hung(now),
+            "stale": self.is_stale(now),
+            "last_error": repr(self.last_error) if self.last_error else None,
+        }
+
+
+class CollectorRegistry:
+    """Owns a set of collectors and runs each one on its own thread."""
+
+    def __init__(self):
+        self._collectors = {}
+        self._threads = {}
+        self._stop = threading.Event()
+
+    def register(self, collector):
+        """Add a collector. If the registry is running it starts immediately."""
+        self._collectors[collector.name] = collector
+        if self._threads and collector.name not in self._threads:
+            self._start_one(collector)
+        return collector
+
+    def add(self, name, probe, interval=1.0, timeout=None, default=None):
+        """Shortcut for registering a plain probe function."""
+        return self.register(Collector(name, probe, interval, timeout, default))
+
+    def __contains__(self, name):
+        return name in self._collectors
+
+    def __getitem__(self, name):
+        return self._collectors[name]
+
+    def get(self, name, default=None):
+        """Last good value of a collector, or ``default`` if it has none yet."""
+        c = self._collectors.get(name)
+        if c is None or c.value is None:
+            return default
+        return c.value
+
+    def values(self):
+        return {name: c.value for name, c in self._collectors.items()}
+
+    def status(self):
+        return [c.status() for c in self._collectors.values()]
+
+    def start(self):
+        self._stop.clear()
+        for c in self._collectors.values():
+            if c.name not in self._threads:
+                self._start_one(c)
+
+    def stop(self):
+        self._stop.set()
+        self._threads.clear()
+
+    def _start_one(self, collector):
+        t = threading.Thread(target=self._run, args=(collector,),
+                             name=f"collector-{collector.name}", daemon=True)
+        self._threads[collector.name] = t
+        t.start()
+
+    def _run(self, collector):
+        while not self._stop.is_set():
+            start = time.monotonic()
+            collector.run_once()
+            # Sleep out the rest of the interval; a slow probe just runs late
+            elapsed = time.monotonic() - start
+            self._stop.wait(max(0.0, collector.interval - elapsed))
+
+
+class SourceCascade:
+    """Ordered fallback sources for one reading, with pinning and backoff.
+
+    The first source that returns a value is pinned and used on later reads.
+    A source that fails (raises, returns None or a value rejected by
+    ``accept``) is skipped for an exponentially growing backoff before it is
+    tried again, so permanently broken methods stop costing time on every
+    sample.
+    """
+
+    def __init__(self, sources, base_backoff=5.0, max_backoff=600.0, accept=None):
+        # sources: list of (name, fn) in priority order
+        self.sources = [{"name": name, "fn": fn, "failures": 0, "retry_at": 0.0,
+                         "calls": 0, "total_time": 0.0}
+                        for name, fn in sources]
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.accept = accept
+        self.active = None
+
+    def read(self):
+        """Return the value from the best working source, or None."""
+        now = time.monotonic()
+        for src in self.sources:
+            # Skip sources still backing off, except the pinned one
+            if src["name"] != self.active and src["retry_at"] > now:
+                continue
+
+            start = time.monotonic()
+            try:
+                value = src["fn"]()
+            except Exception:
+                value = None
+            src["calls"] += 1
+            src["total_time"] += time.monotonic() - start
+
+            if value is not None and (self.accept is None or self.accept(value)):
+                src["failures"] = 0
+                src["retry_at"] = 0.0
+                self.active = src["name"]
+                return value
+
+            src["failures"] += 1
+            delay = min(self.max_backoff, self.base_backoff * (2 ** (src["failures"] - 1)))
+            src["retry_at"] = time.monotonic() + delay
+            if self.active == src["name"]:
+                self.active = None
+        return None
+
+    def average_ms(self, name=None):
+        """Average probe time of a source (the active one by default)."""
+        name = name or self.active
+        for src in self.sources:
+            if src["name"] == name and src["calls"]:
+                return src["total_time"] / src["calls"] * 1000
+        return None
+
+    def status(self):
+        now = time.monotonic()
+        return {
+            "active": self.active,
+            "sources": [{
+                "name": src["name"],
+                "calls": src["calls"],
+                "avg_ms": round(src["total_time"] / src["calls"] * 1000, 2) if src["calls"] else None,
+                "failures": src["failures"],
+                "retry_in": round(max(0.0, src["retry_at"] - now), 1),
+            } for src in self.sources],
+        }
+
+
+@dataclass(frozen=True)
+class MetricSnapshot:
+    """All metrics from one sampler tick.
+
+    The sampler publishes a new snapshot by replacing a single reference, so
+    a reader always sees values from the same tick. ``seq`` increases by one
+    per tick; readers compare it to skip redraws when nothing changed.
+    """
+    seq: int = 0
+    timestamp: float = 0.0      # time.monotonic() when the tick was sampled
+    cpu_p: float = 0
+    ram_p: float = 0
+    ram_used: float = 0
+    ram_total: float = 0
+    ram_avail: float = 0        # GB
+    ram_cached: float = 0       # GB
+    gpu_p: float = 0
+    gpu_temp: float = 0
+    disk_p: float = 0
+    cpu_temp: float = 0
+    cpu_freq: float = 0         # GHz, 0 = unknown
+    fan_speeds: tuple = ()      # RPM per fan
+    net_send: float = 0         # Mbps
+    net_recv: float = 0         # Mbps
+    processes: int = 0
+    threads: int = 0
+    uptime: str = "00:00:00"
@@ -0,0 +1,188 @@
+"""Background device inventory with change-driven re-enumeration.
+
+Enumerating devices (wmic/PowerShell on Windows) takes seconds, but the set
+of attached devices rarely changes. ``DeviceInventory`` runs the probes in
+parallel once, keeps the results in memory and then only polls a cheap
+device signature:
+
+    Windows: size of the present-device ID list (cfgmgr32), monitor count,
+             logical drive mask
+    Linux:   directory listings of the sysfs device classes (usb, drm,
+             sound, block, net)
+
+Each probe names the signature keys it depends on; when one of those keys
+changes only those probes run again. Every probe is also re-run after
+``ttl`` seconds as a fallback for changes the signature can't see (e.g. a
+driver update renaming a device). Consumers read ``snapshot()`` and compare
+``version`` to notice updates, so no callbacks cross into the Tk thread.
+"""
+import concurrent.futures
+import ctypes
+import os
+import threading
+import time
+
+import psutil
+
+SYSFS_CLASSES = {
+    "usb": "/sys/bus/usb/devices",
+    "display": "/sys/class/drm",
+    "audio": "/sys/class/sound",
+    "storage": "/sys/block",
+    "net": "/sys/class/net",
+}
+
+CM_GETIDLIST_FILTER_PRESENT = 0x100
+SM_CMONITORS = 80
+
+if os.name == 'nt':
+    try:
+        cfgmgr32 = ctypes.WinDLL("cfgmgr32")
+        _kernel32 = ctypes.windll.kernel32
+        _user32 = ctypes.windll.user32
+    except OSError:
+        cfgmgr32 = _kernel32 = _user32 = None
+else:
+    cfgmgr32 = _kernel32 = _user32 = None
+
+
+def _pnp_list_size():
+    """Length of the present-device ID list; changes when devices come or go."""
+    size = ctypes.c_ulong(0)
+    if cfgmgr32.CM_Get_Device_ID_List_SizeW(ctypes.byref(size), None,
+                                            CM_GETIDLIST_FILTER_PRESENT) != 0:
+        return None
+    return size.value
+
+
+def _listdir(path):
+    try:
+        return tuple(sorted(os.listdir(path)))
+    except OSError:
+        return None
+
+
+def device_signature():
+    """Cheap per-category fingerprint of the attached hardware ({key: value})."""
+    sig = {}
+    if cfgmgr32 is not None:
+        sig["pnp"] = _pnp_list_size()
+        sig["display"] = _user32.GetSystemMetrics(SM_CMONITORS)
+        sig["storage"] = _kernel32.GetLogicalDrives()
+    else:
+        for key, path in SYSFS_CLASSES.items():
+            sig[key] = _listdir(path)
+    try:
+        sig["net"] = tuple(sorted((name, st.isup) for name, st in psutil.net_if_stats().items()))
+    except Exception:
+        pass
+    return sig
+
+
+class DeviceInventory:
+    """Runs device probes in the background and re-runs them on change."""
+
+    def __init__(self, ttl=600.0, poll_interval=2.0, timeout=15.0, max_workers=4,
+                 signature=device_signature):
+        self.ttl = ttl
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.signature = signature
+        self.version = 0            # Bumped whenever a probe result changes
+        self.scans = 0
+        self._probes = {}           # name -> (fn, watched signature keys)
+        self._results = {}
+        self._scanned_at = {}       # name -> monotonic time of the last run
+        self._ready = threading.Event()
+        self._wake = threading.Event()
+        self._force = False
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def add(self, name, fn, watch=(), default=None):
+        """Register probe ``fn`` for ``name``; re-run when any ``watch`` key changes."""
+        self._probes[name] = (fn, tuple(watch))
+        self._results.setdefault(name, default)
+        return self
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="device-inventory",
+                                            daemon=True)
+            self._thread.start()
+        return self
+
+    @property
+    def ready(self):
+        """True once the first full enumeration finished."""
+        return self._ready.is_set()
+
+    def snapshot(self):
+        """(version, {name: result}) as one consistent pair."""
+        with self._lock:
+            return self.version, dict(self._results)
+
+    def refresh(self):
+        """Re-run every probe now (e.g. a Rescan button)."""
+        self._force = True
+        self._wake.set()
+
+    def _run(self):
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers,
+                                                     thread_name_prefix="device-probe")
+        last_sig = self._safe_signature()
+        self._scan(pool, list(self._probes))
+        self._ready.set()
+
+        while True:
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+
+            sig = self._safe_signature()
+            changed = {k for k in set(sig) | set(last_sig) if sig.get(k) != last_sig.get(k)}
+            last_sig = sig
+
+            now = time.monotonic()
+            if self._force:
+                self._force = False
+                due = list(self._probes)
+            else:
+                due = [name for name, (fn, watch) in self._probes.items()
+                       if changed.intersection(watch)
+                       or now - self._scanned_at.get(name, 0) >= self.ttl]
+            if due:
+                self._scan(pool, due)
+
+    def _safe_signature(self):
+        try:
+            return self.signature()
+        except Exception as e:
+            print(f"Device signature error: {e}")
+            return {}
+
+    def _scan(self, pool, names):
+        """Run ``names`` in parallel; keep the previous result for failed probes."""
+        futures = {pool.submit(self._probes[name][0]): name for name in names}
+        results = {}
+        try:
+            for fut in concurrent.futures.as_completed(futures, timeout=self.timeout):
+                name = futures[fut]
+                try:
+                    results[name] = fut.result()
+                except Exception as e:
+                    print(f"Device probe '{name}' failed: {e}")
+        except concurrent.futures.TimeoutError:
+            for fut, name in futures.items():
+                if not fut.done():
+                    print(f"Device probe '{name}' timed out after {self.timeout}s")
+
+        now = time.monotonic()
+        with self._lock:
+            for name in names:
+                self._scanned_at[name] = now
+            changed = {k: v for k, v in results.items() if self._results.get(k) != v}
+            if changed:
+                self._results.update(changed)
+                self.version += 1
+            self.scans += 1
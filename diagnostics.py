@@ -0,0 +1,229 @@
+"""Diagnostics for work on the Tk thread.
+
+``FrameStats`` keeps latency histograms (update_ui per section, widget
+animation callbacks, event-loop lag) and ``EventLoopWatchdog`` measures how
+late ``root.after`` callbacks fire. Both are cheap enough to stay on all the
+time; the numbers are shown in the dashboard's performance overlay and can be
+exported as JSON.
+
+``MainThreadIOGuard`` installs a ``sys.addaudithook`` hook. While the UI
+thread is inside a ``guard.section(...)`` block, any audited blocking call
+(file open, process spawn, socket connect, directory scan) is reported with
+the code location that made it. The guard is only active when debugging is
+switched on (``DASHBOARD_DEBUG=1`` or ``"debug": true`` in
+dashboard_config.json), so normal runs pay nothing beyond one attribute check.
+"""
+import bisect
+import json
+import os
+import sys
+import threading
+import time
+import traceback
+from contextlib import contextmanager
+
+# Audit events that mean the caller is about to block on the OS
+BLOCKING_EVENTS = {
+    "open", "os.listdir", "os.scandir", "os.system", "os.startfile",
+    "subprocess.Popen", "os.posix_spawn", "os.exec", "os.fork",
+    "socket.connect", "socket.getaddrinfo", "socket.gethostbyname",
+    "urllib.Request", "ctypes.dlopen",
+}
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def debug_enabled(config=None):
+    """True if debug checks were requested via the environment or config."""
+    if os.environ.get("DASHBOARD_DEBUG", "").lower() in ("1", "true", "yes"):
+        return True
+    return bool(config and config.get("debug"))
+
+
+class MainThreadIOGuard:
+    """Flags blocking calls made inside guarded UI sections."""
+
+    def __init__(self, enabled=False, raise_on_violation=False):
+        self.enabled = enabled
+        self.raise_on_violation = raise_on_violation
+        self.violations = []        # (section, event, location) in order seen
+        self._seen = set()
+        self._section = None
+        self._thread = None
+        self._in_hook = False
+        self._installed = False
+
+    def install(self):
+        """Register the audit hook (hooks can't be removed, so only in debug)."""
+        if self.enabled and not self._installed:
+            sys.addaudithook(self._hook)
+            self._installed = True
+        return self
+
+    @contextmanager
+    def section(self, name):
+        """Mark the calling (UI) thread as inside a no-I/O section."""
+        if not self.enabled:
+            yield
+            return
+        self._thread = threading.get_ident()
+        self._section = name
+        try:
+            yield
+        finally:
+            self._section = None
+
+    def _hook(self, event, args):
+        if self._section is None or self._in_hook or event not in BLOCKING_EVENTS:
+            return
+        if threading.get_ident() != self._thread:
+            return
+        self._in_hook = True
+        try:
+            # lookup_lines=False: reading source lines would itself call open()
+            stack = traceback.StackSummary.extract(
+                traceback.walk_stack(sys._getframe(1)), lookup_lines=False)
+            # Report the innermost frame in the app, not inside psutil/stdlib
+            frames = [f for f in stack if f.filename != __file__]
+            frame = next((f for f in frames if f.filename.startswith(APP_DIR)), None) or \
+                (frames[0] if frames else None)
+            location = f"{os.path.basename(frame.filename)}:{frame.lineno} in {frame.name}" if frame else "?"
+            key = (self._section, event, location)
+            if key not in self._seen:
+                self._seen.add(key)
+                self.violations.append(key)
+                print(f"[debug] blocking call on UI thread in {self._section}: {event} at {location}")
+        finally:
+            self._in_hook = False
+        if self.raise_on_violation:
+            raise RuntimeError(f"blocking call '{event}' on the UI thread in {self._section}")
+
+
+class LatencyHistogram:
+    """Fixed log-spaced buckets (0.01 ms to ~13 s), O(1) memory per metric."""
+
+    BOUNDS = tuple(round(0.01 * 1.25 ** i, 4) for i in range(64))
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BOUNDS) + 1)  # Last bucket: overflow
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, ms):
+        self.counts[bisect.bisect_left(self.BOUNDS, ms)] += 1
+        self.count += 1
+        self.total += ms
+        if ms > self.max:
+            self.max = ms
+
+    def percentile(self, p):
+        """Upper bound of the bucket holding the p-th percentile (ms)."""
+        if not self.count:
+            return 0.0
+        rank = self.count * p / 100.0
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return self.BOUNDS[i] if i < len(self.BOUNDS) else self.max
+        return self.max
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count, 3) if self.count else 0.0,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "max_ms": round(self.max, 3),
+        }
+
+
+class FrameStats:
+    """Named latency histograms for main-thread work."""
+
+    def __init__(self):
+        self.histograms = {}
+        self.started = time.time()
+        self._lock = threading.Lock()
+
+    def record(self, name, ms):
+        with self._lock:
+            h = self.histograms.get(name)
+            if h is None:
+                h = self.histograms[name] = LatencyHistogram()
+            h.record(ms)
+
+    @contextmanager
+    def timed(self, name):
+        """Record how long the wrapped block takes under ``name``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - start) * 1000)
+
+    def summary(self):
+        with self._lock:
+            return {name: h.summary() for name, h in sorted(self.histograms.items())}
+
+    def reset(self):
+        with self._lock:
+            self.histograms = {}
+            self.started = time.time()
+
+    def export(self, path):
+        """Write summaries plus raw bucket counts as JSON; returns the path."""
+        with self._lock:
+            data = {
+                "started": self.started,
+                "exported": time.time(),
+                "bucket_bounds_ms": list(LatencyHistogram.BOUNDS),
+                "metrics": {name: dict(h.summary(), buckets=list(h.counts))
+                            for name, h in sorted(self.histograms.items())},
+            }
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+        return path
+
+
+class EventLoopWatchdog:
+    """Heartbeat on ``root.after`` that records how late each beat fires.
+
+    Lag is the time between when the callback was due and when Tk actually
+    ran it, i.e. how long the event loop was busy with other work.
+    """
+
+    def __init__(self, root, stats, interval_ms=50, stall_ms=100):
+        self.root = root
+        self.stats = stats
+        self.interval_ms = interval_ms
+        self.stall_ms = stall_ms
+        self.stalls = 0
+        self.worst_ms = 0.0
+        self._due = None
+        self._running = False
+
+    def start(self):
+        if not self._running:
+            self._running = True
+            self._schedule()
+        return self
+
+    def stop(self):
+        self._running = False
+
+    def _schedule(self):
+        self._due = time.perf_counter() + self.interval_ms / 1000.0
+        self.root.after(self.interval_ms, self._beat)
+
+    def _beat(self):
+        if not self._running:
+            return
+        lag = max(0.0, (time.perf_counter() - self._due) * 1000)
+        self.stats.record("event_loop_lag", lag)
+        if lag > self.stall_ms:
+            self.stalls += 1
+        self.worst_ms = max(self.worst_ms, lag)
+        self._schedule()
@@ -0,0 +1,72 @@
+"""RAM trend forecasting for predictive auto-optimization.
+
+``RamForecaster`` fits a least-squares line to the last ``window_s`` seconds
+of RAM usage and extrapolates it to the RAM threshold. The fit gives:
+
+    slope       percentage points per second
+    eta         seconds until the threshold is reached (None when flat,
+                falling, already above it or not confident)
+    confidence  R^2 of the fit, scaled down while the window is still
+                filling, so a noisy or brand-new trend never triggers
+
+The dashboard feeds ``eta`` to the policy engine as the ``ram_eta`` metric;
+the ``ram_forecast`` rule fires once it drops below the lead-time budget,
+i.e. before the usage threshold is actually crossed.
+"""
+import time
+from collections import deque, namedtuple
+
+Forecast = namedtuple("Forecast", "slope eta confidence level")
+
+FLAT = Forecast(0.0, None, 0.0, None)
+
+
+class RamForecaster:
+    """Rolling linear fit over recent RAM samples."""
+
+    def __init__(self, window_s=60.0, min_confidence=0.5, min_slope=0.005, max_samples=240):
+        self.window_s = window_s
+        self.min_confidence = min_confidence
+        self.min_slope = min_slope          # %/s; slower trends count as flat
+        self.samples = deque(maxlen=max_samples)    # (monotonic time, percent)
+
+    def update(self, value, now=None):
+        now = time.monotonic() if now is None else now
+        self.samples.append((now, value))
+        while now - self.samples[0][0] > self.window_s:
+            self.samples.popleft()
+
+    def fit(self):
+        """(slope, intercept at the newest sample, R^2) or None with too few points."""
+        n = len(self.samples)
+        if n < 5:
+            return None
+        t0 = self.samples[-1][0]
+        mean_t = sum(t for t, _ in self.samples) / n - t0
+        mean_v = sum(v for _, v in self.samples) / n
+        stt = stv = svv = 0.0
+        for t, v in self.samples:
+            dt = t - t0 - mean_t
+            dv = v - mean_v
+            stt += dt * dt
+            stv += dt * dv
+            svv += dv * dv
+        if stt <= 0:
+            return None
+        slope = stv / stt
+        r2 = (stv * stv) / (stt * svv) if svv > 0 else 0.0
+        return slope, mean_v - slope * mean_t, r2
+
+    def forecast(self, threshold):
+        """Forecast for reaching ``threshold`` percent."""
+        fit = self.fit()
+        if fit is None:
+            return FLAT
+        slope, level, r2 = fit
+        span = self.samples[-1][0] - self.samples[0][0]
+        confidence = r2 * min(1.0, span / self.window_s)
+
+        eta = None
+        if slope >= self.min_slope and level < threshold and confidence >= self.min_confidence:
+            eta = (threshold - level) / slope
+        return Forecast(slope, eta, confidence, level)
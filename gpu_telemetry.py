@@ -0,0 +1,217 @@
+"""Streaming NVIDIA GPU telemetry shared by every consumer in the process.
+
+Instead of running ``nvidia-smi`` once per field per GPU per tick, a single
+``GpuTelemetry`` reader either polls NVML (when ``pynvml`` is installed) or
+keeps one ``nvidia-smi --query-gpu=... -lms N`` child running and parses its
+CSV stream. Consumers read the latest values with ``gpus()`` / ``gpu(i)``
+or register a callback with ``subscribe()``.
+
+Set ``NVIDIA_SMI`` to point the reader at another executable (for example
+``benchmarks/fake_nvidia_smi.py``) for testing without a GPU.
+"""
+import atexit
+import os
+import shlex
+import subprocess
+import threading
+import time
+
+try:
+    import pynvml
+    HAS_NVML = True
+except ImportError:
+    HAS_NVML = False
+
+QUERY_FIELDS = ("index", "name", "utilization.gpu", "memory.used",
+                "memory.total", "temperature.gpu")
+
+
+def parse_csv_line(line):
+    """Parse one ``--format=csv,noheader,nounits`` line into a GPU dict."""
+    parts = [p.strip() for p in line.split(',')]
+    if len(parts) != len(QUERY_FIELDS) or not parts[0].isdigit():
+        return None
+
+    def num(v):
+        try:
+            return float(v)
+        except ValueError:
+            return None  # "[N/A]", "[Not Supported]"
+
+    return {
+        "index": int(parts[0]),
+        "name": parts[1],
+        "util": num(parts[2]),
+        "mem_used": num(parts[3]),   # MiB
+        "mem_total": num(parts[4]),  # MiB
+        "temp": num(parts[5]),       # °C
+    }
+
+
+class GpuTelemetry:
+    """Single per-process GPU reader (NVML or one streaming nvidia-smi)."""
+
+    def __init__(self, interval_ms=1000, command=None, use_nvml=True):
+        self.interval_ms = interval_ms
+        self.command = command or shlex.split(os.environ.get("NVIDIA_SMI", "nvidia-smi"))
+        self.use_nvml = use_nvml and HAS_NVML
+        self.source = None          # "nvml" / "nvidia-smi" once running
+        self.available = None       # None = unknown yet, False = no NVIDIA GPU
+        self.spawns = 0
+        self.updated = None         # monotonic time of the last parsed sample
+
+        self._gpus = {}
+        self._subscribers = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._proc = None
+        self._thread = None
+
+    # --- Consumer API ---
+    def start(self):
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="gpu-telemetry", daemon=True)
+            self._thread.start()
+            atexit.register(self.stop)
+        return self
+
+    def stop(self):
+        self._stop.set()
+        proc = self._proc
+        if proc is not None and proc.poll() is None:
+            try:
+                proc.terminate()
+            except OSError:
+                pass
+
+    def gpus(self):
+        """Latest sample for every GPU, ordered by index."""
+        with self._lock:
+            return [dict(g) for _, g in sorted(self._gpus.items())]
+
+    def gpu(self, index):
+        with self._lock:
+            g = self._gpus.get(index)
+            return dict(g) if g else None
+
+    def is_stale(self, max_age=None):
+        if self.updated is None:
+            return True
+        max_age = max_age if max_age is not None else 3 * self.interval_ms / 1000.0
+        return (time.monotonic() - self.updated) > max_age
+
+    def subscribe(self, callback):
+        """Call ``callback(gpus)`` on the reader thread after every update."""
+        self._subscribers.append(callback)
+
+    # --- Reader ---
+    def _publish(self, samples):
+        now = time.monotonic()
+        with self._lock:
+            for g in samples:
+                g["updated"] = now
+                self._gpus[g["index"]] = g
+            self.updated = now
+        self.available = True
+        if self._subscribers:
+            snapshot = self.gpus()
+            for cb in list(self._subscribers):
+                try:
+                    cb(snapshot)
+                except Exception as e:
+                    print(f"GPU subscriber error: {e}")
+
+    def _run(self):
+        if self.use_nvml:
+            try:
+                self._run_nvml()
+                return
+            except Exception:
+                pass  # Fall back to nvidia-smi
+        self._run_smi()
+
+    def _run_nvml(self):
+        pynvml.nvmlInit()
+        self.source = "nvml"
+        try:
+            handles = [pynvml.nvmlDeviceGetHandleByIndex(i)
+                       for i in range(pynvml.nvmlDeviceGetCount())]
+            names = []
+            for h in handles:
+                n = pynvml.nvmlDeviceGetName(h)
+                names.append(n.decode() if isinstance(n, bytes) else n)
+
+            while not self._stop.is_set():
+                samples = []
+                for i, h in enumerate(handles):
+                    util = pynvml.nvmlDeviceGetUtilizationRates(h)
+                    mem = pynvml.nvmlDeviceGetMemoryInfo(h)
+                    temp = pynvml.nvmlDeviceGetTemperature(h, pynvml.NVML_TEMPERATURE_GPU)
+                    samples.append({
+                        "index": i, "name": names[i], "util": float(util.gpu),
+                        "mem_used": mem.used / (1024**2), "mem_total": mem.total / (1024**2),
+                        "temp": float(temp),
+                    })
+                self._publish(samples)
+                self._stop.wait(self.interval_ms / 1000.0)
+        finally:
+            try: pynvml.nvmlShutdown()
+            except Exception: pass
+
+    def _run_smi(self):
+        self.source = "nvidia-smi"
+        argv = self.command + [f"--query-gpu={','.join(QUERY_FIELDS)}",
+                               "--format=csv,noheader,nounits",
+                               "-lms", str(self.interval_ms)]
+        flags = subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+        backoff = 1.0
+
+        while not self._stop.is_set():
+            try:
+                self._proc = subprocess.Popen(argv, stdout=subprocess.PIPE,
+                                              stderr=subprocess.DEVNULL, text=True,
+                                              bufsize=1, creationflags=flags)
+            except OSError:
+                # No nvidia-smi on this machine: nothing to stream
+                self.available = False
+                return
+            self.spawns += 1
+
+            # nvidia-smi prints one line per GPU per interval
+            got_samples = False
+            for line in self._proc.stdout:
+                g = parse_csv_line(line)
+                if g is not None:
+                    self._publish([g])
+                    got_samples = True
+                if self._stop.is_set():
+                    break
+            if got_samples:
+                backoff = 1.0
+
+            try:
+                self._proc.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                self._proc.kill()
+            if self.updated is None and self._proc.returncode not in (0, None):
+                # Exited without a single sample (no driver / no GPU)
+                self.available = False
+                return
+
+            # Child died (driver reset, etc.): restart with backoff
+            self._stop.wait(backoff)
+            backoff = min(backoff * 2, 60.0)
+
+
+_shared = None
+_shared_lock = threading.Lock()
+
+
+def get_gpu_telemetry(interval_ms=1000):
+    """Process-wide GPU reader, started on first use."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = GpuTelemetry(interval_ms=interval_ms).start()
+        return _shared
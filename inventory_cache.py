@@ -0,0 +1,107 @@
+"""Concurrent hardware inventory probing with an on-disk cache.
+
+Static hardware details (GPU drivers, RAM slots, CPU caches, disks, battery
+capacity) come from slow PowerShell/wmic/powercfg calls. ``HardwareInventory``
+runs the probes on a worker pool with an overall deadline and reports each
+result as it completes. Results are saved to a JSON file keyed by boot time
+and a hardware fingerprint, so a warm start (same boot, same machine) skips
+the probes entirely.
+"""
+import concurrent.futures
+import hashlib
+import json
+import os
+import platform
+import threading
+
+import psutil
+
+CACHE_VERSION = 1
+
+
+def hardware_fingerprint():
+    """Stable hash of the basic machine identity (changes if hardware is swapped)."""
+    parts = [
+        platform.node(), platform.machine(), platform.processor(),
+        str(psutil.cpu_count(logical=False)), str(psutil.cpu_count(logical=True)),
+        str(psutil.virtual_memory().total),
+    ]
+    return hashlib.sha1("|".join(parts).encode()).hexdigest()
+
+
+class HardwareInventory:
+    """Runs named probe functions in parallel and caches their results."""
+
+    def __init__(self, path="hardware_inventory.json", timeout=20.0, max_workers=5):
+        self.path = path
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.boot_time = int(psutil.boot_time())
+        self.fingerprint = hardware_fingerprint()
+        self.results = {}
+
+    def load(self):
+        """Cached results for this boot and machine ({} if missing or stale)."""
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if (data.get("version") != CACHE_VERSION or data.get("boot_time") != self.boot_time
+                or data.get("fingerprint") != self.fingerprint):
+            return {}
+        self.results = dict(data.get("results", {}))
+        return dict(self.results)
+
+    def save(self):
+        data = {
+            "version": CACHE_VERSION,
+            "boot_time": self.boot_time,
+            "fingerprint": self.fingerprint,
+            "results": self.results,
+        }
+        try:
+            tmp = self.path + ".tmp"
+            with open(tmp, 'w') as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp, self.path)
+        except (OSError, TypeError) as e:
+            print(f"Inventory cache save error: {e}")
+
+    def probe(self, probes, on_result):
+        """Run ``probes`` ({name: fn}) in the background.
+
+        ``on_result(name, value)`` is called from a worker thread as each
+        probe finishes. Probes still running at the deadline are reported
+        with ``value=None`` and are not cached, so they run again next start.
+        """
+        t = threading.Thread(target=self._run, args=(dict(probes), on_result),
+                             name="inventory-probe", daemon=True)
+        t.start()
+        return t
+
+    def _run(self, probes, on_result):
+        if not probes:
+            return
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers,
+                                                     thread_name_prefix="inventory")
+        futures = {pool.submit(fn): name for name, fn in probes.items()}
+        try:
+            for fut in concurrent.futures.as_completed(futures, timeout=self.timeout):
+                name = futures[fut]
+                try:
+                    value = fut.result()
+                except Exception as e:
+                    print(f"Inventory probe '{name}' failed: {e}")
+                    on_result(name, None)
+                    continue
+                self.results[name] = value
+                on_result(name, value)
+        except concurrent.futures.TimeoutError:
+            for fut, name in futures.items():
+                if not fut.done():
+                    print(f"Inventory probe '{name}' timed out after {self.timeout}s")
+                    on_result(name, None)
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+        self.save()
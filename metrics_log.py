@@ -0,0 +1,210 @@
+"""Buffered CSV logging on a writer thread.
+
+``CsvLogger.log(row)`` only puts the row on a bounded queue, so the sampling
+thread never waits for the disk. A writer thread keeps the file open and
+writes rows in batches, either when ``batch_size`` rows are queued or
+``flush_interval`` seconds after the first row of a batch. If the queue is
+full (disk stalled) new rows are dropped and counted in ``dropped``.
+
+The file is rotated when it reaches ``max_bytes`` or, with ``rotate_daily``,
+on the first write of a new day. The rotated file is renamed to
+``<name>-YYYYmmdd-HHMMSS.csv`` and only the newest ``backups`` are kept.
+A file left over with another header (a layout from an older version of the
+apps) is moved to ``<name>-legacy.csv`` instead, which is never pruned, so
+its history stays readable (see log_reader.py).
+
+``durability`` picks what happens after each batch:
+
+    "lazy"   leave it in Python's buffer (flushed on rotation/close)
+    "flush"  flush to the OS, so readers see it and a crash of this
+             process loses nothing (default)
+    "fsync"  flush and fsync, so a power loss loses nothing either
+"""
+import csv
+import glob
+import os
+import queue
+import threading
+import time
+from datetime import date, datetime
+
+DURABILITY_MODES = ("lazy", "flush", "fsync")
+
+
+class CsvLogger:
+    """Appends rows to a rotating CSV file from a background thread."""
+
+    def __init__(self, path, header, batch_size=64, flush_interval=5.0, max_queue=10000,
+                 max_bytes=10 * 1024 * 1024, rotate_daily=True, backups=7, durability="flush"):
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f"durability must be one of {DURABILITY_MODES}")
+        self.path = path
+        self.header = list(header)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.rotate_daily = rotate_daily
+        self.backups = backups
+        self.durability = durability
+        self.written = 0
+        self.dropped = 0
+        self.batches = 0
+        self.rotations = 0
+
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._file = None
+        self._writer = None
+        self._day = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="csv-logger", daemon=True)
+        self._thread.start()
+
+    def log(self, row):
+        """Queue one row; never blocks. Returns False if the row was dropped."""
+        if self._closed:
+            return False
+        try:
+            self._queue.put_nowait(row)
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def flush(self, timeout=1.0):
+        """Write and flush everything queued so far (e.g. before reading the file)."""
+        if self._closed:
+            return False
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def close(self, timeout=5.0):
+        """Write what's queued, flush per ``durability`` and stop the writer."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def files(self):
+        """Rotated files oldest first, then the current file."""
+        root, ext = os.path.splitext(self.path)
+        files = sorted(glob.glob(f"{glob.escape(root)}-*{ext}"), key=_age_key)
+        if os.path.exists(self.path):
+            files.append(self.path)
+        return files
+
+    # --- Writer thread ---
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            batch, events, stop = [], [], False
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if item is None:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    events.append(item)
+                else:
+                    batch.append(item)
+                if stop or events or len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+
+            try:
+                if batch:
+                    self._write(batch)
+                if self._file is not None and (stop or events or self.durability != "lazy"):
+                    self._sync()
+            except Exception as e:
+                print(f"CSV log error: {e}")
+                self._close_file()
+            for event in events:
+                event.set()
+            if stop:
+                self._close_file()
+                return
+
+    def _write(self, rows):
+        if self._file is None or self._should_rotate():
+            self._open()
+        self._writer.writerows(rows)
+        self.written += len(rows)
+        self.batches += 1
+
+    def _sync(self):
+        self._file.flush()
+        if self.durability == "fsync":
+            os.fsync(self._file.fileno())
+
+    def _should_rotate(self):
+        if self.rotate_daily and date.today() != self._day:
+            return True
+        return self.max_bytes and self._file.tell() >= self.max_bytes
+
+    def _open(self):
+        if self._file is not None:
+            self._close_file()
+            self._rotate()
+        elif os.path.exists(self.path):
+            # Left over from an earlier run: rotate it if it's from another day or
+            # full; keep it aside if it was written with another layout (one header per file)
+            st = os.stat(self.path)
+            if st.st_size and self._file_header() != self.header:
+                self._rotate(legacy=True)
+            elif (self.rotate_daily and date.fromtimestamp(st.st_mtime) != date.today()) or \
+                    (self.max_bytes and st.st_size >= self.max_bytes):
+                self._rotate()
+
+        new = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+        self._file = open(self.path, mode='a', newline='')
+        self._writer = csv.writer(self._file)
+        self._day = date.today()
+        if new:
+            self._writer.writerow(self.header)
+
+    def _file_header(self):
+        with open(self.path, 'r', newline='') as f:
+            return next(csv.reader([f.readline()]), [])
+
+    def _rotate(self, legacy=False):
+        root, ext = os.path.splitext(self.path)
+        stamp = "legacy" if legacy else datetime.now().strftime("%Y%m%d-%H%M%S")
+        target, n = f"{root}-{stamp}{ext}", 1
+        while os.path.exists(target):
+            target, n = f"{root}-{stamp}-{n}{ext}", n + 1
+        os.replace(self.path, target)
+        self.rotations += 1
+
+        # Only rotated files (the current one was just moved), minus the legacy ones
+        old = [f for f in self.files() if not f.startswith(f"{root}-legacy")]
+        for stale in old[:max(0, len(old) - self.backups)]:
+            try:
+                os.remove(stale)
+            except OSError:
+                pass
+
+    def _close_file(self):
+        if self._file is not None:
+            try:
+                self._sync()
+                self._file.close()
+            except Exception:
+                pass
+            self._file = self._writer = None
+
+
+def _age_key(path):
+    """Oldest first; same-second collisions (``-1``, ``-2``...) sort after the plain name."""
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        mtime = 0.0
+    return mtime, len(path), path
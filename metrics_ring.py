@@ -0,0 +1,221 @@
+"""Memory-mapped ring file of fixed-size metric records.
+
+An alternative to the CSV log for high-rate sampling. The file is a small
+header followed by ``capacity`` records; each record is a float64 Unix
+timestamp plus one float32 per field, so an append is a single
+``struct.pack_into`` into the mapping and reading N rows never parses text.
+When the ring is full the oldest records are overwritten.
+
+Layout (little-endian)::
+
+    0   magic "SMRING1\\0"
+    8   uint32 version, uint32 record size, uint32 capacity, uint32 field count
+    24  uint64 records written so far (the only header field that changes)
+    32  field names, 32 bytes each, NUL-padded
+    ..  records, starting at a multiple of 8
+
+The writer stores a record and only then bumps the counter, and never
+touches the slot of the oldest record it still reports, so another process
+can tail the file without any lock: read the counter, copy, then re-read the
+counter and drop whatever was overwritten meanwhile (``read``/``since`` do
+this). ``segments()`` exposes the records zero-copy as ``memoryview`` slices,
+or numpy structured arrays when numpy is installed.
+"""
+import mmap
+import os
+import struct
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+MAGIC = b"SMRING1\0"
+VERSION = 1
+NAME_SIZE = 32
+_HEADER = struct.Struct("<8sIIII")
+_COUNT = struct.Struct("<Q")
+_COUNT_OFFSET = 24
+
+
+class MetricsRing:
+    """Fixed-width ring of (timestamp, *fields) records in a mapped file."""
+
+    def __init__(self, path, fields=None, capacity=86400, readonly=False):
+        """Open ``path``; a writer (``readonly=False``) creates it from ``fields``.
+
+        Raises ValueError if an existing file isn't a ring or has other fields.
+        """
+        self.path = path
+        self.readonly = readonly
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        if not exists:
+            if readonly or not fields:
+                raise ValueError(f"{path} does not exist")
+            self._create(path, list(fields), capacity)
+
+        self._file = open(path, "rb" if readonly else "r+b")
+        try:
+            access = mmap.ACCESS_READ if readonly else mmap.ACCESS_WRITE
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=access)
+            self._load_header()
+        except Exception:
+            self._file.close()
+            raise
+        if fields and list(fields) != self.fields:
+            self.close()
+            raise ValueError(f"{path} has fields {self.fields}, expected {list(fields)}")
+
+    @staticmethod
+    def _create(path, fields, capacity):
+        for name in fields:
+            if len(name.encode()) >= NAME_SIZE:
+                raise ValueError(f"field name too long: {name}")
+        record = _record_struct(len(fields))
+        data_offset = _data_offset(len(fields))
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, record.size, capacity, len(fields)))
+            f.write(_COUNT.pack(0))
+            for name in fields:
+                f.write(name.encode().ljust(NAME_SIZE, b"\0"))
+            f.truncate(data_offset + record.size * capacity)
+
+    def _load_header(self):
+        magic, version, record_size, capacity, n_fields = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{self.path} is not a metrics ring file")
+        self.fields = [
+            bytes(self._mm[32 + i * NAME_SIZE:32 + (i + 1) * NAME_SIZE]).rstrip(b"\0").decode()
+            for i in range(n_fields)
+        ]
+        self.capacity = capacity
+        self._record = _record_struct(n_fields)
+        if self._record.size != record_size:
+            raise ValueError(f"{self.path} has an unexpected record size")
+        self._data = _data_offset(n_fields)
+        if len(self._mm) < self._data + record_size * capacity:
+            raise ValueError(f"{self.path} is truncated")
+
+    # --- Writing ---
+
+    def append(self, timestamp, values):
+        """Store one record: ``values`` in field order (NaN for missing)."""
+        count = self.count
+        self._record.pack_into(self._mm, self._offset(count), timestamp, *values)
+        _COUNT.pack_into(self._mm, _COUNT_OFFSET, count + 1)
+
+    # --- Reading ---
+
+    @property
+    def count(self):
+        """Records written since the file was created (including overwritten ones)."""
+        return _COUNT.unpack_from(self._mm, _COUNT_OFFSET)[0]
+
+    def __len__(self):
+        return min(self.count, self.capacity - 1)
+
+    def _offset(self, seq):
+        return self._data + (seq % self.capacity) * self._record.size
+
+    def _first(self, count):
+        # The oldest slot may be mid-overwrite by the next append
+        return max(0, count - self.capacity + 1)
+
+    def read(self, start, stop):
+        """Records with sequence numbers in [start, stop) that are still readable."""
+        count = self.count
+        start, stop = max(start, self._first(count)), min(stop, count)
+        unpack = self._record.unpack_from
+        rows = [unpack(self._mm, self._offset(seq)) for seq in range(start, stop)]
+        # Drop anything the writer overwrote while we were copying
+        lost = self._first(self.count) - start
+        return rows[lost:] if lost > 0 else rows
+
+    def last(self, n):
+        """The newest ``n`` records, oldest first."""
+        count = self.count
+        return self.read(count - n, count)
+
+    def since(self, seq):
+        """(records from ``seq`` on, next seq): poll with the returned seq to tail the file live."""
+        count = self.count
+        return self.read(seq, count), count
+
+    def timestamp(self, seq):
+        return struct.unpack_from("<d", self._mm, self._offset(seq))[0]
+
+    def time_range(self, t0, t1):
+        """Records with t0 <= timestamp <= t1 (binary search, then one copy)."""
+        count = self.count
+        lo, hi = self._first(count), count
+        start = self._bisect(lo, hi, t0, inclusive=False)
+        stop = self._bisect(start, hi, t1, inclusive=True)
+        return self.read(start, stop)
+
+    def _bisect(self, lo, hi, t, inclusive):
+        # First seq whose timestamp is > t (inclusive) or >= t
+        while lo < hi:
+            mid = (lo + hi) // 2
+            ts = self.timestamp(mid)
+            if ts < t or (inclusive and ts == t):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def segments(self):
+        """Zero-copy views of the readable records in time order (at most two).
+
+        numpy structured arrays if numpy is installed, otherwise memoryviews
+        of the raw records. Views are not protected against concurrent
+        overwrites; use ``read`` when the writer may wrap meanwhile.
+        """
+        count = self.count
+        first = self._first(count)
+        if first == count:
+            return []
+        a, b = first % self.capacity, count % self.capacity
+        slots = [(a, b)] if a < b else [(a, self.capacity), (0, b)]
+        size = self._record.size
+        if HAS_NUMPY:
+            dtype = self.dtype()
+            return [np.frombuffer(self._mm, dtype=dtype, count=end - begin,
+                                  offset=self._data + begin * size)
+                    for begin, end in slots if end > begin]
+        view = memoryview(self._mm)
+        return [view[self._data + begin * size:self._data + end * size]
+                for begin, end in slots if end > begin]
+
+    def dtype(self):
+        """numpy dtype of one record (``timestamp`` plus the field names)."""
+        return np.dtype({
+            "names": ["timestamp"] + self.fields,
+            "formats": ["<f8"] + ["<f4"] * len(self.fields),
+            "offsets": [0] + [8 + 4 * i for i in range(len(self.fields))],
+            "itemsize": self._record.size,
+        })
+
+    def close(self):
+        try:
+            self._mm.close()
+        except (BufferError, ValueError):
+            pass    # numpy views still alive; the mapping goes with them
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _record_struct(n_fields):
+    # Padded to 8 bytes so every timestamp stays aligned
+    size = 8 + 4 * n_fields
+    return struct.Struct("<d" + "f" * n_fields + "x" * (-size % 8))
+
+
+def _data_offset(n_fields):
+    end = 32 + NAME_SIZE * n_fields
+    return end + (-end % 8)
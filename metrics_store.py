@@ -0,0 +1,304 @@
+"""SQLite time-series store with rollups and retention.
+
+Samples are queued by ``add()`` and written by a background thread in one
+transaction per batch (WAL mode, ``synchronous=NORMAL``), so callers never
+wait for the disk. After each batch the writer rolls completed minutes and
+hours up from the raw samples. Both apps write the same file, each with its
+own queue, so a bucket only counts as complete ``settle`` seconds after it
+ended: by then the other writer has flushed its samples for it too.
+
+    raw   one row per sample              kept 2 days
+    1m    min / max / avg / p95 per field  kept 30 days
+    1h    min / max / avg / p95 per field  kept 1 year
+
+Every table is keyed by timestamp, so a range query is an index range scan.
+``query()`` picks the finest tier that answers the requested span in at
+most ``max_points`` rows. Columns are added on demand, so the dashboard and
+the RAM cleaner can log different field sets into the same file; fields an
+app doesn't sample stay NULL.
+"""
+import math
+import queue
+import sqlite3
+import threading
+import time
+
+DAY = 86400
+
+# name -> (bucket seconds, default retention seconds); raw has no bucket
+TIERS = {
+    "raw": (None, 2 * DAY),
+    "1m": (60, 30 * DAY),
+    "1h": (3600, 365 * DAY),
+}
+STATS = ("min", "max", "avg", "p95")
+
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(p / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class MetricsStore:
+    """Batched writer and tier-aware reader for one metrics database."""
+
+    def __init__(self, path="system_metrics.db", fields=(), sample_interval=1.0,
+                 batch_size=60, flush_interval=5.0, max_queue=10000, retention=None, settle=None):
+        self.path = path
+        self.fields = list(fields)
+        self.sample_interval = sample_interval
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        # A full flush interval of lateness from any writer, plus slack for a slow commit
+        self.settle = 2 * flush_interval + 5 if settle is None else settle
+        self.retention = {name: keep for name, (_, keep) in TIERS.items()}
+        self.retention.update(retention or {})
+        # Hourly rollups are computed from raw samples, which must outlive an hour
+        self.retention["raw"] = max(self.retention["raw"], 2 * 3600)
+        self.written = 0
+        self.dropped = 0
+
+        self._last_add = 0.0
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._local = threading.local()
+        self._columns = set()
+        self._closed = False
+
+        conn = self._connect()
+        self._init_schema(conn)
+        conn.close()
+        self._thread = threading.Thread(target=self._run, name="metrics-store", daemon=True)
+        self._thread.start()
+
+    # --- Connections / schema ---
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _reader(self):
+        # One connection per reading thread; WAL lets them run beside the writer
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    def _init_schema(self, conn):
+        with conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS samples_raw (ts REAL PRIMARY KEY)")
+            for tier in ("1m", "1h"):
+                conn.execute(f"CREATE TABLE IF NOT EXISTS samples_{tier} "
+                             "(ts INTEGER PRIMARY KEY, n INTEGER)")
+            conn.execute("CREATE TABLE IF NOT EXISTS rollup_state "
+                         "(tier TEXT PRIMARY KEY, done_until INTEGER)")
+        self._ensure_columns(conn, self.fields)
+
+    def _ensure_columns(self, conn, fields):
+        if any(f not in self._columns for f in fields):
+            # Reload first: the other app may already have added them
+            self._columns.update(self._known_fields(conn))
+        missing = [f for f in fields if f not in self._columns]
+        if not missing:
+            return
+        with conn:
+            for field in missing:
+                if not field.isidentifier():
+                    raise ValueError(f"invalid field name: {field}")
+                conn.execute(f"ALTER TABLE samples_raw ADD COLUMN {field} REAL")
+                for tier in ("1m", "1h"):
+                    existing = {row[1] for row in conn.execute(f"PRAGMA table_info(samples_{tier})")}
+                    for stat in STATS:
+                        if f"{field}_{stat}" not in existing:
+                            conn.execute(f"ALTER TABLE samples_{tier} ADD COLUMN {field}_{stat} REAL")
+                self._columns.add(field)
+
+    def _known_fields(self, conn):
+        return [row[1] for row in conn.execute("PRAGMA table_info(samples_raw)") if row[1] != "ts"]
+
+    # --- Writing ---
+
+    def add(self, timestamp, values):
+        """Queue one sample ({field: value}); samples closer than ``sample_interval`` are skipped."""
+        if self._closed or timestamp - self._last_add < self.sample_interval:
+            return False
+        self._last_add = timestamp
+        try:
+            self._queue.put_nowait((timestamp, values))
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def close(self, timeout=5.0):
+        """Write what's queued and stop the writer."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _run(self):
+        conn = self._connect()
+        latest = conn.execute("SELECT MAX(ts) FROM samples_raw").fetchone()[0]
+        if latest is not None:
+            self._roll_up(conn, latest)
+        stop = False
+        while not stop:
+            batch = []
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            try:
+                if batch:
+                    self._insert(conn, batch)
+                    self._roll_up(conn, batch[-1][0])
+            except sqlite3.Error as e:
+                print(f"Metrics store error: {e}")
+        conn.close()
+
+    def _insert(self, conn, batch):
+        fields = sorted({f for _, values in batch for f in values})
+        self._ensure_columns(conn, fields)
+        columns = ", ".join(["ts"] + fields)
+        marks = ", ".join("?" * (len(fields) + 1))
+        with conn:
+            conn.executemany(f"INSERT OR REPLACE INTO samples_raw ({columns}) VALUES ({marks})",
+                             [(ts, *(values.get(f) for f in fields)) for ts, values in batch])
+        self.written += len(batch)
+
+    # --- Rollups / retention ---
+
+    def _roll_up(self, conn, latest):
+        """Aggregate every bucket that ended ``settle`` s before ``latest``, then apply retention."""
+        fields = self._known_fields(conn)
+        rolled_hour = False
+        for tier in ("1m", "1h"):
+            bucket = TIERS[tier][0]
+            row = conn.execute("SELECT done_until FROM rollup_state WHERE tier = ?", (tier,)).fetchone()
+            end = int((latest - self.settle) // bucket * bucket)
+            if row is None:
+                first = conn.execute("SELECT MIN(ts) FROM samples_raw").fetchone()[0]
+                if first is None:
+                    continue
+                start = int(first // bucket * bucket)
+            else:
+                start = row[0]
+            if start >= end:
+                continue
+            self._aggregate(conn, tier, bucket, fields, start, end)
+            rolled_hour = rolled_hour or tier == "1h"
+        if rolled_hour:
+            self._apply_retention(conn, latest)
+
+    def _aggregate(self, conn, tier, bucket, fields, start, end):
+        cols = ", ".join(["ts"] + fields)
+        buckets = {}
+        for row in conn.execute(f"SELECT {cols} FROM samples_raw WHERE ts >= ? AND ts < ?",
+                                (start, end)):
+            buckets.setdefault(int(row[0] // bucket * bucket), []).append(row[1:])
+
+        out = []
+        for ts, rows in sorted(buckets.items()):
+            record = [ts, len(rows)]
+            for i in range(len(fields)):
+                values = sorted(r[i] for r in rows if r[i] is not None)
+                if values:
+                    record += [values[0], values[-1], sum(values) / len(values), percentile(values, 95)]
+                else:
+                    record += [None] * len(STATS)
+            out.append(record)
+
+        stat_cols = [f"{f}_{s}" for f in fields for s in STATS]
+        columns = ", ".join(["ts", "n"] + stat_cols)
+        marks = ", ".join("?" * (len(stat_cols) + 2))
+        with conn:
+            conn.executemany(f"INSERT OR REPLACE INTO samples_{tier} ({columns}) VALUES ({marks})", out)
+            conn.execute("INSERT OR REPLACE INTO rollup_state (tier, done_until) VALUES (?, ?)",
+                         (tier, end))
+
+    def _apply_retention(self, conn, now):
+        with conn:
+            for tier, keep in self.retention.items():
+                conn.execute(f"DELETE FROM samples_{tier} WHERE ts < ?", (now - keep,))
+
+    # --- Reading ---
+
+    def _available(self, fields):
+        """``fields`` that have columns (another app may have added some since)."""
+        if any(f not in self._columns for f in fields):
+            self._columns.update(self._known_fields(self._reader()))
+        return [f for f in fields if f in self._columns]
+
+    def tier_for(self, t0, t1, max_points=2000):
+        """Finest tier that covers ``t0`` and answers [t0, t1] in <= ``max_points`` rows."""
+        now = time.time()
+        span = max(0.0, t1 - t0)
+        for tier, (bucket, _) in TIERS.items():
+            step = bucket or self.sample_interval
+            if span / step <= max_points and now - t0 <= self.retention[tier]:
+                return tier
+        return "1h"
+
+    def query(self, t0, t1, fields, tier=None, max_points=2000):
+        """(tier, rows) for [t0, t1]. Rows are (ts, value per field) from raw or
+        (ts, avg per field) from a rollup tier, oldest first."""
+        tier = tier or self.tier_for(t0, t1, max_points)
+        fields = self._available(fields)
+        if tier == "raw":
+            cols = ", ".join(["ts"] + fields)
+        else:
+            cols = ", ".join(["ts"] + [f"{f}_avg" for f in fields])
+        rows = self._reader().execute(
+            f"SELECT {cols} FROM samples_{tier} WHERE ts >= ? AND ts <= ? ORDER BY ts",
+            (t0, t1)).fetchall()
+        return tier, rows
+
+    def summary(self, t0, t1, fields, max_points=2000):
+        """{field: {"min", "max", "avg", "p95"}} over [t0, t1].
+
+        Exact on raw samples. On rollups min/max/avg are exact and p95 is the
+        sample-weighted 95th percentile of the per-bucket p95s.
+        """
+        tier = self.tier_for(t0, t1, max_points)
+        fields = self._available(fields)
+        conn = self._reader()
+        result = {}
+        for field in fields:
+            if tier == "raw":
+                values = [r[0] for r in conn.execute(
+                    f"SELECT {field} FROM samples_raw WHERE ts >= ? AND ts <= ? "
+                    f"AND {field} IS NOT NULL ORDER BY {field}", (t0, t1))]
+                if values:
+                    result[field] = {"min": values[0], "max": values[-1],
+                                     "avg": sum(values) / len(values),
+                                     "p95": percentile(values, 95)}
+                continue
+
+            rows = conn.execute(
+                f"SELECT n, {field}_min, {field}_max, {field}_avg, {field}_p95 FROM samples_{tier} "
+                f"WHERE ts >= ? AND ts <= ? AND {field}_avg IS NOT NULL ORDER BY {field}_p95",
+                (t0, t1)).fetchall()
+            total = sum(r[0] for r in rows)
+            if not total:
+                continue
+            seen, p95 = 0, rows[-1][4]
+            for n, _, _, _, bucket_p95 in rows:
+                seen += n
+                if seen >= 0.95 * total:
+                    p95 = bucket_p95
+                    break
+            result[field] = {"min": min(r[1] for r in rows), "max": max(r[2] for r in rows),
+                             "avg": sum(r[0] * r[3] for r in rows) / total, "p95": p95}
+        return result
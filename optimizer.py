@@ -0,0 +1,495 @@
+"""Working-set trimming for the RAM optimizer.
+
+The old optimizer called ``EmptyWorkingSet`` on every PID in turn, opening
+each with PROCESS_ALL_ACCESS (which fails for protected processes after a
+slow access check) and trimming processes too small to matter.
+``WorkingSetTrimmer`` ranks processes by working set, drops those below
+``min_bytes`` or on the exclusion list, and trims the rest on a bounded
+thread pool. Each process is opened with only the rights EmptyWorkingSet
+needs. The working set is read before and after through the same handle, so
+every pass reports the bytes actually reclaimed per process and its wall
+time.
+
+A trim only helps if the process doesn't immediately fault the pages back
+in. ``settle(report)`` re-reads each trimmed process's working set and page
+fault counter some seconds later. Processes that regrew most of what was
+trimmed build up a per-name thrash score and are left out of the following
+passes; the score decays while they are excluded, so they are retried
+eventually. ``TrimReport.net_reclaimed`` is what is still free after the
+settle delay, i.e. whether the pass helped at all. A trim during another
+pass's settle delay would show up as that pass's refaults, so front ends
+bracket a pass with ``try_begin()``/``end()`` and skip it while one is busy.
+
+Trimming only exists on Windows; elsewhere ``available`` is False and
+``run()`` returns an empty report.
+
+``CpuThrottler`` is the CPU side: it keeps a rolling window of
+``cpu_times`` samples per process while system load is high, lowers the
+priority of processes whose usage stayed above the limit for the whole
+window, and puts the original priority back once load has stayed below a
+lower threshold for a while. Every change goes to a journal (in memory and
+optionally a JSON-lines file), which is also used to undo demotions left
+behind by a crash.
+"""
+import concurrent.futures
+import ctypes
+import json
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+import psutil
+
+PROCESS_SET_QUOTA = 0x0100
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+
+# Priority given to CPU offenders (niceness on POSIX)
+DEMOTED_PRIORITY = psutil.BELOW_NORMAL_PRIORITY_CLASS if psutil.WINDOWS else 10
+
+# Trimming these costs more than it frees (kernel/session processes, the
+# compositor and audio engine refault immediately and stutter)
+DEFAULT_EXCLUDE = (
+    "system", "registry", "memcompression", "smss.exe", "csrss.exe", "wininit.exe",
+    "winlogon.exe", "services.exe", "lsass.exe", "dwm.exe", "audiodg.exe",
+)
+
+
+class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+    _fields_ = [
+        ('cb', ctypes.c_ulong),
+        ('PageFaultCount', ctypes.c_ulong),
+        ('PeakWorkingSetSize', ctypes.c_size_t),
+        ('WorkingSetSize', ctypes.c_size_t),
+        ('QuotaPeakPagedPoolUsage', ctypes.c_size_t),
+        ('QuotaPagedPoolUsage', ctypes.c_size_t),
+        ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+        ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+        ('PagefileUsage', ctypes.c_size_t),
+        ('PeakPagefileUsage', ctypes.c_size_t),
+    ]
+
+
+if os.name == 'nt':
+    psapi = ctypes.WinDLL('psapi.dll')
+    kernel32 = ctypes.WinDLL('kernel32.dll')
+    kernel32.OpenProcess.restype = ctypes.c_void_p
+    kernel32.OpenProcess.argtypes = [ctypes.c_ulong, ctypes.c_int, ctypes.c_ulong]
+    kernel32.CloseHandle.argtypes = [ctypes.c_void_p]
+    psapi.EmptyWorkingSet.argtypes = [ctypes.c_void_p]
+    psapi.GetProcessMemoryInfo.argtypes = [ctypes.c_void_p, ctypes.POINTER(PROCESS_MEMORY_COUNTERS),
+                                           ctypes.c_ulong]
+else:
+    psapi = kernel32 = None
+
+
+def _memory_counters(handle):
+    counters = PROCESS_MEMORY_COUNTERS()
+    counters.cb = ctypes.sizeof(counters)
+    if not psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+        return None
+    return counters
+
+
+def trim_process(pid):
+    """Empty one process's working set.
+
+    Returns (bytes before, bytes after, page faults so far), or None if the
+    process couldn't be opened, trimmed or measured.
+    """
+    handle = kernel32.OpenProcess(PROCESS_SET_QUOTA | PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not handle:
+        return None
+    try:
+        before = _memory_counters(handle)
+        if before is None or not psapi.EmptyWorkingSet(handle):
+            return None
+        after = _memory_counters(handle)
+        if after is None:
+            return None     # Trimmed, but unmeasured: a zero would skew the settle stats
+        return before.WorkingSetSize, after.WorkingSetSize, after.PageFaultCount
+    finally:
+        kernel32.CloseHandle(handle)
+
+
+def sample_process(pid):
+    """(working set bytes, page fault count) of one process, or None."""
+    handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not handle:
+        return None
+    try:
+        counters = _memory_counters(handle)
+        return (counters.WorkingSetSize, counters.PageFaultCount) if counters else None
+    finally:
+        kernel32.CloseHandle(handle)
+
+
+@dataclass
+class TrimResult:
+    pid: int
+    name: str
+    before: int
+    after: int
+    faults: int = 0                 # Page fault counter right after the trim
+    settled: int = None             # Working set after the settle delay
+    refaults: int = None            # Page faults taken during the settle delay
+
+    @property
+    def reclaimed(self):
+        return max(0, self.before - self.after)
+
+    @property
+    def refaulted(self):
+        """Bytes the process pulled back in after the trim (None until settled)."""
+        if self.settled is None:
+            return None
+        return max(0, min(self.settled, self.before) - self.after)
+
+    @property
+    def refault_ratio(self):
+        if self.settled is None or not self.reclaimed:
+            return None
+        return self.refaulted / self.reclaimed
+
+
+@dataclass
+class TrimReport:
+    results: list = field(default_factory=list)    # TrimResult, largest reclaim first
+    candidates: int = 0
+    skipped_small: int = 0
+    skipped_excluded: int = 0
+    skipped_thrashing: int = 0
+    failed: int = 0
+    wall_ms: float = 0.0
+    settle_s: float = None          # Set by WorkingSetTrimmer.settle()
+    thrashing: list = field(default_factory=list)   # Names newly marked as thrashing
+
+    @property
+    def reclaimed(self):
+        return sum(r.reclaimed for r in self.results)
+
+    @property
+    def net_reclaimed(self):
+        """Bytes still reclaimed after the settle delay (None until settled)."""
+        settled = [r for r in self.results if r.settled is not None]
+        if self.settle_s is None:
+            return None
+        return sum(r.reclaimed - r.refaulted for r in settled)
+
+    def summary(self):
+        text = (f"{len(self.results)}/{self.candidates} processes trimmed, "
+                f"{self.reclaimed / (1024 * 1024):.1f} MB reclaimed in {self.wall_ms:.0f} ms "
+                f"({self.skipped_small} too small, {self.skipped_excluded} excluded, "
+                f"{self.skipped_thrashing} thrashing, {self.failed} failed)")
+        if self.settle_s is not None:
+            text += (f"; net {self.net_reclaimed / (1024 * 1024):.1f} MB "
+                     f"after {self.settle_s:.0f}s")
+        return text
+
+
+class WorkingSetTrimmer:
+    """Trims the largest working sets in parallel, skipping small and excluded processes."""
+
+    def __init__(self, min_bytes=32 * 1024 * 1024, exclude=DEFAULT_EXCLUDE, max_workers=8,
+                 max_processes=None, settle_s=10.0, thrash_ratio=0.6, thrash_decay=0.8):
+        self.min_bytes = min_bytes
+        self.exclude = {name.lower() for name in exclude}
+        self.max_workers = max_workers
+        self.max_processes = max_processes
+        self.settle_s = settle_s
+        # Skip a process once its smoothed refault ratio reaches thrash_ratio;
+        # each skipped pass multiplies the score by thrash_decay
+        self.thrash_ratio = thrash_ratio
+        self.thrash_decay = thrash_decay
+        self.thrash = {}            # lower-case name -> smoothed refault ratio
+        self._thrash_lock = threading.Lock()    # A settle may overlap the next pass
+        self.history = deque(maxlen=50)     # Settled TrimReports, oldest first
+        self.available = psapi is not None
+        self._pass_lock = threading.Lock()  # Held from run() until settle() returns
+
+    def try_begin(self):
+        """Claim the trimmer for one pass (run + settle); False if a pass is in progress."""
+        return self._pass_lock.acquire(blocking=False)
+
+    def end(self):
+        """Release the claim taken by ``try_begin()``."""
+        self._pass_lock.release()
+
+    def candidates(self, report):
+        """(pid, name, working set) worth trimming, largest first."""
+        own_pid = os.getpid()
+        found = []
+        for proc in psutil.process_iter(['pid', 'name', 'memory_info']):
+            info = proc.info
+            pid, name, mem = info['pid'], info['name'] or "", info['memory_info']
+            if pid in (0, 4, own_pid):
+                continue
+            key = name.lower()
+            if key in self.exclude:
+                report.skipped_excluded += 1
+                continue
+            if mem is None or mem.rss < self.min_bytes:
+                report.skipped_small += 1
+                continue
+            with self._thrash_lock:
+                score = self.thrash.get(key, 0.0)
+                if score >= self.thrash_ratio:
+                    self.thrash[key] = score * self.thrash_decay
+            if score >= self.thrash_ratio:
+                report.skipped_thrashing += 1
+                continue
+            found.append((pid, name, mem.rss))
+        found.sort(key=lambda c: c[2], reverse=True)
+        return found[:self.max_processes] if self.max_processes else found
+
+    def run(self):
+        """One optimization pass; returns a TrimReport."""
+        start = time.perf_counter()
+        report = TrimReport()
+        if not self.available:
+            return report
+
+        targets = self.candidates(report)
+        report.candidates = len(targets)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers,
+                                                   thread_name_prefix="trim") as pool:
+            futures = {pool.submit(trim_process, pid): (pid, name) for pid, name, _ in targets}
+            for fut in concurrent.futures.as_completed(futures):
+                pid, name = futures[fut]
+                try:
+                    sizes = fut.result()
+                except Exception:
+                    sizes = None
+                if sizes is None:
+                    report.failed += 1
+                else:
+                    report.results.append(TrimResult(pid, name, *sizes))
+
+        report.results.sort(key=lambda r: r.reclaimed, reverse=True)
+        report.wall_ms = (time.perf_counter() - start) * 1000
+        return report
+
+    def settle(self, report, delay=None):
+        """Wait, then measure how much each trimmed process faulted back in.
+
+        Updates the thrash scores and ``report`` in place (blocking; call it
+        from the optimizer thread).
+        """
+        delay = self.settle_s if delay is None else delay
+        if not report.results:
+            return report
+        time.sleep(delay)
+
+        for r in report.results:
+            sample = sample_process(r.pid)
+            if sample is None:
+                continue    # Exited meanwhile
+            r.settled, faults = sample
+            r.refaults = max(0, faults - r.faults)
+
+            ratio = r.refault_ratio
+            if ratio is None or r.reclaimed < self.min_bytes // 4:
+                continue    # Too little trimmed to judge
+            key = r.name.lower()
+            with self._thrash_lock:
+                prev = self.thrash.get(key)
+                score = ratio if prev is None else (prev + ratio) / 2
+                self.thrash[key] = score
+            if score >= self.thrash_ratio and (prev is None or prev < self.thrash_ratio):
+                report.thrashing.append(r.name)
+
+        report.settle_s = delay
+        self.history.append(report)
+        return report
+
+
+class CpuThrottler:
+    """Demotes sustained CPU offenders and restores them when load drops."""
+
+    def __init__(self, demote_percent=50.0, window_s=10.0, arm_percent=85.0,
+                 restore_percent=60.0, restore_hold_s=10.0, exclude=DEFAULT_EXCLUDE,
+                 journal_path=None):
+        self.demote_percent = demote_percent    # Per-process CPU% (100 = one core)
+        self.window_s = window_s
+        # Hysteresis on system CPU%: sample/demote above arm_percent, restore
+        # after restore_hold_s below restore_percent
+        self.arm_percent = arm_percent
+        self.restore_percent = restore_percent
+        self.restore_hold_s = restore_hold_s
+        self.exclude = {name.lower() for name in exclude}
+        self.journal_path = journal_path
+        self.journal = deque(maxlen=500)
+        self.demoted = {}           # pid -> (psutil.Process, original priority)
+        # Guards demoted and the journal: throttle() runs on the optimizer
+        # thread, restore_all() on the monitor thread
+        self._demote_lock = threading.Lock()
+        self.armed = False
+        self._procs = {}            # pid -> psutil.Process
+        self._windows = {}          # pid -> deque of (monotonic time, cpu seconds)
+        self._calm_since = None
+        self._lock = threading.Lock()
+
+    def on_load(self, cpu_percent, now=None):
+        """Feed the system CPU%; arms sampling and restores priorities when calm."""
+        now = time.monotonic() if now is None else now
+        if cpu_percent >= self.arm_percent:
+            self.armed = True
+            self._calm_since = None
+        elif cpu_percent < self.restore_percent:
+            if self._calm_since is None:
+                self._calm_since = now
+            if now - self._calm_since >= self.restore_hold_s:
+                if self.demoted:
+                    self.restore_all()
+                if self.armed:
+                    self.armed = False
+                    with self._lock:
+                        self._procs.clear()
+                        self._windows.clear()
+        else:
+            self._calm_since = None
+
+    def sample(self):
+        """Record one cpu_times sample per process (no-op unless armed)."""
+        if not self.armed:
+            return 0
+        now = time.monotonic()
+        pids = set(psutil.pids())
+        with self._lock:
+            for pid in self._procs.keys() - pids:
+                self._procs.pop(pid, None)
+                self._windows.pop(pid, None)
+            for pid in pids - self._procs.keys():
+                try:
+                    self._procs[pid] = psutil.Process(pid)
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    pass
+            for pid, proc in list(self._procs.items()):
+                try:
+                    times = proc.cpu_times()
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    self._procs.pop(pid, None)
+                    self._windows.pop(pid, None)
+                    continue
+                window = self._windows.setdefault(pid, deque())
+                window.append((now, times.user + times.system))
+                while now - window[0][0] > self.window_s:
+                    window.popleft()
+        return len(pids)
+
+    def offenders(self):
+        """(pid, average CPU%) above the limit for a full window and still hot."""
+        found = []
+        with self._lock:
+            for pid, window in self._windows.items():
+                if len(window) < 3:
+                    continue
+                (t0, c0), (t_prev, c_prev), (t1, c1) = window[0], window[-2], window[-1]
+                if t1 - t0 < self.window_s * 0.8 or t1 <= t_prev:
+                    continue    # Not enough history to call it sustained
+                average = (c1 - c0) / (t1 - t0) * 100
+                latest = (c1 - c_prev) / (t1 - t_prev) * 100
+                if average >= self.demote_percent and latest >= self.demote_percent:
+                    found.append((pid, average))
+        found.sort(key=lambda o: o[1], reverse=True)
+        return found
+
+    def throttle(self):
+        """Demote the current sustained offenders; returns the journal entries made."""
+        entries = []
+        own_pid = os.getpid()
+        offenders = self.offenders()
+        with self._demote_lock:
+            for pid, average in offenders:
+                if pid in self.demoted or pid == own_pid:
+                    continue
+                proc = self._procs.get(pid)
+                if proc is None:
+                    continue
+                try:
+                    name = proc.name()
+                    if name.lower() in self.exclude:
+                        continue
+                    original = proc.nice()
+                    if original == DEMOTED_PRIORITY:
+                        continue    # Already low (by us earlier or by the user)
+                    proc.nice(DEMOTED_PRIORITY)
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+                self.demoted[pid] = (proc, original)
+                entries.append(self._record("demote", proc, name, original, DEMOTED_PRIORITY, average))
+        return entries
+
+    def restore_all(self):
+        """Put every demoted process back to its original priority."""
+        entries = []
+        with self._demote_lock:
+            demoted, self.demoted = self.demoted, {}
+            for proc, original in demoted.values():
+                try:
+                    name = proc.name()
+                    # Same process (create time checked) and nobody changed it since
+                    if not proc.is_running() or proc.nice() != DEMOTED_PRIORITY:
+                        continue
+                    proc.nice(original)
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+                entries.append(self._record("restore", proc, name, DEMOTED_PRIORITY, original))
+        return entries
+
+    def recover(self):
+        """Undo demotions a previous run left in the journal file (e.g. after a crash)."""
+        if not self.journal_path:
+            return []
+        pending = {}
+        try:
+            with open(self.journal_path, 'r') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    key = (entry.get("pid"), entry.get("create_time"))
+                    if entry.get("action") == "demote":
+                        pending[key] = entry
+                    else:
+                        pending.pop(key, None)
+        except OSError:
+            return []
+
+        # Start a fresh journal; whatever is restored below is logged into it
+        try:
+            open(self.journal_path, 'w').close()
+        except OSError:
+            pass
+        entries = []
+        with self._demote_lock:
+            for (pid, create_time), entry in pending.items():
+                try:
+                    proc = psutil.Process(pid)
+                    if proc.create_time() != create_time or proc.nice() != entry["to"]:
+                        continue
+                    proc.nice(entry["from"])
+                except (psutil.NoSuchProcess, psutil.AccessDenied, KeyError, TypeError):
+                    continue
+                entries.append(self._record("recover", proc, entry.get("name", ""),
+                                            entry["to"], entry["from"]))
+        return entries
+
+    def _record(self, action, proc, name, before, after, cpu=None):
+        # Called with _demote_lock held, so journal lines never interleave
+        entry = {
+            "time": time.time(), "action": action, "pid": proc.pid, "name": name,
+            "create_time": proc.create_time(), "from": int(before), "to": int(after),
+        }
+        if cpu is not None:
+            entry["cpu"] = round(cpu, 1)
+        self.journal.append(entry)
+        if self.journal_path:
+            try:
+                with open(self.journal_path, 'a') as f:
+                    f.write(json.dumps(entry) + "\n")
+            except OSError as e:
+                print(f"Priority journal write error: {e}")
+        return entry
@@ -0,0 +1,230 @@
+"""Declarative auto-optimization rules.
+
+Rules live in ``dashboard_config.json`` under ``"auto_optimize_rules"``
+(``DEFAULT_RULES`` when absent) and are shared by both apps::
+
+    {"name": "high_ram", "metric": "ram_p", "aggregate": "ewma", "half_life": 3,
+     "enter": "threshold_ram", "exit_margin": 5, "min_duration": 10,
+     "cooldown": 60, "action": "optimize_ram"}
+
+- ``metric``: key in the values passed to ``evaluate`` (``ram_p``, ``cpu_p``...)
+- ``aggregate``: ``last``, ``ewma`` (``half_life`` seconds), or ``mean`` /
+  ``max`` over ``window`` seconds
+- ``enter`` / ``exit``: hysteresis thresholds; a number or the name of an
+  engine parameter (e.g. the Settings page thresholds). ``exit_margin``
+  derives ``exit`` from ``enter``. ``direction: "below"`` flips both.
+- ``min_duration``: seconds the rule must stay entered before it fires
+- ``cooldown``: minimum seconds between two firings
+- ``action``: name looked up in the actions passed to ``PolicyEngine``
+
+Each evaluation is O(1) per rule (the window aggregates are amortised O(1)).
+"""
+import json
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+
+DEFAULT_RULES = [
+    {"name": "high_ram", "metric": "ram_p", "aggregate": "ewma", "half_life": 3,
+     "enter": "threshold_ram", "exit_margin": 5, "min_duration": 10, "cooldown": 60,
+     "action": "optimize_ram"},
+    {"name": "high_cpu", "metric": "cpu_p", "aggregate": "ewma", "half_life": 3,
+     "enter": "threshold_cpu", "exit_margin": 10, "min_duration": 10, "cooldown": 60,
+     "action": "optimize_cpu"},
+    # Predictive: RAM forecast to reach threshold_ram within the lead time
+    # (see forecast.py). Apps that don't publish ram_eta never evaluate it.
+    {"name": "ram_forecast", "metric": "ram_eta", "aggregate": "last", "direction": "below",
+     "enter": "forecast_lead_s", "exit_margin": 15, "min_duration": 0, "cooldown": 60,
+     "action": "optimize_ram"},
+]
+
+
+class Last:
+    def __init__(self, rule):
+        self.value = None
+
+    def update(self, value, now):
+        self.value = value
+        return value
+
+
+class Ewma:
+    """Time-aware EWMA: ``half_life`` seconds regardless of the tick rate."""
+
+    def __init__(self, rule):
+        self.half_life = max(0.001, float(rule.half_life))
+        self.value = None
+        self._last = None
+
+    def update(self, value, now):
+        if self.value is None:
+            self.value = value
+        else:
+            alpha = 1 - math.pow(0.5, max(0.0, now - self._last) / self.half_life)
+            self.value += alpha * (value - self.value)
+        self._last = now
+        return self.value
+
+
+class WindowMean:
+    def __init__(self, rule):
+        self.window = float(rule.window)
+        self.samples = deque()
+        self.total = 0.0
+
+    def update(self, value, now):
+        self.samples.append((now, value))
+        self.total += value
+        while now - self.samples[0][0] > self.window:
+            self.total -= self.samples.popleft()[1]
+        return self.total / len(self.samples)
+
+
+class WindowMax:
+    """Sliding-window maximum with a monotonic deque."""
+
+    def __init__(self, rule):
+        self.window = float(rule.window)
+        self.samples = deque()      # (time, value), values decreasing
+
+    def update(self, value, now):
+        while self.samples and self.samples[-1][1] <= value:
+            self.samples.pop()
+        self.samples.append((now, value))
+        while now - self.samples[0][0] > self.window:
+            self.samples.popleft()
+        return self.samples[0][1]
+
+
+AGGREGATES = {"last": Last, "ewma": Ewma, "mean": WindowMean, "max": WindowMax}
+
+
+@dataclass
+class Rule:
+    name: str
+    metric: str
+    action: str
+    enter: object               # Number or parameter name
+    exit: object = None
+    exit_margin: float = 0.0
+    aggregate: str = "ewma"
+    half_life: float = 3.0
+    window: float = 10.0
+    direction: str = "above"
+    min_duration: float = 10.0
+    cooldown: float = 60.0
+
+    @classmethod
+    def from_dict(cls, data):
+        fields = cls.__dataclass_fields__
+        rule = cls(**{k: v for k, v in data.items() if k in fields})
+        if rule.aggregate not in AGGREGATES:
+            raise ValueError(f"unknown aggregate '{rule.aggregate}'")
+        if rule.direction not in ("above", "below"):
+            raise ValueError(f"unknown direction '{rule.direction}'")
+        return rule
+
+
+class RuleState:
+    def __init__(self, rule):
+        self.rule = rule
+        self.aggregate = AGGREGATES[rule.aggregate](rule)
+        self.value = None           # Latest aggregated value
+        self.entered_at = None      # When the enter threshold was crossed
+        self.last_fired = None
+        self.fired = 0
+
+
+def read_config(path="dashboard_config.json"):
+    """The shared settings file as a dict ({} if missing or unreadable)."""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def load_rules(config):
+    """Rules from a config dict (``DEFAULT_RULES`` if none); invalid ones are skipped."""
+    rules = []
+    for data in (config or {}).get("auto_optimize_rules") or DEFAULT_RULES:
+        try:
+            rules.append(Rule.from_dict(data))
+        except (TypeError, ValueError) as e:
+            print(f"Skipping auto-optimize rule {data!r}: {e}")
+    return rules
+
+
+class PolicyEngine:
+    """Evaluates rules against each metric snapshot and runs their actions."""
+
+    def __init__(self, rules, actions, params=None):
+        self.states = {rule.name: RuleState(rule) for rule in rules}
+        self.actions = dict(actions)
+        self.params = dict(params or {})
+        self._missing = set()
+
+    def set_param(self, name, value):
+        self.params[name] = value
+
+    def _resolve(self, value):
+        return self.params.get(value) if isinstance(value, str) else value
+
+    def thresholds(self, rule):
+        """(enter, exit) with parameter names and exit_margin resolved."""
+        enter = self._resolve(rule.enter)
+        exit_ = self._resolve(rule.exit)
+        if exit_ is None and enter is not None:
+            exit_ = enter - rule.exit_margin if rule.direction == "above" else enter + rule.exit_margin
+        return enter, exit_
+
+    def evaluate(self, values, now=None):
+        """Feed one snapshot ({metric: value}); returns the names of rules that fired."""
+        now = time.monotonic() if now is None else now
+        fired = []
+        for state in self.states.values():
+            rule = state.rule
+            raw = values.get(rule.metric)
+            if raw is None:
+                continue
+            value = state.value = state.aggregate.update(raw, now)
+            enter, exit_ = self.thresholds(rule)
+            if enter is None:
+                continue
+
+            sign = 1 if rule.direction == "above" else -1
+            if state.entered_at is None:
+                if sign * (value - enter) >= 0:
+                    state.entered_at = now
+            elif sign * (value - exit_) < 0:
+                state.entered_at = None
+
+            if state.entered_at is None or now - state.entered_at < rule.min_duration:
+                continue
+            if state.last_fired is not None and now - state.last_fired < rule.cooldown:
+                continue
+            state.last_fired = now
+            state.fired += 1
+            fired.append(rule.name)
+            self._run(rule, raw)
+        return fired
+
+    def _run(self, rule, value):
+        action = self.actions.get(rule.action)
+        if action is None:
+            if rule.action not in self._missing:
+                self._missing.add(rule.action)
+                print(f"Auto-optimize rule '{rule.name}': no action '{rule.action}' here")
+            return
+        try:
+            action(rule, value)
+        except Exception as e:
+            print(f"Auto-optimize action '{rule.action}' failed: {e}")
+
+    def held_for(self, name, now=None):
+        """Seconds rule ``name`` has been entered, or None."""
+        state = self.states.get(name)
+        if state is None or state.entered_at is None:
+            return None
+        return (time.monotonic() if now is None else now) - state.entered_at
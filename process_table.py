@@ -0,0 +1,189 @@
+"""Incremental process table for the Process Manager page.
+
+``ProcessTable`` keeps one ``psutil.Process`` per PID across refreshes, so
+names, create times and OS handles are looked up once per process instead
+of once per refresh. Started and exited processes are found by diffing the
+PID set; a PID that was reused in between is caught by its create time. CPU% comes from the change in ``cpu_times`` between refreshes; a
+process seen for the first time reports its average since it started
+rather than psutil's first-call 0.0. Processes whose stats are access
+denied stay in the table with None for CPU and memory; they are not queried
+again until they exit.
+
+Every process is kept in ``rows``, but only the first ``limit`` rows for the
+current sort key are ranked into display order (``heapq.nlargest``/
+``nsmallest``). ``limit`` starts at ``top_n`` and ``show_more()`` raises it
+by another ``top_n`` when the view is scrolled to the end, so the view only
+holds what has been scrolled to. ``version`` changes whenever those rows
+change.
+"""
+import heapq
+import threading
+import time
+from collections import namedtuple
+
+import psutil
+
+ProcessRow = namedtuple("ProcessRow", "pid name cpu memory status")
+
+# sort key -> (row key, largest first); access-denied rows (None) sort last
+SORT_KEYS = {
+    "cpu": (lambda r: -1.0 if r.cpu is None else r.cpu, True),
+    "memory": (lambda r: -1 if r.memory is None else r.memory, True),
+    "name": (lambda r: r.name.lower(), False),
+    "pid": (lambda r: r.pid, False),
+}
+
+
+class ProcessTable:
+    """Refreshes per-process stats on a background thread while active."""
+
+    def __init__(self, top_n=100, sort_key="cpu", interval=2.0):
+        self.top_n = top_n
+        self.limit = top_n          # Rows ranked into ``top``; grows as the view scrolls
+        self.sort_key = sort_key if sort_key in SORT_KEYS else "cpu"
+        self.interval = interval
+        self.rows = {}              # pid -> ProcessRow for every visible process
+        self.top = []               # first ``limit`` rows for sort_key, in display order
+        self.version = 0
+        self.started = 0            # Processes that appeared / exited in the last refresh
+        self.exited = 0
+        self.refresh_ms = 0.0
+        self.active = False
+
+        self._procs = {}            # pid -> psutil.Process
+        self._names = {}
+        self._cpu = {}              # pid -> (cpu seconds, monotonic time)
+        self._denied = {}           # pid -> N/A row for processes we can't read, until they exit
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="process-table", daemon=True)
+            self._thread.start()
+        return self
+
+    def set_active(self, active):
+        """Only refresh while the page is visible; wake immediately when shown."""
+        if active and not self.active:
+            self._wake.set()
+        self.active = active
+
+    def refresh_now(self):
+        self._wake.set()
+
+    def set_sort(self, key):
+        """Change the sort key and re-rank the current rows."""
+        if key in SORT_KEYS and key != self.sort_key:
+            self.sort_key = key
+            with self._lock:
+                self._rank(self.rows)
+
+    def show_more(self):
+        """Rank another ``top_n`` rows (the view reached the end); False if all are shown."""
+        if self.limit >= len(self.rows):
+            return False
+        self.limit += self.top_n
+        with self._lock:
+            self._rank(self.rows)
+        return True
+
+    def _run(self):
+        while True:
+            if self.active:
+                try:
+                    self.refresh()
+                except Exception as e:
+                    print(f"Process table error: {e}")
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+    def refresh(self):
+        """Diff the PID set, sample every known process and re-rank."""
+        start = time.perf_counter()
+        now = time.monotonic()
+        pids = set(psutil.pids())
+
+        gone = self._procs.keys() - pids
+        for pid in gone:
+            self._forget(pid)
+        new = pids - self._procs.keys()
+        for pid in new:
+            try:
+                self._procs[pid] = psutil.Process(pid)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+
+        rows = {}
+        reused = 0
+        for pid, proc in list(self._procs.items()):
+            if pid not in new and not proc.is_running():
+                # Exited and the PID was reused (is_running compares create times):
+                # drop the old name, CPU baseline and denied row
+                self._forget(pid)
+                try:
+                    proc = self._procs[pid] = psutil.Process(pid)
+                except psutil.Error:
+                    continue
+                reused += 1
+            if pid in self._denied:
+                rows[pid] = self._denied[pid]
+                continue
+            try:
+                with proc.oneshot():
+                    times = proc.cpu_times()
+                    memory = proc.memory_info().rss
+                    status = proc.status()
+                    name = self._names.get(pid)
+                    if name is None:
+                        name = self._names[pid] = proc.name()
+            except psutil.NoSuchProcess:
+                self._forget(pid)
+                continue
+            except psutil.AccessDenied:
+                rows[pid] = self._denied[pid] = self._denied_row(pid, proc)
+                continue
+
+            cpu_s = times.user + times.system
+            prev = self._cpu.get(pid)
+            if prev is None:
+                # First sight: average since the process started
+                prev = (0.0, now - max(0.001, time.time() - proc.create_time()))
+            self._cpu[pid] = (cpu_s, now)
+            elapsed = now - prev[1]
+            cpu = max(0.0, (cpu_s - prev[0]) / elapsed * 100) if elapsed > 0 else 0.0
+            rows[pid] = ProcessRow(pid, name, round(cpu, 1), memory, status)
+
+        with self._lock:
+            self.rows = rows
+            self.started = len(new) + reused
+            self.exited = len(gone) + reused
+            self._rank(rows)
+        self.refresh_ms = (time.perf_counter() - start) * 1000
+
+    def _denied_row(self, pid, proc):
+        # Name and status are often still readable when the stats aren't
+        try:
+            name = self._names.get(pid) or proc.name()
+        except psutil.Error:
+            name = "N/A"
+        try:
+            status = proc.status()
+        except psutil.Error:
+            status = "N/A"
+        return ProcessRow(pid, name, None, None, status)
+
+    def _rank(self, rows):
+        key, largest = SORT_KEYS[self.sort_key]
+        pick = heapq.nlargest if largest else heapq.nsmallest
+        top = pick(self.limit, rows.values(), key=key)
+        if top != self.top:
+            self.top = top
+            self.version += 1
+
+    def _forget(self, pid):
+        self._procs.pop(pid, None)
+        self._names.pop(pid, None)
+        self._cpu.pop(pid, None)
+        self._denied.pop(pid, None)
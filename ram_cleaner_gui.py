@@ -5,14 +5,26 @@ import ctypes
 import gc
 import psutil
 import time
-import csv
 import os
 import subprocess
 import platform
 import urllib.request
+import queue
 from collections import deque
 from datetime import datetime, timedelta
 
+from gpu_telemetry import get_gpu_telemetry
+from inventory_cache import HardwareInventory
+from log_reader import LogData, format_time, read_recent
+from metrics_log import DURABILITY_MODES, CsvLogger
+from metrics_ring import MetricsRing
+from metrics_store import MetricsStore
+from optimizer import DEFAULT_EXCLUDE, WorkingSetTrimmer
+from policy import PolicyEngine, load_rules, read_config
+from rates import RateEngine
+from ui_binding import WidgetBinder
+from shell_broker import get_broker
+
 try:
     import wmi
     HAS_WMI = True
@@ -28,6 +40,11 @@ try:
 except ImportError:
     HAS_MATPLOTLIB = False
 
+# Numeric log fields: metrics store columns
+LOG_FIELDS = ("ram_p", "cpu_p", "battery_p", "disk_mb_s", "net_kb_s")
+# Binary log record layout (after the timestamp); optimized is 1.0 on a row with an optimization
+RING_FIELDS = LOG_FIELDS + ("optimized",)
+
 # --- Windows API structures ---
 class SYSTEM_POWER_STATUS(ctypes.Structure):
     _fields_ = [
@@ -88,21 +105,13 @@ class PERFORMANCE_INFORMATION(ctypes.Structure):
     ]
 
 # --- Windows API setup ---
-psapi = ctypes.WinDLL('psapi.dll')
-kernel32 = ctypes.WinDLL('kernel32.dll')
-user32 = ctypes.WinDLL('user32.dll')
-
-def empty_working_set(pid):
-    """Trim memory usage of a process without closing it."""
-    try:
-        hProcess = kernel32.OpenProcess(0x001F0FFF, False, pid)
-        if hProcess:
-            psapi.EmptyWorkingSet(hProcess)
-            kernel32.CloseHandle(hProcess)
-            return True
-    except Exception:
-        pass
-    return False
+# Windows APIs (None elsewhere; every call site is already wrapped in try)
+if os.name == 'nt':
+    psapi = ctypes.WinDLL('psapi.dll')
+    kernel32 = ctypes.WinDLL('kernel32.dll')
+    user32 = ctypes.WinDLL('user32.dll')
+else:
+    psapi = kernel32 = user32 = None
 
 class ModernDarkTheme:
     """Helper to configure a modern dark look for ttk widgets."""
@@ -146,13 +155,25 @@ class RamCleanerGUI:
         except: pass
         
         self.style = ModernDarkTheme.apply_theme(self.root)
-
-        # Config
-        self.threshold_ram = 85
-        self.threshold_cpu = 85
-        self.last_opt_time = 0
+        self.binder = WidgetBinder()  # Skips label updates whose text didn't change
+
+        # Config (thresholds and auto-optimize rules shared with the dashboard)
+        config = read_config()
+        self.threshold_ram = config.get('threshold_ram', 85)
+        self.threshold_cpu = config.get('threshold_cpu', 85)
+        self.auto_optimize_enabled = config.get('auto_optimize_enabled', True)
+        # No priority control here: CPU pressure trims working sets, as it always has
+        auto_opt = lambda rule, value: self.start_opt(f"Auto: {rule.name} {value:.0f}%")
+        self.policy = PolicyEngine(
+            load_rules(config),
+            {"optimize_ram": auto_opt, "optimize_cpu": auto_opt},
+            {"threshold_ram": self.threshold_ram, "threshold_cpu": self.threshold_cpu})
         self.monitor_interval = 500 # 0.5s refresh for realtime UI
         self.csv_file = "system_performance_log.csv"
+        self.ring_file = "system_performance_log.ring"
+        
+        # Metric history with 1m/1h rollups, shared with the dashboard (metrics_store.py)
+        self.metrics_store = MetricsStore(config.get('metrics_db', "system_metrics.db"), LOG_FIELDS)
         
         self.wmi_obj = None
         if HAS_WMI:
@@ -161,10 +182,18 @@ class RamCleanerGUI:
             except Exception: 
                 pass # Namespace not found or WMI error
         
-        self.last_disk_io = psutil.disk_io_counters(perdisk=True)
-        self.last_net_io = psutil.net_io_counters()
-        self.last_net_io_dict = psutil.net_io_counters(pernic=True)
-        self.last_check_time = time.time()
+        # Disk/network rates: each counter set is read once per tick
+        self.rates = RateEngine()
+        self.rates.update_disks(psutil.disk_io_counters(perdisk=True) or {})
+        self.rates.update_nics(psutil.net_io_counters(pernic=True))
+        
+        # Ranked, parallel working-set trimming for opt() (same config keys as the dashboard)
+        self.trimmer = WorkingSetTrimmer(
+            min_bytes=int(config.get('trim_min_mb', 32)) * 1024 * 1024,
+            exclude=tuple(DEFAULT_EXCLUDE) + tuple(config.get('trim_exclude', [])),
+            max_workers=config.get('trim_workers', 8),
+            settle_s=config.get('trim_settle_s', 10))
+        self.last_opt = ""  # Reason of an optimization not yet logged (Opt column)
         self.net_load_active = False
         
         # Shared Data Container (Thread-safe enough for GUI polling)
@@ -188,32 +217,78 @@ class RamCleanerGUI:
         self.cpu_name = platform.processor()
         self.boot_time = datetime.fromtimestamp(psutil.boot_time()).strftime("%Y-%m-%d %H:%M:%S")
         
-        # Advanced Static Info
-        self.gpu_static_list = self.get_gpu_static_advanced()
-        self.cached_batt_cap, self.cached_batt_design = self.get_static_batt_info()
-        self.cpu_static = self.get_cpu_static_advanced()
-        self.ram_static = self.get_ram_static_advanced()
-        self.disk_static = self.get_disk_static_advanced()
+        # Advanced Static Info (placeholders until the inventory probes report)
+        self.gpu_static_list = []
+        self.cached_batt_cap, self.cached_batt_design = "Detecting...", "Detecting..."
+        self.cpu_static = {
+            "base_speed": "Detecting...", "sockets": "1", "cores": psutil.cpu_count(logical=False),
+            "logical": psutil.cpu_count(logical=True), "virt": "Detecting...",
+            "l1": "--", "l2": "Detecting...", "l3": "Detecting..."
+        }
+        self.ram_static = {"speed": "Detecting...", "slots": "Detecting...", "form": "Detecting...", "hw_res": "Detecting..."}
+        self.disk_static = {}
+        self.static_labels = {}
+        self.inventory_updates = queue.Queue()
+        
+        # Warm start: reuse results cached for this boot, probe the rest in parallel
+        self.inventory = HardwareInventory()
+        for name, value in self.inventory.load().items():
+            self.apply_inventory(name, value)
         
         # Realtime history for analytics (last 60 points)
         self.history = deque(maxlen=60)
 
-        self.init_csv()
+        self.init_csv(config)
         self.create_widgets()
         
+        probes = {
+            "gpu": self.get_gpu_static_advanced,
+            "battery": self.get_static_batt_info,
+            "cpu": self.get_cpu_static_advanced,
+            "ram": self.get_ram_static_advanced,
+            "disk": self.get_disk_static_advanced,
+        }
+        missing = {name: fn for name, fn in probes.items() if name not in self.inventory.results}
+        self.inventory.probe(missing, lambda name, value: self.inventory_updates.put((name, value)))
+        
         # Start Background Monitor Thread (Prevents UI lag from subprocess calls)
         threading.Thread(target=self.monitor_thread, daemon=True).start()
         
         # Start UI Update Loop
         self.update_ui()
 
+    def apply_inventory(self, name, value):
+        """Store one inventory probe result (None = probe failed or timed out)."""
+        if name == "gpu":
+            self.gpu_static_list = value or [{"name": "Basic Display Adapter", "driver_ver": "--", "driver_date": "--", "location": "--", "dedicated_static": "--"}]
+        elif name == "battery":
+            self.cached_batt_cap, self.cached_batt_design = value or ("N/A", "N/A")
+        elif name == "cpu":
+            self.cpu_static.update(value or {"base_speed": "N/A", "virt": "Unknown", "l2": "--", "l3": "--"})
+        elif name == "ram":
+            self.ram_static.update(value or {"speed": "N/A", "slots": "N/A", "form": "N/A", "hw_res": "N/A"})
+        elif name == "disk":
+            self.disk_static = value or {}
+
+    def static_label(self, parent, group, key, prefix, anchor):
+        """Static detail label that is refreshed when its inventory probe reports."""
+        lbl = ttk.Label(parent, text=f"{prefix}: {getattr(self, group)[key]}", style="CardSub.TLabel")
+        lbl.pack(anchor=anchor)
+        self.static_labels.setdefault(group, []).append((lbl, key, prefix))
+        return lbl
+
+    def refresh_static_labels(self, group):
+        data = getattr(self, group)
+        for lbl, key, prefix in self.static_labels.get(group, []):
+            lbl.config(text=f"{prefix}: {data[key]}")
+
     def get_disk_static_advanced(self):
         disks = {}
         try:
             # 1. Get Physical Disk Info (Model, Type, Size) via PowerShell
             # We use PowerShell for MediaType detection (SSD/HDD)
             cmd = ["powershell", "-Command", "Get-PhysicalDisk | Select-Object DeviceID, Model, MediaType, Size, FriendlyName | ConvertTo-Json"]
-            res = subprocess.run(cmd, capture_output=True, text=True).stdout.strip()
+            res = subprocess.run(cmd, capture_output=True, text=True, timeout=10).stdout.strip()
             
             import json
             if res:
@@ -247,7 +322,7 @@ class RamCleanerGUI:
                     
             # Check Pagefile
             cmd = ["wmic", "pagefile", "get", "Caption"]
-            res = subprocess.run(cmd, capture_output=True, text=True).stdout.lower()
+            res = subprocess.run(cmd, capture_output=True, text=True, timeout=10).stdout.lower()
             if "pagefile.sys" in res and disks:
                 first_key = list(disks.keys())[0]
                 disks[first_key]["pagefile"] = "Yes"
@@ -260,7 +335,7 @@ class RamCleanerGUI:
         try:
             # PowerShell to get VideoController info including Driver info
             cmd = ["powershell", "-Command", "Get-CimInstance Win32_VideoController | Select-Object Name, DriverVersion, DriverDate, AdapterRAM, PNPDeviceID | ConvertTo-Json"]
-            res = subprocess.run(cmd, capture_output=True, text=True).stdout.strip()
+            res = subprocess.run(cmd, capture_output=True, text=True, timeout=10).stdout.strip()
             
             import json
             if res:
@@ -309,7 +384,7 @@ class RamCleanerGUI:
         try:
             # Memory Chips
             cmd = ["wmic", "memorychip", "get", "Speed,FormFactor,DeviceLocator,Capacity"]
-            res = subprocess.run(cmd, capture_output=True, text=True)
+            res = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
             lines = [l.strip() for l in res.stdout.split('\n') if l.strip()]
             
             if len(lines) > 1:
@@ -327,7 +402,7 @@ class RamCleanerGUI:
             
             # Total Slots
             cmd = ["wmic", "memphysical", "get", "MemoryDevices"]
-            res = subprocess.run(cmd, capture_output=True, text=True)
+            res = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
             lines = [l.strip() for l in res.stdout.split('\n') if l.strip()]
             if len(lines) > 1:
                 d["slots"] = f"{d.get('slots_used', 0)} of {lines[1]}"
@@ -335,7 +410,7 @@ class RamCleanerGUI:
             # Hardware Reserved
             # Total Installed - Available to OS
             cmd = ["powershell", "-Command", "(Get-CimInstance Win32_ComputerSystem).TotalPhysicalMemory"]
-            res = subprocess.run(cmd, capture_output=True, text=True).stdout.strip()
+            res = subprocess.run(cmd, capture_output=True, text=True, timeout=10).stdout.strip()
             if res.isdigit():
                 total_installed = int(res)
                 total_os = psutil.virtual_memory().total
@@ -364,7 +439,7 @@ class RamCleanerGUI:
             # Or Win32_Processor: L2CacheSize, L3CacheSize, VirtualizationFirmwareEnabled
             
             cmd = ["wmic", "cpu", "get", "L2CacheSize,L3CacheSize,VirtualizationFirmwareEnabled"]
-            res = subprocess.run(cmd, capture_output=True, text=True)
+            res = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
             # Output:
             # L2CacheSize  L3CacheSize  VirtualizationFirmwareEnabled
             # 1280         12288        TRUE
@@ -395,10 +470,10 @@ class RamCleanerGUI:
         # Method 1: PowerShell (Fast)
         try:
             cmd = ["powershell", "-Command", "Get-CimInstance -ClassName Win32_Battery | Select-Object -ExpandProperty DesignCapacity"]
-            res_des = subprocess.run(cmd, capture_output=True, text=True).stdout.strip()
+            res_des = subprocess.run(cmd, capture_output=True, text=True, timeout=10).stdout.strip()
             
             cmd = ["powershell", "-Command", "Get-CimInstance -ClassName Win32_Battery | Select-Object -ExpandProperty FullChargeCapacity"]
-            res_full = subprocess.run(cmd, capture_output=True, text=True).stdout.strip()
+            res_full = subprocess.run(cmd, capture_output=True, text=True, timeout=10).stdout.strip()
             
             if res_des and res_des.isdigit(): des = f"{res_des} mWh"
             if res_full and res_full.isdigit(): full = f"{res_full} mWh"
@@ -409,7 +484,7 @@ class RamCleanerGUI:
             try:
                 report_file = "battery_report.xml"
                 # Generate report
-                subprocess.run(['powercfg', '/batteryreport', '/output', report_file, '/xml'], capture_output=True, creationflags=0x08000000) # CREATE_NO_WINDOW
+                subprocess.run(['powercfg', '/batteryreport', '/output', report_file, '/xml'], capture_output=True, timeout=15, creationflags=0x08000000) # CREATE_NO_WINDOW
                 
                 if os.path.exists(report_file):
                     with open(report_file, 'r', encoding='utf-8') as f:
@@ -459,21 +534,46 @@ class RamCleanerGUI:
         except: pass
         return info
 
-    def init_csv(self):
-        if not os.path.exists(self.csv_file):
-            with open(self.csv_file, mode='w', newline='') as file:
-                writer = csv.writer(file)
-                writer.writerow(["Timestamp", "RAM%", "CPU%", "Battery%", "DiskSpeed(MB/s)", "NetSpeed(KB/s)", "Opt"])
+    def init_csv(self, config):
+        """Batched, rotating CSV log written on its own thread (metrics_log.py)"""
+        durability = config.get('csv_durability', "flush")
+        if durability not in DURABILITY_MODES:
+            print(f"Unknown csv_durability '{durability}', using 'flush'")
+            durability = "flush"
+        self.csv_logger = CsvLogger(
+            self.csv_file,
+            ["Timestamp", "RAM%", "CPU%", "Battery%", "DiskSpeed(MB/s)", "NetSpeed(KB/s)", "Opt"],
+            flush_interval=config.get('csv_flush_interval', 5.0),
+            max_bytes=int(config.get('csv_max_mb', 10) * 1024 * 1024),
+            rotate_daily=config.get('csv_rotate_daily', True),
+            backups=config.get('csv_backups', 7),
+            durability=durability)
+
+        # Optional binary log: mmap ring of fixed-size records (metrics_ring.py)
+        self.metrics_ring = None
+        if config.get('binary_log', False):
+            try:
+                self.metrics_ring = MetricsRing(self.ring_file, RING_FIELDS,
+                                                capacity=config.get('binary_log_capacity', 172800))
+            except (OSError, ValueError) as e:
+                print(f"Binary log disabled: {e}")
 
     def log_csv(self, ram, cpu, batt, disk, net, opt=""):
+        now = datetime.now()
+        # Only queues the row: the monitor thread never waits for the disk
+        self.csv_logger.log([
+            now.strftime("%Y-%m-%d %H:%M:%S"),
+            ram, cpu, batt, f"{disk:.2f}", f"{net:.2f}", opt
+        ])
         try:
-            with open(self.csv_file, mode='a', newline='') as file:
-                writer = csv.writer(file)
-                writer.writerow([
-                    datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    ram, cpu, batt, f"{disk:.2f}", f"{net:.2f}", opt
-                ])
-        except Exception: pass
+            batt_p = float(str(batt).rstrip('%'))
+        except ValueError:
+            batt_p = float('nan')
+        self.metrics_store.add(now.timestamp(), {
+            "ram_p": ram, "cpu_p": cpu, "battery_p": None if batt_p != batt_p else batt_p,
+            "disk_mb_s": disk, "net_kb_s": net})
+        if self.metrics_ring is not None:
+            self.metrics_ring.append(now.timestamp(), (ram, cpu, batt_p, disk, net, 1.0 if opt else 0.0))
 
     def create_widgets(self):
         container = ttk.Frame(self.root, padding=20)
@@ -543,12 +643,12 @@ class RamCleanerGUI:
         r5.columnconfigure(0, weight=1); r5.columnconfigure(1, weight=1)
         
         l = ttk.Frame(r5, style="Card.TFrame"); l.grid(row=0, column=0, sticky="nw")
-        ttk.Label(l, text=f"Speed: {self.ram_static['speed']}", style="CardSub.TLabel").pack(anchor="w")
-        ttk.Label(l, text=f"Slots used: {self.ram_static['slots']}", style="CardSub.TLabel").pack(anchor="w")
+        self.static_label(l, "ram_static", "speed", "Speed", "w")
+        self.static_label(l, "ram_static", "slots", "Slots used", "w")
         
         r = ttk.Frame(r5, style="Card.TFrame"); r.grid(row=0, column=1, sticky="ne")
-        ttk.Label(r, text=f"Form factor: {self.ram_static['form']}", style="CardSub.TLabel").pack(anchor="e")
-        ttk.Label(r, text=f"Hardware reserved: {self.ram_static['hw_res']}", style="CardSub.TLabel").pack(anchor="e")
+        self.static_label(r, "ram_static", "form", "Form factor", "e")
+        self.static_label(r, "ram_static", "hw_res", "Hardware reserved", "e")
 
         # DISPLAY (Col 2-3) - Moved here, separated from CPU
         card_disp = self.create_card(grid, "DISPLAY", 0, 2, colspan=2)
@@ -606,16 +706,16 @@ class RamCleanerGUI:
         
         # Left Col
         l = ttk.Frame(r4, style="Card.TFrame"); l.grid(row=0, column=0, sticky="nw")
-        ttk.Label(l, text=f"Base Speed: {self.cpu_static['base_speed']}", style="CardSub.TLabel").pack(anchor="w")
-        ttk.Label(l, text=f"Sockets: {self.cpu_static['sockets']}", style="CardSub.TLabel").pack(anchor="w")
-        ttk.Label(l, text=f"Cores: {self.cpu_static['cores']}", style="CardSub.TLabel").pack(anchor="w")
-        ttk.Label(l, text=f"Logical: {self.cpu_static['logical']}", style="CardSub.TLabel").pack(anchor="w")
+        self.static_label(l, "cpu_static", "base_speed", "Base Speed", "w")
+        self.static_label(l, "cpu_static", "sockets", "Sockets", "w")
+        self.static_label(l, "cpu_static", "cores", "Cores", "w")
+        self.static_label(l, "cpu_static", "logical", "Logical", "w")
         
         # Right Col
         r = ttk.Frame(r4, style="Card.TFrame"); r.grid(row=0, column=1, sticky="ne")
-        ttk.Label(r, text=f"Virtualization: {self.cpu_static['virt']}", style="CardSub.TLabel").pack(anchor="e")
-        ttk.Label(r, text=f"L2 Cache: {self.cpu_static['l2']}", style="CardSub.TLabel").pack(anchor="e")
-        ttk.Label(r, text=f"L3 Cache: {self.cpu_static['l3']}", style="CardSub.TLabel").pack(anchor="e")
+        self.static_label(r, "cpu_static", "virt", "Virtualization", "e")
+        self.static_label(r, "cpu_static", "l2", "L2 Cache", "e")
+        self.static_label(r, "cpu_static", "l3", "L3 Cache", "e")
 
         # GPU (Col 3-5)
         # We will use a container for dynamic GPU cards
@@ -765,11 +865,11 @@ class RamCleanerGUI:
                 nonpaged_val = f"{round((pi.KernelNonPaged * pg_size)/(1024**2), 0)} MB"
                 
                 # Compressed (Approx via PowerShell - Memory Compression process)
-                # This is slow, maybe once every 5 iterations?
+                # Runs in the shared persistent session instead of spawning PowerShell
                 comp_val = "0.0 GB"
                 try:
-                    cmd = ["powershell", "-Command", "Get-Process -Name 'Memory Compression' -ErrorAction SilentlyContinue | Select-Object -ExpandProperty WorkingSet"]
-                    res = subprocess.run(cmd, capture_output=True, text=True).stdout.strip()
+                    cmd = "Get-Process -Name 'Memory Compression' -ErrorAction SilentlyContinue | Select-Object -ExpandProperty WorkingSet"
+                    res = get_broker().query(cmd, timeout=2)
                     if res and res.isdigit():
                         comp_val = f"{round(int(res)/(1024**3), 1)} GB"
                 except: pass
@@ -825,55 +925,35 @@ class RamCleanerGUI:
                 # Shared system memory (approx 50% of total RAM)
                 shared_mem_gb = self.total_ram_gb / 2.0
                 
+                # All NVIDIA fields for all GPUs come from one shared stream
+                nv_gpus = get_gpu_telemetry().gpus()
+                nv_idx = 0  # Assume NVIDIA cards in the static list follow nvidia-smi index order
+                
                 for i, g in enumerate(self.gpu_static_list):
                     # Default values
                     util = "--%"
                     mem_used = "0.0"
                     mem_tot = g['dedicated_static']
                     shared_used = "0.0" # Hard to get per-process without PerfCounters
+                    g_temp = "-- °C"
                     
                     is_nvidia = "nvidia" in g['name'].lower()
                     
                     # Nvidia Realtime
                     if is_nvidia:
-                        try:
-                            # Index might match, but let's just query all and assume order or use ID?
-                            # Using -i 0, -i 1 if we knew index. Assuming list order matches nvidia-smi indices if multiple?
-                            # Safer: just query index 0 if one nvidia card.
-                            # We'll just run a query for ALL nvidia cards and try to map?
-                            # Simplification: Query nvidia-smi for the first NV card found.
-                            proc_res = subprocess.run(['nvidia-smi', '--query-gpu=utilization.gpu,memory.used,memory.total', '--format=csv,noheader,nounits'], capture_output=True, text=True)
-                            if proc_res.returncode == 0:
-                                # Lines for each GPU
-                                nv_lines = [l for l in proc_res.stdout.strip().split('\n') if l]
-                                # If we have multiple NV cards, we need to track which one in the static list matches.
-                                # For this script, assume the first Nvidia card in static list matches first in smi.
-                                nv_idx = 0 
-                                # This logic is fragile for mixed multi-gpu but fine for most laptops.
-                                p = nv_lines[nv_idx].split(', ')
-                                util = f"{p[0]}%"
-                                mem_used = f"{float(p[1])/1024:.1f}" # MB -> GB
-                                mem_tot = f"{float(p[2])/1024:.1f} GB"
-                        except: pass
+                        if nv_idx < len(nv_gpus):
+                            nv = nv_gpus[nv_idx]
+                            if nv['util'] is not None: util = f"{nv['util']:.0f}%"
+                            if nv['mem_used'] is not None: mem_used = f"{nv['mem_used']/1024:.1f}" # MB -> GB
+                            if nv['mem_total'] is not None: mem_tot = f"{nv['mem_total']/1024:.1f} GB"
+                            if nv['temp'] is not None: g_temp = f"{nv['temp']:.0f} °C"
+                        nv_idx += 1
                     else:
                         # Integrated (Intel/AMD)
                         # Utilization is hard. Win10 task manager uses Engine Utilization.
                         # We will leave Util as "--%" to be honest, or "0%" if inactive.
                         # For Memory, they use Shared.
                         mem_tot = "0.1 GB" if g['dedicated_static'] == "N/A" else g['dedicated_static']
-                        pass
-
-                    # GPU Temp matching (Heuristic)
-                    g_temp = "-- °C"
-                    if is_nvidia:
-                        # Try nvidia-smi temp
-                        try:
-                            # We can re-use the smi call from earlier if we optimized, but for now:
-                            proc_res = subprocess.run(['nvidia-smi', '--query-gpu=temperature.gpu', '--format=csv,noheader,nounits'], capture_output=True, text=True)
-                            if proc_res.returncode == 0:
-                                t_lines = [l for l in proc_res.stdout.strip().split('\n') if l]
-                                if t_lines: g_temp = f"{t_lines[0]} °C"
-                        except: pass
                     
                     curr_gpus.append({
                         "name": g['name'],
@@ -886,85 +966,43 @@ class RamCleanerGUI:
                         "temp": g_temp
                     })
 
-                # 5. Disk/Net Calc
-                now = time.time()
-                dt = now - self.last_check_time
-                if dt <= 0: dt = 0.5 # fallback
+                # 5. Disk/Net Calc (one read of each counter set, all rates in one pass)
+                disk_rates = self.rates.update_disks(psutil.disk_io_counters(perdisk=True) or {})
+                nic_rates = self.rates.update_nics(psutil.net_io_counters(pernic=True))
                 
-                dio = psutil.disk_io_counters(perdisk=True)
-                nio = psutil.net_io_counters()
-                
-                # Total Speed & Per Disk String
+                # Per Disk String
                 drive_lines = []
-                total_r_mb = 0.0
-                total_w_mb = 0.0
-                
-                for dname, cnt in dio.items():
-                    if dname in self.last_disk_io:
-                        prev = self.last_disk_io[dname]
-                        r = (cnt.read_bytes - prev.read_bytes)/1024/1024/dt
-                        w = (cnt.write_bytes - prev.write_bytes)/1024/1024/dt
-                        total_r_mb += r
-                        total_w_mb += w
-                        
-                        # Show all drives, even if idle
-                        short = dname.replace("PhysicalDrive", "Drive ")
-                        drive_lines.append(f"{short}: R:{r:.1f} W:{w:.1f} MB/s")
+                for dname, rate in disk_rates.items():
+                    # Show all drives, even if idle
+                    short = dname.replace("PhysicalDrive", "Drive ")
+                    drive_lines.append(f"{short}: R:{rate['read_bytes_s']/1024/1024:.1f} W:{rate['write_bytes_s']/1024/1024:.1f} MB/s")
                 
                 disk_io_str = "\n".join(drive_lines) if drive_lines else "No Drives Found"
                 
                 # Disk Monitoring (Advanced)
                 drive_details = []
-                total_r_mb_sum = 0.0
-                total_w_mb_sum = 0.0
+                for dname, rate in disk_rates.items():
+                    r_mb = rate['read_bytes_s']/1024/1024
+                    w_mb = rate['write_bytes_s']/1024/1024
+                    
+                    # Static info merge
+                    static = self.disk_static.get(dname, {"model": "Unknown", "type": "Fixed", "size": "--", "system": "No", "pagefile": "No"})
+                    
+                    drive_details.append({
+                        "name": dname.replace("PhysicalDrive", "Disk "),
+                        "active": f"{rate['busy_p']:.0f}%",
+                        "read": f"{r_mb:.1f} MB/s" if r_mb > 0.1 else f"{r_mb*1024:.0f} KB/s",
+                        "write": f"{w_mb:.1f} MB/s" if w_mb > 0.1 else f"{w_mb*1024:.0f} KB/s",
+                        "latency": f"{rate['latency_ms']:.1f} ms",
+                        **static
+                    })
                 
-                for dname, cnt in dio.items():
-                    if dname in self.last_disk_io:
-                        prev = self.last_disk_io[dname]
-                        
-                        # Throughput
-                        r_mb = (cnt.read_bytes - prev.read_bytes)/1024/1024/dt
-                        w_mb = (cnt.write_bytes - prev.write_bytes)/1024/1024/dt
-                        total_r_mb_sum += r_mb
-                        total_w_mb_sum += w_mb
-                        
-                        # Active Time % (busy_time is in ms)
-                        if hasattr(cnt, 'busy_time'):
-                            busy_ms = cnt.busy_time - prev.busy_time
-                        else:
-                            # Fallback for Windows: Sum of read/write times
-                            # Note: This can exceed 100% if concurrent requests, so we cap it later
-                            busy_ms = (cnt.read_time - prev.read_time) + (cnt.write_time - prev.write_time)
-                            
-                        active_p = (busy_ms / (dt * 1000)) * 100
-                        active_p = min(100, max(0, active_p))
-                        
-                        # Avg Response Time (ms)
-                        # (delta_time_ms) / (delta_count)
-                        r_time = cnt.read_time - prev.read_time
-                        w_time = cnt.write_time - prev.write_time
-                        r_count = cnt.read_count - prev.read_count
-                        w_count = cnt.write_count - prev.write_count
-                        
-                        total_ops = r_count + w_count
-                        avg_resp = (r_time + w_time) / total_ops if total_ops > 0 else 0
-                        
-                        # Static info merge
-                        static = self.disk_static.get(dname, {"model": "Unknown", "type": "Fixed", "size": "--", "system": "No", "pagefile": "No"})
-                        
-                        drive_details.append({
-                            "name": dname.replace("PhysicalDrive", "Disk "),
-                            "active": f"{active_p:.0f}%",
-                            "read": f"{r_mb:.1f} MB/s" if r_mb > 0.1 else f"{r_mb*1024:.0f} KB/s",
-                            "write": f"{w_mb:.1f} MB/s" if w_mb > 0.1 else f"{w_mb*1024:.0f} KB/s",
-                            "latency": f"{avg_resp:.1f} ms",
-                            **static
-                        })
+                disk_total = self.rates.disk_total
+                total_r_mb_sum = disk_total['read_bytes_s']/1024/1024
+                total_w_mb_sum = disk_total['write_bytes_s']/1024/1024
 
                 # Network Monitoring (Advanced)
-                nio_dict = psutil.net_io_counters(pernic=True)
                 ifaces = psutil.net_if_addrs()
-                istats = psutil.net_if_stats()
                 
                 # Find active adapter (one with non-zero traffic and an IP)
                 active_iface = "--"
@@ -978,31 +1016,24 @@ class RamCleanerGUI:
                 max_traffic = -1
                 best_iface = None
                 
-                for iface, nio in nio_dict.items():
-                    if iface in self.last_net_io_dict:
-                        prev = self.last_net_io_dict[iface]
-                        traffic = (nio.bytes_sent - prev.bytes_sent) + (nio.bytes_recv - prev.bytes_recv)
-                        # Check if it has an IPv4
-                        has_ip = any(addr.family == 2 for addr in ifaces.get(iface, []))
-                        if has_ip and traffic > max_traffic:
-                            max_traffic = traffic
-                            best_iface = iface
+                for iface, rate in nic_rates.items():
+                    traffic = rate['send_bits_s'] + rate['recv_bits_s']
+                    # Check if it has an IPv4
+                    has_ip = any(addr.family == 2 for addr in ifaces.get(iface, []))
+                    if has_ip and traffic > max_traffic:
+                        max_traffic = traffic
+                        best_iface = iface
                 
                 if best_iface:
                     active_iface = best_iface
-                    prev = self.last_net_io_dict[best_iface]
-                    nio = nio_dict[best_iface]
-                    
-                    # Throughput Calc
-                    s_bps = ((nio.bytes_sent - prev.bytes_sent) * 8) / dt
-                    r_bps = ((nio.bytes_recv - prev.bytes_recv) * 8) / dt
+                    rate = nic_rates[best_iface]
                     
                     def fmt_bits(bits):
                         if bits > 1000000: return f"{bits/1000000:.1f} Mbps"
                         return f"{bits/1000:.1f} Kbps"
                     
-                    net_send_str = fmt_bits(s_bps)
-                    net_recv_str = fmt_bits(r_bps)
+                    net_send_str = fmt_bits(rate['send_bits_s'])
+                    net_recv_str = fmt_bits(rate['recv_bits_s'])
                     
                     # IPs
                     for addr in ifaces.get(best_iface, []):
@@ -1014,16 +1045,8 @@ class RamCleanerGUI:
                     elif "ethernet" in best_iface.lower(): conn_type = "Ethernet"
                 
                 # Total Network Speed (KB/s) for Logs/UI
-                # We need to calculate this from total counters to match previous logic
-                # nio_total is not available as a variable, so fetch it or sum it?
-                # Actually, self.last_net_io stores the *previous* total.
-                # Let's fetch current total again or sum the dict. Fetching is safer.
-                nio_total_curr = psutil.net_io_counters()
-                nsp_dn = (nio_total_curr.bytes_recv - self.last_net_io.bytes_recv) / 1024 / dt
-                nsp_up = (nio_total_curr.bytes_sent - self.last_net_io.bytes_sent) / 1024 / dt
-                
-                # Update total net io state
-                self.last_net_io = nio_total_curr
+                nsp_dn = self.rates.net_total['recv_bits_s'] / 8 / 1024
+                nsp_up = self.rates.net_total['send_bits_s'] / 8 / 1024
 
                 # Storage (All Drives) - RESTORED
                 d_str = ""
@@ -1039,15 +1062,9 @@ class RamCleanerGUI:
                 except: pass
                 if not d_str: d_str = "No Drives Found"
 
-                # Update State
-                self.last_disk_io = dio
-                self.last_net_io_dict = nio_dict
-                self.last_check_time = now
-
                 # Auto Optimize Trigger
-                if (ram_p >= self.threshold_ram or cpu >= self.threshold_cpu) and (time.time() - self.last_opt_time > 60):
-                     self.last_opt_time = time.time()
-                     self.start_opt(f"Auto >{self.threshold_ram}%RAM or >{self.threshold_cpu}%CPU")
+                if self.auto_optimize_enabled:
+                    self.policy.evaluate({"ram_p": ram_p, "cpu_p": cpu})
 
                 # Push to Shared Dict
                 self.ui_data = {
@@ -1080,7 +1097,8 @@ class RamCleanerGUI:
                 })
                 
                 # Log to CSV (Background)
-                self.log_csv(ram_p, cpu, lv, total_r_mb_sum + total_w_mb_sum, nsp_dn + nsp_up)
+                opt, self.last_opt = self.last_opt, ""
+                self.log_csv(ram_p, cpu, lv, total_r_mb_sum + total_w_mb_sum, nsp_dn + nsp_up, opt)
 
             except Exception as e:
                 print(f"Monitor Error: {e}")
@@ -1091,34 +1109,41 @@ class RamCleanerGUI:
         """Main thread loop to update labels from shared data."""
         d = self.ui_data
         
+        # Inventory probe results that arrived since the last tick
+        while not self.inventory_updates.empty():
+            name, value = self.inventory_updates.get_nowait()
+            self.apply_inventory(name, value)
+            if name in ("cpu", "ram"):
+                self.refresh_static_labels(f"{name}_static")
+        
         # RAM
-        self.lbl_ram_usage.config(text=f"{d['ram_p']}%")
-        self.lbl_ram_inuse.config(text=f"{d['ram_u']} GB ({d['ram_comp']})")
-        self.lbl_ram_avail.config(text=d['ram_avail'])
-        self.lbl_ram_comm.config(text=d['ram_comm'])
-        self.lbl_ram_cached.config(text=d['ram_cached'])
-        self.lbl_ram_paged.config(text=d['ram_paged'])
-        self.lbl_ram_nonpaged.config(text=d['ram_nonpaged'])
+        self.binder.config(self.lbl_ram_usage, text=f"{d['ram_p']}%")
+        self.binder.config(self.lbl_ram_inuse, text=f"{d['ram_u']} GB ({d['ram_comp']})")
+        self.binder.config(self.lbl_ram_avail, text=d['ram_avail'])
+        self.binder.config(self.lbl_ram_comm, text=d['ram_comm'])
+        self.binder.config(self.lbl_ram_cached, text=d['ram_cached'])
+        self.binder.config(self.lbl_ram_paged, text=d['ram_paged'])
+        self.binder.config(self.lbl_ram_nonpaged, text=d['ram_nonpaged'])
         
         # Display
-        self.lbl_res.config(text=d['res'])
-        self.lbl_monitors.config(text=d['monitors'])
+        self.binder.config(self.lbl_res, text=d['res'])
+        self.binder.config(self.lbl_monitors, text=d['monitors'])
         
         # Battery
-        self.lbl_batt_stat.config(text=d['bat_st'], foreground="#4caf50" if "Plugged" in d['bat_st'] else "#e0e0e0")
-        self.lbl_batt_lvl.config(text=d['bat_lv'])
-        self.lbl_batt_cap.config(text=d['bat_fl'])
-        self.lbl_batt_design.config(text=d['bat_ds'])
+        self.binder.config(self.lbl_batt_stat, text=d['bat_st'], foreground="#4caf50" if "Plugged" in d['bat_st'] else "#e0e0e0")
+        self.binder.config(self.lbl_batt_lvl, text=d['bat_lv'])
+        self.binder.config(self.lbl_batt_cap, text=d['bat_fl'])
+        self.binder.config(self.lbl_batt_design, text=d['bat_ds'])
         
         # CPU
-        self.lbl_cpu_load.config(text=f"{d['cpu']}%")
-        self.lbl_speed.config(text=f"Speed: {d['speed']}")
-        self.lbl_uptime.config(text=f"Up: {d['uptime']}")
-        self.lbl_proc.config(text=str(d['proc']))
-        self.lbl_thr.config(text=str(d['thr']))
-        self.lbl_hnd.config(text=str(d['hnd']))
-        self.lbl_cpu_temp.config(text=d['cpu_temp'])
-        self.lbl_fan.config(text=d['fan_speed'])
+        self.binder.config(self.lbl_cpu_load, text=f"{d['cpu']}%")
+        self.binder.config(self.lbl_speed, text=f"Speed: {d['speed']}")
+        self.binder.config(self.lbl_uptime, text=f"Up: {d['uptime']}")
+        self.binder.config(self.lbl_proc, text=str(d['proc']))
+        self.binder.config(self.lbl_thr, text=str(d['thr']))
+        self.binder.config(self.lbl_hnd, text=str(d['hnd']))
+        self.binder.config(self.lbl_cpu_temp, text=d['cpu_temp'])
+        self.binder.config(self.lbl_fan, text=d['fan_speed'])
         
         # GPU (Dynamic)
         gpus = d.get('gpu_list', [])
@@ -1131,7 +1156,8 @@ class RamCleanerGUI:
                 
                 # Header: Name + Util
                 h = ttk.Frame(f, style="Card.TFrame"); h.pack(fill=tk.X)
-                ttk.Label(h, text=g['name'], style="CardHeader.TLabel", font=("Segoe UI", 10, "bold")).pack(side=tk.LEFT)
+                lbl_name = ttk.Label(h, text=g['name'], style="CardHeader.TLabel", font=("Segoe UI", 10, "bold"))
+                lbl_name.pack(side=tk.LEFT)
                 lbl_util = ttk.Label(h, text="--%", style="CardValue.TLabel", font=("Segoe UI", 11, "bold"))
                 lbl_util.pack(side=tk.RIGHT)
                 
@@ -1154,26 +1180,32 @@ class RamCleanerGUI:
                 sg = ttk.Frame(f, style="Card.TFrame"); sg.pack(fill=tk.X)
                 sg.columnconfigure(0, weight=1); sg.columnconfigure(1, weight=1)
                 
-                ttk.Label(sg, text=f"Driver: {g['driver']}", style="CardSub.TLabel").grid(row=0, column=0, sticky="w")
-                ttk.Label(sg, text=f"Date: {g['date']}", style="CardSub.TLabel").grid(row=0, column=1, sticky="e")
-                ttk.Label(sg, text=f"Loc: {g['loc']}", style="CardSub.TLabel").grid(row=1, column=0, sticky="w")
+                l_drv = ttk.Label(sg, text=f"Driver: {g['driver']}", style="CardSub.TLabel"); l_drv.grid(row=0, column=0, sticky="w")
+                l_date = ttk.Label(sg, text=f"Date: {g['date']}", style="CardSub.TLabel"); l_date.grid(row=0, column=1, sticky="e")
+                l_loc = ttk.Label(sg, text=f"Loc: {g['loc']}", style="CardSub.TLabel"); l_loc.grid(row=1, column=0, sticky="w")
                 
-                self.gpu_widgets[key] = {'util': lbl_util, 'mem': l_mem, 'shar': l_shar, 'temp': l_temp}
+                self.gpu_widgets[key] = {'util': lbl_util, 'mem': l_mem, 'shar': l_shar, 'temp': l_temp,
+                                         'name': lbl_name, 'driver': l_drv, 'date': l_date, 'loc': l_loc}
             
             # Update
             w = self.gpu_widgets[key]
-            w['util'].config(text=g['util'])
-            w['mem'].config(text=g['mem_usage'])
-            w['shar'].config(text=g['shared_usage'])
-            w['temp'].config(text=g['temp'])
+            # Static details can arrive after the card was built
+            self.binder.config(w['name'], text=g['name'])
+            self.binder.config(w['driver'], text=f"Driver: {g['driver']}")
+            self.binder.config(w['date'], text=f"Date: {g['date']}")
+            self.binder.config(w['loc'], text=f"Loc: {g['loc']}")
+            self.binder.config(w['util'], text=g['util'])
+            self.binder.config(w['mem'], text=g['mem_usage'])
+            self.binder.config(w['shar'], text=g['shared_usage'])
+            self.binder.config(w['temp'], text=g['temp'])
 
         # I/O & Disks
-        self.lbl_net_send.config(text=d['net_send'])
-        self.lbl_net_recv.config(text=d['net_recv'])
-        self.lbl_net_adapter.config(text=f"Adapter: {d['net_adapter']}")
-        self.lbl_net_type.config(text=f"Type: {d['net_type']}")
-        self.lbl_net_ipv4.config(text=f"IPv4: {d['net_ipv4']}")
-        self.lbl_net_ipv6.config(text=f"IPv6: {d['net_ipv6']}")
+        self.binder.config(self.lbl_net_send, text=d['net_send'])
+        self.binder.config(self.lbl_net_recv, text=d['net_recv'])
+        self.binder.config(self.lbl_net_adapter, text=f"Adapter: {d['net_adapter']}")
+        self.binder.config(self.lbl_net_type, text=f"Type: {d['net_type']}")
+        self.binder.config(self.lbl_net_ipv4, text=f"IPv4: {d['net_ipv4']}")
+        self.binder.config(self.lbl_net_ipv6, text=f"IPv6: {d['net_ipv6']}")
         
         # Sync Disk Widgets
         curr_disks = d.get('drive_details', [])
@@ -1211,19 +1243,23 @@ class RamCleanerGUI:
                 # Static info
                 st = ttk.Frame(f, style="Card.TFrame")
                 st.pack(fill=tk.X)
-                ttk.Label(st, text=f"Capacity: {drive['size']}", style="CardSub.TLabel").pack(anchor="w")
-                ttk.Label(st, text=f"Type: {drive['type']}", style="CardSub.TLabel").pack(anchor="w")
-                ttk.Label(st, text=f"System disk: {drive['system']}", style="CardSub.TLabel").pack(anchor="w")
-                ttk.Label(st, text=f"Page file: {drive['pagefile']}", style="CardSub.TLabel").pack(anchor="w")
+                for field in ('size', 'type', 'system', 'pagefile'):
+                    lbls[field] = ttk.Label(st, text="--", style="CardSub.TLabel")
+                    lbls[field].pack(anchor="w")
                 
                 self.disk_widgets[name] = lbls
             
             # Update values
             w = self.disk_widgets[name]
-            w['active'].config(text=drive['active'])
-            w['latency'].config(text=drive['latency'])
-            w['read'].config(text=drive['read'])
-            w['write'].config(text=drive['write'])
+            # Disk inventory can arrive after the card was built
+            self.binder.config(w['size'], text=f"Capacity: {drive['size']}")
+            self.binder.config(w['type'], text=f"Type: {drive['type']}")
+            self.binder.config(w['system'], text=f"System disk: {drive['system']}")
+            self.binder.config(w['pagefile'], text=f"Page file: {drive['pagefile']}")
+            self.binder.config(w['active'], text=drive['active'])
+            self.binder.config(w['latency'], text=drive['latency'])
+            self.binder.config(w['read'], text=drive['read'])
+            self.binder.config(w['write'], text=drive['write'])
         
         self.root.after(self.monitor_interval, self.update_ui)
 
@@ -1233,6 +1269,10 @@ class RamCleanerGUI:
         self.log_area.see(tk.END); self.log_area.config(state='disabled')
 
     def start_opt(self, r):
+        # One pass at a time: a trim during another pass's settle skews its refaults
+        if not self.trimmer.try_begin():
+            self.root.after(0, lambda: self.log_msg(f"Optimization still running, skipped ({r})"))
+            return
         threading.Thread(target=self.opt, args=(r,), daemon=True).start()
 
     def toggle_net_load(self):
@@ -1264,12 +1304,21 @@ class RamCleanerGUI:
                 time.sleep(1)
 
     def opt(self, r):
+        """One trim pass and its settle (start_opt holds trimmer.try_begin())."""
+        self.last_opt = r
         self.root.after(0, lambda: self.log_msg(f"Optimizing ({r})..."))
-        gc.collect()
-        c = 0
-        for p in psutil.process_iter(['pid']):
-            if empty_working_set(p.info['pid']): c += 1
-        self.root.after(0, lambda: self.log_msg(f"Done. Trimming {c} processes."))
+        try:
+            gc.collect()
+            report = self.trimmer.run()
+            self.root.after(0, lambda: self.log_msg(f"Done. {report.summary()}"))
+            self.trimmer.settle(report)
+        finally:
+            self.trimmer.end()
+        if report.settle_s is not None:
+            net = report.net_reclaimed / (1024 * 1024)
+            self.root.after(0, lambda: self.log_msg(f"After {report.settle_s:.0f}s: {net:.1f} MB still free"))
+        if report.thrashing:
+            self.root.after(0, lambda: self.log_msg(f"Refaulting, skipped next time: {', '.join(report.thrashing)}"))
 
     def show_analytics(self):
         """Opens a window to view Real-time Analytics with updating graphs."""
@@ -1300,16 +1349,29 @@ class RamCleanerGUI:
             tree.heading(col, text=col)
             tree.column(col, width=100)
 
-        if os.path.exists(self.csv_file):
+        if self.metrics_ring is not None:
+            # Binary log: the last 100 records straight from the mapping, no parsing
+            for ts, ram, cpu, batt, disk, net, optimized in reversed(self.metrics_ring.last(100)):
+                tree.insert("", tk.END, values=(
+                    datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S"), f"{ram:g}", f"{cpu:g}",
+                    "--" if batt != batt else f"{batt:.0f}%", f"{disk:.2f}", f"{net:.2f}",
+                    "Yes" if optimized else ""))
+        else:
+            # Any of the CSV layouts, newest rows first (log_reader.py)
+            self.csv_logger.flush()
             try:
-                with open(self.csv_file, mode='r') as file:
-                    reader = csv.reader(file)
-                    next(reader) # header
-                    data = list(reader)
-                    for row in reversed(data[-100:]):
-                        while len(row) < len(cols): row.append("")
-                        tree.insert("", tk.END, values=row[:len(cols)])
-            except Exception: pass
+                data = read_recent(self.csv_logger.files(), 100)
+            except Exception as e:
+                print(f"Log read error: {e}")
+                data = LogData()
+
+            cols = [[format_time(t) for t in data.column("timestamp")]]
+            for name, fmt in (("ram_p", "{:g}"), ("cpu_p", "{:g}"), ("battery_p", "{:.0f}%"),
+                              ("disk_mb_s", "{:.2f}"), ("net_kb_s", "{:.2f}")):
+                cols.append(["--" if v != v else fmt.format(v) for v in data.column(name)])
+            cols.append(data.column("reason", text=True))
+            for row in reversed(list(zip(*cols))):
+                tree.insert("", tk.END, values=row)
 
         # --- Tab 1: Live Graphs ---
         if not HAS_MATPLOTLIB:
@@ -1319,6 +1381,18 @@ class RamCleanerGUI:
         import matplotlib.pyplot as plt
         plt.style.use('dark_background')
         
+        # Span: live in-memory history, or the metrics store tier that fits the span
+        spans = {"Live (60s)": None, "Last hour": 3600, "Last 24 hours": 86400,
+                 "Last 7 days": 7 * 86400, "Last 30 days": 30 * 86400}
+        span_var = tk.StringVar(value="Live (60s)")
+        span_bar = ttk.Frame(tab_graph)
+        span_bar.pack(side=tk.TOP, fill=tk.X)
+        ttk.Label(span_bar, text="Range:").pack(side=tk.LEFT, padx=(0, 5))
+        span_box = ttk.Combobox(span_bar, textvariable=span_var, values=list(spans),
+                                state="readonly", width=15)
+        span_box.pack(side=tk.LEFT)
+        stored = {"span": None, "at": 0.0}  # Last store query, refreshed every 10 s
+        
         fig = Figure(figsize=(10, 8), dpi=100, facecolor=ModernDarkTheme.BG_COLOR)
         ax1 = fig.add_subplot(111)
         
@@ -1331,40 +1405,58 @@ class RamCleanerGUI:
         toolbar = NavigationToolbar2Tk(canvas, toolbar_frame)
         toolbar.update()
 
-        def update_graphs():
-            if not win.winfo_exists(): return
-            
-            # Fetch latest history
-            data_points = list(self.history)
-            if not data_points: 
-                win.after(1000, update_graphs)
-                return
-
-            times = [d['time'] for d in data_points]
-            ram_v = [d['ram'] for d in data_points]
-            cpu_v = [d['cpu'] for d in data_points]
-
-            # Clear Ax1
+        def plot(times, ram_v, cpu_v, title, time_format):
             ax1.clear()
             ax1.set_facecolor(ModernDarkTheme.CARD_BG)
             ax1.plot(times, ram_v, color="#00bcd4", label="RAM %", lw=1.5)
             ax1.fill_between(times, ram_v, color="#00bcd4", alpha=0.1)
             ax1.plot(times, cpu_v, color="#ff4081", label="CPU %", lw=1.5)
-            ax1.set_title("Live System Load (Last 60s)", color="white")
+            ax1.set_title(title, color="white")
             ax1.legend(loc='upper left', facecolor=ModernDarkTheme.CARD_BG, edgecolor='#444', labelcolor='white')
             ax1.grid(color='#333', linestyle='--')
-            ax1.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M:%S'))
+            ax1.xaxis.set_major_formatter(mdates.DateFormatter(time_format))
 
             fig.tight_layout()
             canvas.draw()
+
+        def update_graphs():
+            if not win.winfo_exists(): return
+            
+            span = spans.get(span_var.get())
+            if span is None:
+                # Fetch latest history
+                data_points = list(self.history)
+                if data_points:
+                    plot([d['time'] for d in data_points], [d['ram'] for d in data_points],
+                         [d['cpu'] for d in data_points], "Live System Load (Last 60s)", '%H:%M:%S')
+            elif stored["span"] != span or time.time() - stored["at"] >= 10:
+                stored["span"], stored["at"] = span, time.time()
+                now = time.time()
+                try:
+                    tier, rows = self.metrics_store.query(now - span, now, ("ram_p", "cpu_p"))
+                except Exception as e:
+                    print(f"History query error: {e}")
+                    tier, rows = None, []
+                if rows:
+                    plot([datetime.fromtimestamp(r[0]) for r in rows],
+                         [r[1] if r[1] is not None else float('nan') for r in rows],
+                         [r[2] if r[2] is not None else float('nan') for r in rows],
+                         f"System Load ({span_var.get()}, {tier} data)",
+                         '%H:%M' if span <= 86400 else '%m-%d %H:%M')
             
             # Schedule next update
             win.after(1000, update_graphs)
 
+        span_box.bind("<<ComboboxSelected>>", lambda e: stored.update(span=None))
+
         # Start loop
         update_graphs()
 
 if __name__ == "__main__":
     root = tk.Tk()
-    RamCleanerGUI(root)
+    app = RamCleanerGUI(root)
     root.mainloop()
+    app.csv_logger.close()
+    app.metrics_store.close()
+    if app.metrics_ring is not None:
+        app.metrics_ring.close()
@@ -1,29 +1,35 @@
-import ctypes
 import gc
 import psutil
+import threading
 import time
 from datetime import datetime
 
-# --- Windows API setup for RAM cleaning ---
-psapi = ctypes.WinDLL('psapi.dll')
-kernel32 = ctypes.WinDLL('kernel32.dll')
+from optimizer import WorkingSetTrimmer
 
-def empty_working_set(pid):
-    """Trim memory usage of a process without closing it."""
-    hProcess = kernel32.OpenProcess(0x001F0FFF, False, pid)
-    if hProcess:
-        psapi.EmptyWorkingSet(hProcess)
-        kernel32.CloseHandle(hProcess)
+trimmer = WorkingSetTrimmer()
 
 def optimize_ram():
-    """Run garbage collection and trim all processes."""
-    gc.collect()
-    for proc in psutil.process_iter(['pid', 'name']):
-        try:
-            empty_working_set(proc.info['pid'])
-        except Exception:
-            pass
-    print("✅ RAM optimized")
+    """Run garbage collection and trim the largest working sets."""
+    if not trimmer.try_begin():
+        print("⏳ Previous RAM optimization still settling, skipping this pass")
+        return
+    try:
+        gc.collect()
+        report = trimmer.run()
+        print(f"✅ RAM optimized: {report.summary()}")
+        # Measure refaults in the background so the monitor loop keeps its pace
+        threading.Thread(target=settle, args=(report,), daemon=True).start()
+    except Exception:
+        trimmer.end()
+        raise
+
+def settle(report):
+    try:
+        trimmer.settle(report)
+    finally:
+        trimmer.end()
+    if report.settle_s is not None:
+        print(f"📉 RAM optimization settled: {report.summary()}")
 
 def optimize_cpu():
     """Lower priority of high-CPU processes (instead of killing)."""
@@ -0,0 +1,143 @@
+"""Counter-delta rate engine for disk and network I/O.
+
+Disk and NIC statistics are cumulative counters. ``RateEngine`` takes each
+counter set once per tick, diffs it against the previous tick and derives
+every rate the pages show in a single pass:
+
+    disks: read/write bytes/s, read/write IOPS, busy %, average latency (ms)
+    nics:  send/receive bits/s
+
+Counters can be psutil named tuples or plain dicts. A counter that goes
+backwards is treated as a 32-bit wraparound when that gives a plausible
+delta, otherwise as a reset (device re-enumerated, driver reload, resume
+from sleep) and contributes zero for that tick.
+
+Fields a platform doesn't count stay None rather than 0; Windows has no
+``busy_time``, so busy % falls back to read_time + write_time::
+
+    >>> from collections import namedtuple
+    >>> sdiskio = namedtuple("sdiskio", "read_count write_count read_bytes "
+    ...                      "write_bytes read_time write_time")
+    >>> engine = RateEngine()
+    >>> _ = engine.update_disks({"C:": sdiskio(0, 0, 0, 0, 0, 0)}, now=0.0)
+    >>> engine.update_disks({"C:": sdiskio(10, 10, 0, 0, 600, 400)}, now=1.0)["C:"]["busy_p"]
+    100.0
+"""
+import threading
+import time
+
+WRAP_32 = 2 ** 32
+
+DISK_FIELDS = ("read_bytes", "write_bytes", "read_count", "write_count",
+               "read_time", "write_time", "busy_time")
+NIC_FIELDS = ("bytes_sent", "bytes_recv")
+
+
+def _field(counters, name):
+    if isinstance(counters, dict):
+        return counters.get(name)
+    return getattr(counters, name, None)
+
+
+def counter_delta(curr, prev, wrap=WRAP_32):
+    """Increase of a cumulative counter, handling 32-bit wrap and resets."""
+    if curr is None or prev is None:
+        return 0
+    delta = curr - prev
+    if delta >= 0:
+        return delta
+    if prev < wrap and curr < wrap:
+        # Wrapped once: only trust it if the implied step is under half the range
+        wrapped = curr + wrap - prev
+        if wrapped < wrap // 2:
+            return wrapped
+    return 0  # Reset
+
+
+class RateEngine:
+    """Derives per-second disk and network rates from successive counter sets."""
+
+    def __init__(self, max_gap=30.0):
+        # Ticks further apart than this (suspend, debugger) restart the baseline
+        self.max_gap = max_gap
+        self._prev = {}
+        self._lock = threading.Lock()
+
+        # Latest results, replaced as a whole on every update
+        self.disks = {}
+        self.disk_total = self._disk_rates({}, 1.0)
+        self.nics = {}
+        self.net_total = {"send_bits_s": 0.0, "recv_bits_s": 0.0}
+
+    def _deltas(self, group, counters, fields, now):
+        """Per-device field deltas since the previous call for ``group``."""
+        now = time.monotonic() if now is None else now
+        snapshot = {name: {f: _field(c, f) for f in fields} for name, c in counters.items()}
+        with self._lock:
+            prev, prev_time = self._prev.get(group, ({}, None))
+            self._prev[group] = (snapshot, now)
+
+        if prev_time is None:
+            return 0.0, {}
+        dt = now - prev_time
+        if dt <= 0 or dt > self.max_gap:
+            return 0.0, {}
+
+        deltas = {}
+        for name, curr in snapshot.items():
+            if name in prev:
+                p = prev[name]
+                # None (not counted on this OS) stays None, so callers can fall back
+                deltas[name] = {f: counter_delta(curr[f], p[f])
+                                if curr[f] is not None and p[f] is not None else None
+                                for f in fields}
+        return dt, deltas
+
+    @staticmethod
+    def _disk_rates(d, dt):
+        reads = d.get("read_count") or 0
+        writes = d.get("write_count") or 0
+        io_time = (d.get("read_time") or 0) + (d.get("write_time") or 0)
+        # busy_time is missing on Windows; summed request time is the fallback
+        busy_ms = d["busy_time"] if d.get("busy_time") is not None else io_time
+        return {
+            "read_bytes_s": (d.get("read_bytes") or 0) / dt,
+            "write_bytes_s": (d.get("write_bytes") or 0) / dt,
+            "read_iops": reads / dt,
+            "write_iops": writes / dt,
+            "busy_p": min(100.0, max(0.0, busy_ms / (dt * 1000) * 100)),
+            "latency_ms": io_time / (reads + writes) if reads + writes else 0.0,
+        }
+
+    def update_disks(self, counters, now=None):
+        """Feed one per-disk counter set ({name: counters}); returns per-disk rates."""
+        dt, deltas = self._deltas("disk", counters, DISK_FIELDS, now)
+        disks = {name: self._disk_rates(d, dt) for name, d in deltas.items()}
+
+        total = self._disk_rates({}, 1.0)
+        for r in disks.values():
+            for key in ("read_bytes_s", "write_bytes_s", "read_iops", "write_iops"):
+                total[key] += r[key]
+            total["busy_p"] = max(total["busy_p"], r["busy_p"])
+        ops = total["read_iops"] + total["write_iops"]
+        if ops:
+            total["latency_ms"] = sum(r["latency_ms"] * (r["read_iops"] + r["write_iops"])
+                                      for r in disks.values()) / ops
+
+        self.disks = disks
+        self.disk_total = total
+        return disks
+
+    def update_nics(self, counters, now=None):
+        """Feed one per-NIC counter set ({name: counters}); returns per-NIC rates."""
+        dt, deltas = self._deltas("nic", counters, NIC_FIELDS, now)
+        nics = {name: {"send_bits_s": (d["bytes_sent"] or 0) * 8 / dt,
+                       "recv_bits_s": (d["bytes_recv"] or 0) * 8 / dt}
+                for name, d in deltas.items()}
+
+        self.nics = nics
+        self.net_total = {
+            "send_bits_s": sum(n["send_bits_s"] for n in nics.values()),
+            "recv_bits_s": sum(n["recv_bits_s"] for n in nics.values()),
+        }
+        return nics
@@ -0,0 +1,150 @@
+"""Persistent shell session for repeated PowerShell/WMI queries.
+
+Spawning ``powershell`` costs hundreds of milliseconds and tens of MB per
+call. ``ShellBroker`` keeps one interpreter alive, sends each query over
+stdin followed by an end marker, and reads stdout up to that marker. A
+query that exceeds its timeout kills the session; the next query starts a
+fresh one.
+
+The interpreter is configurable, so the same broker runs against ``sh`` on
+Linux for benchmarking.
+"""
+import itertools
+import json
+import os
+import queue
+import subprocess
+import threading
+import time
+
+# How each supported interpreter prints the end-of-query marker
+DIALECTS = {
+    "powershell": "Write-Output '{marker}'",
+    "sh": "echo '{marker}'",
+}
+
+if os.name == 'nt':
+    DEFAULT_ARGV = ['powershell', '-NoLogo', '-NoProfile', '-NonInteractive', '-Command', '-']
+    DEFAULT_DIALECT = "powershell"
+else:
+    DEFAULT_ARGV = ['sh']
+    DEFAULT_DIALECT = "sh"
+
+
+class ShellBroker:
+    """One long-lived interpreter process that answers queries over a pipe."""
+
+    def __init__(self, argv=None, dialect=None, timeout=5.0):
+        self.argv = list(argv or DEFAULT_ARGV)
+        self.dialect = dialect or DEFAULT_DIALECT
+        self.timeout = timeout
+        self._proc = None
+        self._lines = None
+        self._lock = threading.Lock()
+        self._ids = itertools.count()
+
+        # Stats
+        self.queries = 0
+        self.spawns = 0
+        self.timeouts = 0
+
+    def _start(self):
+        flags = subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+        self._proc = subprocess.Popen(
+            self.argv, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL, text=True, bufsize=1,
+            creationflags=flags)
+        # Each process gets its own line queue so output from a killed
+        # session can never leak into the next query
+        self._lines = queue.Queue()
+        threading.Thread(target=self._pump, args=(self._proc, self._lines),
+                         daemon=True).start()
+
+    @staticmethod
+    def _pump(proc, lines):
+        try:
+            for line in proc.stdout:
+                lines.put(line.rstrip('\r\n'))
+        except (OSError, ValueError):
+            pass
+        lines.put(None)  # EOF
+
+    def _ensure_running(self):
+        if self._proc is None or self._proc.poll() is not None:
+            self._kill()
+            self._start()
+            self.spawns += 1
+
+    def _kill(self):
+        if self._proc is not None:
+            try:
+                self._proc.kill()
+                self._proc.wait(timeout=1)
+            except Exception:
+                pass
+        self._proc = None
+        self._lines = None
+
+    def query(self, command, timeout=None):
+        """Run ``command`` in the session and return its stdout as text.
+
+        Raises ``TimeoutError`` if no end marker arrives in time (the session
+        is restarted) and ``RuntimeError`` if the interpreter exits.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        with self._lock:
+            self._ensure_running()
+            marker = f"__BROKER_END_{os.getpid()}_{next(self._ids)}__"
+            try:
+                self._proc.stdin.write(command + "\n" + DIALECTS[self.dialect].format(marker=marker) + "\n")
+                self._proc.stdin.flush()
+            except (OSError, ValueError):
+                self._kill()
+                raise RuntimeError("shell session closed")
+
+            self.queries += 1
+            out = []
+            deadline = time.monotonic() + timeout
+            while True:
+                remaining = deadline - time.monotonic()
+                try:
+                    line = self._lines.get(timeout=max(0.0, remaining))
+                except queue.Empty:
+                    self.timeouts += 1
+                    self._kill()
+                    raise TimeoutError(f"query timed out after {timeout}s")
+                if line is None:
+                    self._kill()
+                    raise RuntimeError("shell session exited")
+                if line.endswith(marker):
+                    # Output without a trailing newline shares the marker line
+                    out.append(line[:-len(marker)])
+                    return "\n".join(out).strip()
+                out.append(line)
+
+    def query_json(self, command, timeout=None):
+        """Run ``command`` and parse its output as JSON (None if empty)."""
+        text = self.query(command, timeout)
+        return json.loads(text) if text else None
+
+    def close(self):
+        with self._lock:
+            self._kill()
+
+    def stats(self):
+        return {"queries": self.queries, "restarts": max(0, self.spawns - 1),
+                "timeouts": self.timeouts,
+                "alive": self._proc is not None and self._proc.poll() is None}
+
+
+_shared = None
+_shared_lock = threading.Lock()
+
+
+def get_broker():
+    """Process-wide shared broker for the platform's default shell."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = ShellBroker()
+        return _shared
@@ -5,7 +5,6 @@ import ctypes
 import gc
 import psutil
 import time
-import csv
 import os
 import subprocess
 import platform
@@ -14,6 +13,20 @@ from datetime import datetime, timedelta
 import math
 import json
 
+from backends import get_backend
+from collectors import CollectorRegistry, MetricSnapshot, SourceCascade
+from device_inventory import DeviceInventory
+from process_table import ProcessTable
+from diagnostics import EventLoopWatchdog, FrameStats, MainThreadIOGuard, debug_enabled
+from gpu_telemetry import get_gpu_telemetry
+from optimizer import DEFAULT_EXCLUDE, CpuThrottler, WorkingSetTrimmer
+from policy import PolicyEngine, load_rules
+from forecast import FLAT, RamForecaster
+from metrics_store import MetricsStore
+from rates import RateEngine
+from ui_binding import WidgetBinder
+from shell_broker import get_broker
+
 try:
     import wmi
     HAS_WMI = True
@@ -66,21 +79,13 @@ class PERFORMANCE_INFORMATION(ctypes.Structure):
     ]
 
 # --- Windows API setup ---
-psapi = ctypes.WinDLL('psapi.dll')
-kernel32 = ctypes.WinDLL('kernel32.dll')
-user32 = ctypes.WinDLL('user32.dll')
-
-def empty_working_set(pid):
-    """Trim memory usage of a process without closing it."""
-    try:
-        hProcess = kernel32.OpenProcess(0x001F0FFF, False, pid)
-        if hProcess:
-            psapi.EmptyWorkingSet(hProcess)
-            kernel32.CloseHandle(hProcess)
-            return True
-    except Exception:
-        pass
-    return False
+# Windows APIs (None elsewhere; every call site is already wrapped in try)
+if os.name == 'nt':
+    psapi = ctypes.WinDLL('psapi.dll')
+    kernel32 = ctypes.WinDLL('kernel32.dll')
+    user32 = ctypes.WinDLL('user32.dll')
+else:
+    psapi = kernel32 = user32 = None
 
 class ModernTheme:
     """Premium RGB theme with vibrant colors and neon accents"""
@@ -187,8 +192,67 @@ class AnimationEngine:
         except:
             pass
 
+class AnimationClock:
+    """One shared frame timer that advances every animating widget.
+    
+    Widgets register with add() and implement step(frames), returning True
+    while they still need frames. When the Tk loop falls behind, the missed
+    frames are dropped and the next step covers the whole elapsed time.
+    """
+    def __init__(self, root, fps=60, stats=None):
+        self.root = root
+        self.fps = max(1, fps)
+        self.interval = 1.0 / self.fps
+        self.stats = stats
+        self.active = []
+        self.frames = 0
+        self.dropped = 0
+        self._last = None
+        self._scheduled = False
+    
+    def add(self, widget):
+        """Animate ``widget`` until its step() reports it has settled"""
+        if widget not in self.active:
+            self.active.append(widget)
+        if not self._scheduled:
+            self._scheduled = True
+            self._last = time.perf_counter()
+            self.root.after(int(self.interval * 1000), self._tick)
+    
+    def _tick(self):
+        start = time.perf_counter()
+        # Frames that passed since the last tick (> 1 when the loop was late)
+        elapsed = (start - self._last) / self.interval
+        self._last = start
+        if elapsed >= 2:
+            self.dropped += int(elapsed) - 1
+        self.frames += 1
+        
+        still_active = []
+        for widget in self.active:
+            try:
+                if widget.winfo_exists() and widget.step(elapsed):
+                    still_active.append(widget)
+            except tk.TclError:
+                pass  # Destroyed mid-frame (page switch)
+        self.active = still_active
+        
+        if self.stats:
+            self.stats.record("animate", (time.perf_counter() - start) * 1000)
+        
+        if self.active:
+            # Aim for the next frame boundary, never faster than 1 ms
+            delay = self.interval - (time.perf_counter() - start)
+            self.root.after(max(1, int(delay * 1000)), self._tick)
+        else:
+            self._scheduled = False  # Idle: no timer until a widget moves again
+
+
 class AnimatedCircularProgress(Canvas):
     """Animated circular progress indicator with RGB glow"""
+    clock = None  # Shared AnimationClock (set by the dashboard)
+    EASING = 0.2  # Fraction of the remaining distance covered per 7 ms frame
+    
     def __init__(self, parent, size=120, thickness=8, **kwargs):
         super().__init__(parent, width=size, height=size, bg=ModernTheme.BG_CARD, 
                         highlightthickness=0, **kwargs)
@@ -235,60 +299,116 @@ class AnimatedCircularProgress(Canvas):
         self.subtitle_text = subtitle
         if color:
             self.color = color
-        self.animate()
-        
-    def animate(self):
-        """Ultra-smooth 144fps animation to target value"""
-        if abs(self.value - self.target_value) > 0.5:
-            self.value += (self.target_value - self.value) * 0.2
-            extent = -int((self.value / 100) * 360)
-            self.itemconfig(self.arc, extent=extent, outline=self.color)
-            self.itemconfig(self.text_label, text=self.label_text)
-            self.itemconfig(self.subtitle_label, text=self.subtitle_text)
-            self.after(7, self.animate)  # 144fps (1000ms / 144 ≈ 7ms)
+        if self.clock:
+            self.clock.add(self)
         else:
+            self.step(None)
+        
+    def step(self, frames):
+        """Advance the animation by ``frames`` clock frames (None = jump to target).
+        
+        Returns True while the gauge still needs frames.
+        """
+        if frames is None or abs(self.value - self.target_value) <= 0.5:
             self.value = self.target_value
+            moving = False
+        else:
+            # Same easing speed at any FPS: scale the 7 ms step to the real elapsed time
+            ms = frames * self.clock.interval * 1000
+            self.value += (self.target_value - self.value) * (1 - (1 - self.EASING) ** (ms / 7))
+            moving = True
+        
+        extent = -int((self.value / 100) * 360)
+        self.itemconfig(self.arc, extent=extent, outline=self.color)
+        self.itemconfig(self.text_label, text=self.label_text)
+        self.itemconfig(self.subtitle_label, text=self.subtitle_text)
+        return moving
 
 class MiniGraph(Canvas):
-    """Mini line graph for real-time data"""
-    def __init__(self, parent, width=200, height=60, **kwargs):
+    """Mini line graph for real-time data.
+
+    The fill polygon and the line are created once and moved with
+    ``coords()``. X positions are fixed per column, so a new sample only
+    computes its own Y; the Y column is shifted into a preallocated
+    coordinate buffer with one slice assignment instead of rebuilding lists
+    and canvas items every frame.
+
+    Behavior change from the old graph, which always smoothed: with the
+    default ``smooth=None`` the line is only smoothed while there are at
+    most ``SMOOTH_MAX_DENSITY`` points per pixel of width, re-checked on
+    every resize; denser graphs are drawn as straight segments. Pass
+    ``smooth=True``/``False`` to force either.
+    """
+    # Above this many points per pixel of width smoothing adds no visible
+    # curvature but makes Tk evaluate a spline through every point
+    SMOOTH_MAX_DENSITY = 0.25
+
+    def __init__(self, parent, width=200, height=60, points=50, smooth=None, **kwargs):
         super().__init__(parent, width=width, height=height, bg=ModernTheme.BG_CARD,
                         highlightthickness=0, **kwargs)
         self.width = width
         self.height = height
-        self.data = deque([0] * 50, maxlen=50)
+        self.points = max(2, int(points))
+        self.data = deque([0] * self.points, maxlen=self.points)
         self.color = ModernTheme.ACCENT_PRIMARY
-        self.line = None
-        
+        self.smooth_mode = smooth
+
+        # Line: x0, y0, x1, y1, ...; polygon: same plus the two bottom corners
+        self._line_buf = [0.0] * (2 * self.points)
+        self._fill_buf = [0.0] * (2 * self.points + 4)
+        self._layout()
+
+        self.smooth = self._want_smooth()
+        self.fill_item = self.create_polygon(self._fill_buf, fill=ModernTheme.BG_HOVER,
+                                             outline="", smooth=self.smooth)
+        self.line = self.create_line(self._line_buf, fill=self.color, width=2, smooth=self.smooth)
+        self.bind("<Configure>", self._on_resize, add="+")
+
+    def _want_smooth(self):
+        if self.smooth_mode is not None:
+            return bool(self.smooth_mode)
+        return self.points <= self.width * self.SMOOTH_MAX_DENSITY
+
+    def _layout(self):
+        """Recompute the fixed X columns and every Y for the current size."""
+        n = self.points
+        step = self.width / (n - 1)
+        xs = [i * step for i in range(n)]
+        self._ys = deque((self._y(v) for v in self.data), maxlen=n)
+        for buf in (self._line_buf, self._fill_buf):
+            buf[0:2 * n:2] = xs
+            buf[1:2 * n:2] = self._ys
+        self._fill_buf[2 * n:] = [self.width, self.height, 0, self.height]
+
+    def _y(self, value):
+        return self.height - (value / 100 * self.height)
+
+    def _on_resize(self, event):
+        if event.width > 1 and event.height > 1 and \
+                (event.width, event.height) != (self.width, self.height):
+            self.width, self.height = event.width, event.height
+            self._layout()
+            smooth = self._want_smooth()
+            if smooth != self.smooth:
+                self.smooth = smooth
+                self.itemconfigure(self.fill_item, smooth=smooth)
+                self.itemconfigure(self.line, smooth=smooth)
+            self.draw()
+
     def add_value(self, value):
         """Add new data point and redraw"""
-        self.data.append(max(0, min(100, value)))
+        value = max(0, min(100, value))
+        self.data.append(value)
+        self._ys.append(self._y(value))
+        n2 = 2 * self.points
+        self._line_buf[1:n2:2] = self._ys
+        self._fill_buf[1:n2:2] = self._ys
         self.draw()
-        
+
     def draw(self):
-        """Draw the graph"""
-        self.delete("all")
-        
-        if len(self.data) < 2:
-            return
-            
-        # Create gradient effect
-        points = []
-        step = self.width / (len(self.data) - 1)
-        
-        for i, val in enumerate(self.data):
-            x = i * step
-            y = self.height - (val / 100 * self.height)
-            points.extend([x, y])
-        
-        if len(points) >= 4:
-            # Draw filled area
-            fill_points = points + [self.width, self.height, 0, self.height]
-            self.create_polygon(fill_points, fill=ModernTheme.BG_HOVER, 
-                              outline="", smooth=True)
-            
-            # Draw line
-            self.create_line(points, fill=self.color, width=2, smooth=True)
+        """Push the coordinate buffers to the existing canvas items"""
+        self.coords(self.fill_item, self._fill_buf)
+        self.coords(self.line, self._line_buf)
 
 class SidebarButton(tk.Frame):
     """Animated sidebar navigation button"""
@@ -383,8 +503,13 @@ class SystemDashboardPro:
         self.threshold_ram = self.config.get('threshold_ram', 85)
         self.threshold_cpu = self.config.get('threshold_cpu', 85)
         self.monitor_interval = self.config.get('monitor_interval', 250)
-        self.csv_file = "system_performance_log.csv"
+        
+        # Metric history with 1m/1h rollups, shared with the RAM cleaner (metrics_store.py)
+        self.metrics_store = MetricsStore(self.config.get('metrics_db', "system_metrics.db"),
+                                          ("cpu_p", "ram_p", "gpu_p", "disk_p", "cpu_temp"))
         self.current_section = "dashboard"
+        self.pages = {}  # section key -> page frame, built on first visit
+        self.network_adapters = None
         
         # WMI for sensors
         self.wmi_obj = None
@@ -393,28 +518,41 @@ class SystemDashboardPro:
                 self.wmi_obj = wmi.WMI(namespace="root\\OpenHardwareMonitor")
             except: pass
         
-        # Data storage
-        self.ui_data = {
-            "ram_p": 0, "cpu_p": 0, "gpu_p": 0, "disk_p": 0,
-            "ram_used": 0, "ram_total": 0, "cpu_temp": 0,
-            "gpu_temp": 0, "net_send": 0, "net_recv": 0,
-            "processes": 0, "threads": 0, "uptime": "00:00:00"
-        }
+        # Data storage: latest frozen snapshot, replaced as a whole by the sampler
+        self.ui_data = MetricSnapshot()
+        self.rendered_seq = None  # Snapshot seq the current page was last drawn from
+        
+        # Frame-time instrumentation (F12 shows the overlay)
+        self.frame_stats = FrameStats()
+        self.binder = WidgetBinder()  # Skips label updates whose text didn't change
+        
+        # All gauges animate from one shared frame clock
+        self.animation_clock = AnimationClock(self.root, fps=self.config.get('animation_fps', 60),
+                                              stats=self.frame_stats)
+        AnimatedCircularProgress.clock = self.animation_clock
+        self.perf_overlay = None
+        
+        # Debug: report blocking calls made while update_ui draws a page
+        self.io_guard = MainThreadIOGuard(enabled=debug_enabled(self.config)).install()
         
         self.history_cpu = deque([0] * 50, maxlen=50)
         self.history_ram = deque([0] * 50, maxlen=50)
         self.history_gpu = deque([0] * 50, maxlen=50)
         
-        # Disk I/O tracking for storage page
-        self.last_disk_io_data = psutil.disk_io_counters(perdisk=True)
-        self.last_disk_io_time = time.time()
-        
-        # Auto-optimization tracking
+        # Auto-optimization rules (shared with the RAM cleaner, see policy.py)
         self.auto_optimize_enabled = self.config.get('auto_optimize_enabled', True)
-        self.last_auto_optimize_time = 0
-        self.last_cpu_optimize_time = 0
-        self.auto_optimize_cooldown = 60
         self.silent_mode = self.config.get('silent_mode', True)
+        self.policy = PolicyEngine(
+            load_rules(self.config),
+            {"optimize_ram": self._auto_optimize_ram, "optimize_cpu": self._auto_optimize_cpu},
+            {"threshold_ram": self.threshold_ram, "threshold_cpu": self.threshold_cpu,
+             "forecast_lead_s": self.config.get('forecast_lead_s', 30)})
+        
+        # RAM trend: time until threshold_ram at the current rate (forecast.py)
+        self.ram_forecaster = RamForecaster(
+            window_s=self.config.get('forecast_window_s', 60),
+            min_confidence=self.config.get('forecast_min_confidence', 0.5))
+        self.ram_forecast = FLAT
         
         # Saved Hardware Levels
         self.saved_volumes = self.config.get('volumes', {})
@@ -424,18 +562,54 @@ class SystemDashboardPro:
         self.first_load_volume = False
         self.first_load_brightness = False
 
-        # High usage duration trackers (for 10s persistence)
-        self.cpu_high_start_time = None
-        self.ram_high_start_time = None
-
         # Static info
         self.total_ram_gb = round(psutil.virtual_memory().total / (1024**3), 2)
         self.cpu_name = platform.processor()
-        self.boot_time = datetime.fromtimestamp(psutil.boot_time()).strftime("%Y-%m-%d %H:%M:%S")
+        self.boot_timestamp = psutil.boot_time()
+        self.boot_time = datetime.fromtimestamp(self.boot_timestamp).strftime("%Y-%m-%d %H:%M:%S")
+        
+        # Sampling backend (procfs on Linux, psutil/Windows APIs elsewhere)
+        self.backend = get_backend(self.config.get('metrics_backend', 'auto'))
+        
+        # Disk/network rates shared by every page (fed by the collectors)
+        self.rates = RateEngine()
+        self._wmi_root = None
+        self._wmi_lhm = None
+        self.temp_sources = self.create_temp_cascade()
+        # Windowed per-process CPU tracking for the CPU optimizer; undo any
+        # demotions a previous run didn't get to restore
+        self.cpu_throttler = CpuThrottler(
+            demote_percent=self.config.get('cpu_demote_percent', 50),
+            window_s=self.config.get('cpu_demote_window_s', 10),
+            arm_percent=self.threshold_cpu,
+            restore_percent=self.config.get('cpu_restore_percent', 60),
+            journal_path="priority_journal.jsonl")
+        for entry in self.cpu_throttler.recover():
+            print(f"Restored priority of {entry['name']} (PID {entry['pid']})")
+        self.collectors = self.create_collectors()
+        
+        # Working-set trimmer for manual and automatic RAM optimization
+        self.trimmer = WorkingSetTrimmer(
+            min_bytes=int(self.config.get('trim_min_mb', 32)) * 1024 * 1024,
+            exclude=tuple(DEFAULT_EXCLUDE) + tuple(self.config.get('trim_exclude', [])),
+            max_workers=self.config.get('trim_workers', 8),
+            settle_s=self.config.get('trim_settle_s', 10))
+        
+        # Devices page data: enumerated once, re-probed when hardware changes
+        self.device_inventory = self.create_device_inventory().start()
+        self.devices_version = None
+        
+        # Process Manager engine; only samples while its page is visible
+        self.process_table = ProcessTable(top_n=self.config.get('process_rows', 100),
+                                          sort_key=self.config.get('process_sort', 'cpu')).start()
+        self.process_view_version = None
         
-        self.init_csv()
         self.create_ui()
         
+        # Event-loop latency heartbeat
+        self.watchdog = EventLoopWatchdog(self.root, self.frame_stats).start()
+        self.root.bind("<F12>", self.toggle_perf_overlay)
+        
         # Start monitoring
         threading.Thread(target=self.monitor_thread, daemon=True).start()
         self.update_ui()
@@ -453,24 +627,19 @@ class SystemDashboardPro:
     def save_config(self):
         """Save settings to JSON file"""
         try:
-            self.config = {
+            # Update in place so keys not edited here (e.g. collector_intervals) survive
+            self.config.update({
                 'threshold_ram': self.threshold_ram,
                 'threshold_cpu': self.threshold_cpu,
                 'monitor_interval': self.monitor_interval,
                 'auto_optimize_enabled': self.auto_optimize_enabled,
                 'silent_mode': self.silent_mode
-            }
+            })
             with open(self.config_file, 'w') as f:
                 json.dump(self.config, f, indent=4)
         except Exception as e:
             print(f"Config save error: {e}")
     
-    def init_csv(self):
-        if not os.path.exists(self.csv_file):
-            with open(self.csv_file, mode='w', newline='') as file:
-                writer = csv.writer(file)
-                writer.writerow(["Timestamp", "RAM%", "CPU%", "GPU%", "Disk%"])
-    
     def create_ui(self):
         """Create the main UI layout with scrollable content"""
         # Main container
@@ -515,6 +684,62 @@ class SystemDashboardPro:
         # Show default section
         self.show_dashboard()
     
+    def toggle_perf_overlay(self, event=None):
+        """Show/hide the frame-time overlay (F12)"""
+        if self.perf_overlay is not None:
+            self.perf_overlay.destroy()
+            self.perf_overlay = None
+            return
+        
+        self.perf_overlay = tk.Frame(self.root, bg=ModernTheme.BG_CARD,
+                                     highlightbackground=ModernTheme.BORDER, highlightthickness=1)
+        self.perf_overlay.place(relx=1.0, rely=0.0, anchor="ne", x=-10, y=10)
+        
+        self.perf_overlay_text = tk.Label(self.perf_overlay, text="", justify=tk.LEFT,
+                                          font=("Consolas", 9), bg=ModernTheme.BG_CARD,
+                                          fg=ModernTheme.TEXT_SECONDARY)
+        self.perf_overlay_text.pack(padx=10, pady=(8, 4))
+        
+        buttons = tk.Frame(self.perf_overlay, bg=ModernTheme.BG_CARD)
+        buttons.pack(fill=tk.X, padx=10, pady=(0, 8))
+        tk.Button(buttons, text="Export", command=self.export_frame_stats,
+                  bg=ModernTheme.BORDER, fg=ModernTheme.TEXT_PRIMARY, relief=tk.FLAT,
+                  font=("Segoe UI", 8)).pack(side=tk.LEFT)
+        tk.Button(buttons, text="Reset", command=self.frame_stats.reset,
+                  bg=ModernTheme.BORDER, fg=ModernTheme.TEXT_PRIMARY, relief=tk.FLAT,
+                  font=("Segoe UI", 8)).pack(side=tk.LEFT, padx=5)
+        self.perf_overlay_status = tk.Label(buttons, text="", font=("Segoe UI", 8),
+                                            bg=ModernTheme.BG_CARD, fg=ModernTheme.TEXT_MUTED)
+        self.perf_overlay_status.pack(side=tk.LEFT)
+        
+        self.refresh_perf_overlay()
+    
+    def refresh_perf_overlay(self):
+        """Redraw overlay numbers once a second while it is visible"""
+        if self.perf_overlay is None or not self.perf_overlay.winfo_exists():
+            return
+        lines = [f"{'metric':<24}{'n':>7}{'p50':>8}{'p99':>8}{'max':>8}  (ms)"]
+        for name, h in self.frame_stats.summary().items():
+            lines.append(f"{name:<24}{h['count']:>7}{h['p50_ms']:>8.2f}{h['p99_ms']:>8.2f}{h['max_ms']:>8.1f}")
+        lines.append(f"stalls > {self.watchdog.stall_ms} ms: {self.watchdog.stalls}")
+        clock = self.animation_clock
+        lines.append(f"animation @ {clock.fps} fps: {clock.frames} frames, {clock.dropped} dropped, "
+                     f"{len(clock.active)} active")
+        b = self.binder.stats()
+        lines.append(f"widget updates: {b['applied']} applied, {b['skipped']} skipped ({b['skip_ratio']:.0%})")
+        self.perf_overlay_text.config(text="\n".join(lines))
+        self.perf_overlay.lift()
+        self.root.after(1000, self.refresh_perf_overlay)
+    
+    def export_frame_stats(self):
+        """Save frame-time histograms to a JSON file next to the config"""
+        path = f"frame_stats_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        try:
+            self.frame_stats.export(path)
+            self.perf_overlay_status.config(text=f"Saved {path}")
+        except Exception as e:
+            self.perf_overlay_status.config(text=f"Export failed: {e}")
+    
     def _on_canvas_configure(self, event):
         """Update canvas window width when canvas is resized"""
         self.content_canvas.itemconfig(self.canvas_window, width=event.width)
@@ -551,6 +776,7 @@ class SystemDashboardPro:
             ("dashboard", "📊", "Dashboard", self.show_dashboard),
             ("performance", "⚡", "Performance", self.show_performance),
             ("monitoring", "📈", "Monitoring", self.show_monitoring),
+            ("processes", "📋", "Processes", self.show_processes),
             ("devices", "🔌", "Devices", self.show_devices),
             ("network", "🌐", "Network", self.show_network),
             ("settings", "⚙️", "Settings", self.show_settings),
@@ -572,24 +798,45 @@ class SystemDashboardPro:
                 font=("Segoe UI", 8), bg=ModernTheme.BG_SIDEBAR,
                 fg=ModernTheme.TEXT_MUTED).pack()
     
-    def switch_section(self, section_key):
-        """Switch to different section"""
+    def switch_section(self, section_key, rebuild=False):
+        """Switch to different section.
+
+        Pages are built once and kept; switching hides the current page and
+        shows the cached one. Returns a new empty page frame when the section
+        has to be built (first visit or ``rebuild``), otherwise None.
+        """
         # Deactivate all buttons
         for key, btn in self.nav_buttons.items():
             btn.set_active(key == section_key)
         
         self.current_section = section_key
-        
-        # Clear content
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
+        self.rendered_seq = None  # Draw the page from the current snapshot
+        
+        # Hide the visible page (widgets stay alive)
+        for cached in self.pages.values():
+            cached.pack_forget()
+        self.content_canvas.yview_moveto(0)
+        
+        page = self.pages.get(section_key)
+        if page is not None and (rebuild or not page.winfo_exists()):
+            page.destroy()
+            page = None
+        if page is not None:
+            page.pack(fill=tk.BOTH, expand=True)
+            return None
+        
+        page = self.pages[section_key] = tk.Frame(self.content_frame, bg=ModernTheme.BG_DARK)
+        page.pack(fill=tk.BOTH, expand=True)
+        return page
     
     def show_dashboard(self):
         """Main dashboard view"""
-        self.switch_section("dashboard")
+        page = self.switch_section("dashboard")
+        if page is None:
+            return
         
         # Header
-        header = tk.Frame(self.content_frame, bg=ModernTheme.BG_DARK)
+        header = tk.Frame(page, bg=ModernTheme.BG_DARK)
         header.pack(fill=tk.X, padx=30, pady=20)
         
         tk.Label(header, text="System Overview", font=("Segoe UI", 24, "bold"),
@@ -601,7 +848,7 @@ class SystemDashboardPro:
         self.clock_label.pack(side=tk.RIGHT)
         
         # Main content with responsive grid
-        content = tk.Frame(self.content_frame, bg=ModernTheme.BG_DARK)
+        content = tk.Frame(page, bg=ModernTheme.BG_DARK)
         content.pack(fill=tk.BOTH, expand=True, padx=30, pady=10)
         
         # Configure grid weights for responsiveness
@@ -637,6 +884,11 @@ class SystemDashboardPro:
                                        bg=ModernTheme.BG_CARD, fg=ModernTheme.TEXT_SECONDARY)
         self.ram_info_label.pack(pady=5)
         
+        self.ram_forecast_label = tk.Label(ram_card, text="Trend: collecting...",
+                                           font=("Segoe UI", 9),
+                                           bg=ModernTheme.BG_CARD, fg=ModernTheme.TEXT_SECONDARY)
+        self.ram_forecast_label.pack(pady=(0, 5))
+        
         # GPU Card
         gpu_card = self.create_card(content, "GPU Usage")
         gpu_card.grid(row=0, column=2, sticky="nsew", padx=(10, 0), pady=(0, 15))
@@ -654,14 +906,16 @@ class SystemDashboardPro:
         cpu_graph_card = self.create_card(content, "CPU History")
         cpu_graph_card.grid(row=1, column=0, columnspan=2, sticky="nsew", padx=(0, 10), pady=(0, 15))
         
-        self.cpu_graph = MiniGraph(cpu_graph_card, width=350, height=100)
+        self.cpu_graph = MiniGraph(cpu_graph_card, width=350, height=100,
+                                   points=self.config.get('graph_points', 50))
         self.cpu_graph.pack(pady=10, padx=10, fill=tk.BOTH, expand=True)
         
         # RAM Graph
         ram_graph_card = self.create_card(content, "Memory History")
         ram_graph_card.grid(row=1, column=2, sticky="nsew", padx=(10, 0), pady=(0, 15))
         
-        self.ram_graph = MiniGraph(ram_graph_card, width=350, height=100)
+        self.ram_graph = MiniGraph(ram_graph_card, width=350, height=100,
+                                   points=self.config.get('graph_points', 50))
         self.ram_graph.pack(pady=10, padx=10, fill=tk.BOTH, expand=True)
         
         # Bottom row - System info (responsive grid)
@@ -693,9 +947,11 @@ class SystemDashboardPro:
     
     def show_performance(self):
         """Performance monitoring view with detailed metrics"""
-        self.switch_section("performance")
+        page = self.switch_section("performance")
+        if page is None:
+            return
         
-        header = tk.Frame(self.content_frame, bg=ModernTheme.BG_DARK)
+        header = tk.Frame(page, bg=ModernTheme.BG_DARK)
         header.pack(fill=tk.X, padx=30, pady=20)
         
         tk.Label(header, text="Performance Monitor", font=("Segoe UI", 24, "bold"),
@@ -706,7 +962,7 @@ class SystemDashboardPro:
                              bg=ModernTheme.BG_DARK, fg=ModernTheme.ACCENT_PRIMARY)
         self.perf_time_label.pack(side=tk.RIGHT)
         
-        content = tk.Frame(self.content_frame, bg=ModernTheme.BG_DARK)
+        content = tk.Frame(page, bg=ModernTheme.BG_DARK)
         content.pack(fill=tk.BOTH, expand=True, padx=30, pady=10)
         
         # Top row - CPU Details with gauge
@@ -818,74 +1074,51 @@ class SystemDashboardPro:
         
 
         
-        # Try to get GPU info with multiple methods
-        gpu_list = []
-        integrated_gpu = None
-        dedicated_gpu = None
+        # Adapter names come from the device inventory (wmic/PowerShell run off
+        # the Tk thread); filled in by _fill_performance_inventory
+        self.perf_gpu_container = gpu_container
         
-        # Method 1: WMI VideoController
-        try:
-            result = subprocess.run(['wmic', 'path', 'win32_VideoController', 'get', 'name,AdapterRAM'],
-                                  capture_output=True, text=True, timeout=3, creationflags=subprocess.CREATE_NO_WINDOW)
-            if result.returncode == 0:
-                lines = [line.strip() for line in result.stdout.split('\n')[1:] 
-                        if line.strip() and 'Name' not in line and 'AdapterRAM' not in line]
-                for line in lines:
-                    if line:
-                        parts = line.rsplit(None, 1)
-                        gpu_name = parts[0] if parts else line
-                        if any(x in gpu_name.lower() for x in ['intel', 'uhd', 'iris', 'hd graphics', 'amd radeon(tm) graphics']):
-                            integrated_gpu = gpu_name[:40]
-                        elif any(x in gpu_name.lower() for x in ['nvidia', 'geforce', 'rtx', 'gtx', 'radeon rx', 'radeon pro', 'quadro']):
-                            dedicated_gpu = gpu_name[:40]
-                        else:
-                            gpu_list.append(gpu_name[:40])
-        except: pass
+        # Storage Drives Section
+        storage_header = tk.Frame(content, bg=ModernTheme.BG_DARK)
+        storage_header.pack(fill=tk.X, pady=(20, 10))
         
-        # Method 2: Try Caption if name failed
-        if not integrated_gpu and not dedicated_gpu and not gpu_list:
-            try:
-                result = subprocess.run(['wmic', 'path', 'Win32_VideoController', 'get', 'Caption'],
-                                      capture_output=True, text=True, timeout=2, creationflags=subprocess.CREATE_NO_WINDOW)
-                if result.returncode == 0:
-                    captions = [line.strip() for line in result.stdout.split('\n')[1:] 
-                               if line.strip() and line.strip() != 'Caption']
-                    for caption in captions:
-                        if any(x in caption.lower() for x in ['intel', 'uhd', 'iris', 'hd graphics']):
-                            integrated_gpu = caption[:40]
-                        elif any(x in caption.lower() for x in ['nvidia', 'geforce', 'rtx', 'gtx', 'radeon rx']):
-                            dedicated_gpu = caption[:40]
-                        else:
-                            gpu_list.append(caption[:40])
-            except: pass
+        tk.Label(storage_header, text="💾 Storage Drives", font=("Segoe UI", 16, "bold"),
+                bg=ModernTheme.BG_DARK, fg=ModernTheme.ACCENT_PRIMARY).pack(anchor="w")
+        
+        # Storage grid container
+        storage_grid = tk.Frame(content, bg=ModernTheme.BG_DARK)
+        storage_grid.pack(fill=tk.X)
+        storage_grid.columnconfigure(0, weight=1)
+        storage_grid.columnconfigure(1, weight=1)
+        
+        self.perf_storage_grid = storage_grid
+        self.perf_inventory_version = None
+        self.perf_gpu_gauge = self.perf_gpu_int_gauge = self.perf_gpu_util = None
+        self._fill_performance_inventory()
+    
+    def _fill_performance_inventory(self):
+        """Performance page: (re)build the GPU panels and drive cards from the device inventory"""
+        gpu_container = self.perf_gpu_container
+        storage_grid = self.perf_storage_grid
+        for widget in gpu_container.winfo_children() + storage_grid.winfo_children():
+            widget.destroy()
+        self.perf_gpu_gauge = self.perf_gpu_int_gauge = self.perf_gpu_util = None
+        
+        if not self.device_inventory.ready:
+            # First enumeration still running; update_ui calls this again when it lands
+            tk.Label(gpu_container, text="Detecting adapters...", font=("Segoe UI", 10),
+                     bg=ModernTheme.BG_CARD, fg=ModernTheme.TEXT_SECONDARY).pack(anchor="w")
+            tk.Label(storage_grid, text="Detecting drives...", font=("Segoe UI", 10),
+                     bg=ModernTheme.BG_DARK, fg=ModernTheme.TEXT_SECONDARY).grid(row=0, column=0, sticky="w")
+            return
+        version, devices = self.device_inventory.snapshot()
+        self.perf_inventory_version = version
+        adapters = devices.get("gpu_adapters") or {}
+        dedicated_gpu = adapters.get("dedicated")
+        integrated_gpu = adapters.get("integrated")
+        gpu_list = adapters.get("others", [])
+        volumes = devices.get("volumes") or []
         
-        # Method 3: PowerShell (Get-CimInstance) - Robust fallback / Second check for dedicated
-        if not dedicated_gpu:
-            try:
-                ps_script = "Get-CimInstance Win32_VideoController | Select-Object -ExpandProperty Name"
-                result = subprocess.run(['powershell', '-Command', ps_script],
-                                      capture_output=True, text=True, timeout=3, creationflags=subprocess.CREATE_NO_WINDOW)
-                if result.returncode == 0:
-                    gpus = [line.strip() for line in result.stdout.split('\n') if line.strip()]
-                    for gpu in gpus:
-                        if any(x in gpu.lower() for x in ['intel', 'uhd', 'iris', 'hd graphics', 'amd radeon(tm) graphics']):
-                            if not integrated_gpu: integrated_gpu = gpu[:40]
-                            else: gpu_list.append(gpu[:40])
-                        elif any(x in gpu.lower() for x in ['nvidia', 'geforce', 'rtx', 'gtx', 'radeon rx', 'radeon pro', 'quadro']):
-                            if not dedicated_gpu: dedicated_gpu = gpu[:40]
-                            else: gpu_list.append(gpu[:40])
-                        else: gpu_list.append(gpu[:40])
-            except: pass
-
-        # Method 4: Fallback to CPU-based detection
-        if not integrated_gpu and not dedicated_gpu and not gpu_list:
-            try:
-                import platform
-                processor = platform.processor()
-                if 'Intel' in processor: integrated_gpu = "Intel Integrated Graphics"
-                elif 'AMD' in processor: integrated_gpu = "AMD Integrated Graphics"
-            except: pass
-
         # GPU Display Layout - Two Separate Panels
         
         # Left Panel Container (Dedicated)
@@ -939,25 +1172,8 @@ class SystemDashboardPro:
                     bg=ModernTheme.BG_CARD, fg=ModernTheme.TEXT_SECONDARY).pack(expand=True)
             self.perf_gpu_int_gauge = None
         
-        # Store for reference
         self.primary_gpu_name = dedicated_gpu or integrated_gpu or "Unknown"
         
-        # Storage Drives Section
-        storage_header = tk.Frame(content, bg=ModernTheme.BG_DARK)
-        storage_header.pack(fill=tk.X, pady=(20, 10))
-        
-        tk.Label(storage_header, text="💾 Storage Drives", font=("Segoe UI", 16, "bold"),
-                bg=ModernTheme.BG_DARK, fg=ModernTheme.ACCENT_PRIMARY).pack(anchor="w")
-        
-        # Storage grid container
-        storage_grid = tk.Frame(content, bg=ModernTheme.BG_DARK)
-        storage_grid.pack(fill=tk.X)
-        storage_grid.columnconfigure(0, weight=1)
-        storage_grid.columnconfigure(1, weight=1)
-        
-        # Get all partitions
-        partitions = psutil.disk_partitions()
-        
         # Store disk I/O widgets for real-time updates
         if not hasattr(self, 'storage_io_labels'):
             self.storage_io_labels = {}
@@ -965,13 +1181,8 @@ class SystemDashboardPro:
         row = 0
         col = 0
         
-        for partition in partitions:
-            if 'cdrom' in partition.opts or partition.fstype == '':
-                continue
-                
+        for partition, usage in volumes:
             try:
-                usage = psutil.disk_usage(partition.mountpoint)
-                
                 # Create card for each drive
                 drive_card = self.create_card(storage_grid, f"Drive {partition.device}")
                 
@@ -1063,9 +1274,11 @@ class SystemDashboardPro:
     
     def show_monitoring(self):
         """System monitoring view with sensors"""
-        self.switch_section("monitoring")
+        page = self.switch_section("monitoring")
+        if page is None:
+            return
         
-        header = tk.Frame(self.content_frame, bg=ModernTheme.BG_DARK)
+        header = tk.Frame(page, bg=ModernTheme.BG_DARK)
         header.pack(fill=tk.X, padx=30, pady=20)
         
         tk.Label(header, text="System Monitoring", font=("Segoe UI", 24, "bold"),
@@ -1076,7 +1289,7 @@ class SystemDashboardPro:
                              bg=ModernTheme.BG_DARK, fg=ModernTheme.ACCENT_PRIMARY)
         self.mon_time_label.pack(side=tk.RIGHT)
         
-        content = tk.Frame(self.content_frame, bg=ModernTheme.BG_DARK)
+        content = tk.Frame(page, bg=ModernTheme.BG_DARK)
         content.pack(fill=tk.BOTH, expand=True, padx=30, pady=10)
         
         # Top row - Temperatures
@@ -1099,6 +1312,11 @@ class SystemDashboardPro:
                 font=("Segoe UI", 10), bg=ModernTheme.BG_CARD,
                 fg=ModernTheme.TEXT_SECONDARY).pack()
         
+        self.mon_temp_source = tk.Label(cpu_temp_info, text="Source: detecting...",
+                                        font=("Segoe UI", 8), bg=ModernTheme.BG_CARD,
+                                        fg=ModernTheme.TEXT_MUTED)
+        self.mon_temp_source.pack()
+        
         # GPU Temperature
         gpu_temp_card = self.create_card(temp_row, "🎮 GPU Temperature")
         gpu_temp_card.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(10, 0))
@@ -1212,20 +1430,26 @@ class SystemDashboardPro:
     
     def show_processes(self):
         """Process management view with all running processes"""
-        self.switch_section("processes")
+        page = self.switch_section("processes")
+        if page is None:
+            return
         
-        header = tk.Frame(self.content_frame, bg=ModernTheme.BG_DARK)
+        header = tk.Frame(page, bg=ModernTheme.BG_DARK)
         header.pack(fill=tk.X, padx=30, pady=20)
         
         tk.Label(header, text="Process Manager", font=("Segoe UI", 24, "bold"),
                 bg=ModernTheme.BG_DARK, fg=ModernTheme.TEXT_PRIMARY).pack(side=tk.LEFT)
         
-        # Refresh button
+        # Refresh button (the table also refreshes itself while visible)
         refresh_btn = self.create_action_button(header, "🔄 Refresh", 
-                                                lambda: self.show_processes())
+                                                self.process_table.refresh_now)
         refresh_btn.pack(side=tk.RIGHT, padx=5)
         
-        content = tk.Frame(self.content_frame, bg=ModernTheme.BG_DARK)
+        self.process_count_label = tk.Label(header, text="", font=("Segoe UI", 10),
+                                            bg=ModernTheme.BG_DARK, fg=ModernTheme.TEXT_SECONDARY)
+        self.process_count_label.pack(side=tk.RIGHT, padx=15)
+        
+        content = tk.Frame(page, bg=ModernTheme.BG_DARK)
         content.pack(fill=tk.BOTH, expand=True, padx=30, pady=10)
         
         # Process table
@@ -1235,58 +1459,101 @@ class SystemDashboardPro:
         table_frame = tk.Frame(table_card, bg=ModernTheme.BG_CARD)
         table_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=10)
         
-        # Create scrollable text widget for processes
+        style = ttk.Style(self.root)
+        style.configure("Process.Treeview", background=ModernTheme.BG_DARK,
+                        fieldbackground=ModernTheme.BG_DARK, foreground=ModernTheme.TEXT_PRIMARY,
+                        font=("Consolas", 9), rowheight=20, borderwidth=0)
+        style.configure("Process.Treeview.Heading", background=ModernTheme.BG_CARD,
+                        foreground=ModernTheme.ACCENT_PRIMARY, font=("Segoe UI", 9, "bold"))
+        style.map("Process.Treeview", background=[("selected", ModernTheme.BG_HOVER)])
+        
         scroll_y = tk.Scrollbar(table_frame, orient=tk.VERTICAL)
         scroll_y.pack(side=tk.RIGHT, fill=tk.Y)
         
-        process_text = tk.Text(table_frame, bg=ModernTheme.BG_DARK,
-                              fg=ModernTheme.TEXT_PRIMARY, font=("Consolas", 9),
-                              relief=tk.FLAT, yscrollcommand=scroll_y.set,
-                              wrap=tk.NONE)
-        process_text.pack(fill=tk.BOTH, expand=True)
-        scroll_y.config(command=process_text.yview)
-        
-        # Header
-        header_text = f"{'PID':<8} {'Name':<35} {'CPU%':<8} {'Memory':<12} {'Status':<12}\n"
-        header_text += "=" * 85 + "\n"
-        process_text.insert('1.0', header_text)
-        
-        # Get all processes
-        processes = []
-        for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_info', 'status']):
-            try:
-                processes.append({
-                    'pid': proc.info['pid'],
-                    'name': proc.info['name'],
-                    'cpu': proc.info['cpu_percent'] or 0,
-                    'memory': proc.info['memory_info'].rss / (1024 * 1024) if proc.info['memory_info'] else 0,
-                    'status': proc.info['status']
-                })
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
-        
-        # Sort by CPU usage
-        processes.sort(key=lambda x: x['cpu'], reverse=True)
-        
-        # Display top processes
-        for proc in processes[:50]:  # Show top 50
-            name = proc['name'][:33] + '..' if len(proc['name']) > 35 else proc['name']
-            line = f"{proc['pid']:<8} {name:<35} {proc['cpu']:<8.1f} {proc['memory']:<10.1f} MB {proc['status']:<12}\n"
-            process_text.insert(tk.END, line)
-        
-        process_text.config(state='disabled')
+        columns = (("pid", "PID", 70, tk.E), ("name", "Name", 260, tk.W),
+                   ("cpu", "CPU%", 70, tk.E), ("memory", "Memory", 100, tk.E),
+                   ("status", "Status", 90, tk.W))
+        tree = ttk.Treeview(table_frame, columns=[c[0] for c in columns], show="headings",
+                            style="Process.Treeview", height=25, selectmode="browse",
+                            yscrollcommand=lambda first, last: self.process_scrolled(scroll_y, first, last))
+        for key, title, width, anchor in columns:
+            tree.heading(key, text=title, command=lambda k=key: self.sort_processes(k))
+            tree.column(key, width=width, anchor=anchor, stretch=(key == "name"))
+        tree.pack(fill=tk.BOTH, expand=True)
+        scroll_y.config(command=tree.yview)
+        
+        # Rows are kept between refreshes and only changed ones are touched
+        self.process_tree = tree
+        self.process_tree_rows = {}     # iid -> values shown
+        self.process_tree_order = []    # iids in display order
+        self.process_view_version = None
+    
+    def process_scrolled(self, scrollbar, first, last):
+        """Treeview scrolled: load the next rows once the end of the list is in view"""
+        scrollbar.set(first, last)
+        if float(last) >= 0.98 and self.process_table.show_more():
+            self.root.after_idle(self.render_process_table)
+    
+    def sort_processes(self, key):
+        """Heading click: re-rank the process table by ``key``"""
+        self.process_table.set_sort(key)
+        self.render_process_table()
+    
+    def render_process_table(self):
+        """Apply the process engine's top rows to the Treeview, touching only changes"""
+        table = self.process_table
+        tree = self.process_tree
+        rows = self.process_tree_rows
+        order = self.process_tree_order
+        self.process_view_version = table.version
+        
+        wanted = []
+        values = {}
+        for row in table.top:
+            iid = str(row.pid)
+            wanted.append(iid)
+            name = row.name[:38] + '..' if len(row.name) > 40 else row.name
+            values[iid] = (row.pid, name,
+                           "N/A" if row.cpu is None else f"{row.cpu:.1f}",
+                           "N/A" if row.memory is None else f"{row.memory / (1024 * 1024):.1f} MB",
+                           row.status)
+        
+        for iid in [i for i in order if i not in values]:
+            tree.delete(iid)
+            del rows[iid]
+            order.remove(iid)
+        
+        for index, iid in enumerate(wanted):
+            if iid not in rows:
+                tree.insert("", index, iid=iid, values=values[iid])
+                order.insert(index, iid)
+            else:
+                if rows[iid] != values[iid]:
+                    tree.item(iid, values=values[iid])
+                if order[index] != iid:
+                    tree.move(iid, "", index)
+                    order.remove(iid)
+                    order.insert(index, iid)
+            rows[iid] = values[iid]
+        
+        self.binder.config(self.process_count_label,
+                           text=f"showing {len(table.top)} of {len(table.rows)} processes · "
+                                f"sorted by {table.sort_key} · "
+                                f"{table.refresh_ms:.0f} ms/refresh")
     
     def show_storage(self):
         """Storage management view with all drives and real-time I/O"""
-        self.switch_section("storage")
+        page = self.switch_section("storage")
+        if page is None:
+            return
         
-        header = tk.Frame(self.content_frame, bg=ModernTheme.BG_DARK)
+        header = tk.Frame(page, bg=ModernTheme.BG_DARK)
         header.pack(fill=tk.X, padx=30, pady=20)
         
         tk.Label(header, text="Storage Manager", font=("Segoe UI", 24, "bold"),
                 bg=ModernTheme.BG_DARK, fg=ModernTheme.TEXT_PRIMARY).pack(side=tk.LEFT)
         
-        content = tk.Frame(self.content_frame, bg=ModernTheme.BG_DARK)
+        content = tk.Frame(page, bg=ModernTheme.BG_DARK)
         content.pack(fill=tk.BOTH, expand=True, padx=30, pady=10)
         
         # Configure grid for responsive 2-column layout
@@ -1399,11 +1666,20 @@ class SystemDashboardPro:
             except Exception as e:
                 pass
     
-    def show_devices(self):
+    def show_devices(self, refresh=False):
         """Devices view showing all connected hardware with controls"""
-        self.switch_section("devices")
+        if refresh:
+            self.device_inventory.refresh()  # Page is rebuilt once results change
+        
+        # Render from the inventory cache; rebuild only if it changed since
+        ready = self.device_inventory.ready
+        version, devices = self.device_inventory.snapshot()
+        page = self.switch_section("devices", rebuild=ready and version != self.devices_version)
+        if page is None:
+            return
+        self.devices_version = version if ready else None
         
-        header = tk.Frame(self.content_frame, bg=ModernTheme.BG_DARK)
+        header = tk.Frame(page, bg=ModernTheme.BG_DARK)
         header.pack(fill=tk.X, padx=30, pady=20)
         
         tk.Label(header, text="Connected Devices", font=("Segoe UI", 24, "bold"),
@@ -1414,203 +1690,189 @@ class SystemDashboardPro:
                              bg=ModernTheme.BG_DARK, fg=ModernTheme.ACCENT_PRIMARY)
         self.dev_time_label.pack(side=tk.RIGHT)
         
-        content = tk.Frame(self.content_frame, bg=ModernTheme.BG_DARK)
-        content.pack(fill=tk.BOTH, expand=True, padx=30, pady=10)
-        
-        # Configure grid for 2-column layout
-        content.columnconfigure(0, weight=1)
-        content.columnconfigure(1, weight=1)
-        
-        row = 0
-        
-        # CPU Devices
-        cpu_card = self.create_card(content, "🖥️ Processor")
-        cpu_card.grid(row=row, column=0, sticky="nsew", padx=(0, 10), pady=(0, 15))
-        
-        cpu_info = tk.Frame(cpu_card, bg=ModernTheme.BG_CARD)
-        cpu_info.pack(fill=tk.BOTH, expand=True, padx=15, pady=10)
-        
-        self.create_info_row(cpu_info, "Name:", self.cpu_name[:35]).pack(fill=tk.X, pady=3)
-        self.create_info_row(cpu_info, "Cores:", f"{psutil.cpu_count(logical=False)} Physical").pack(fill=tk.X, pady=3)
-        self.create_info_row(cpu_info, "Threads:", f"{psutil.cpu_count(logical=True)} Logical").pack(fill=tk.X, pady=3)
-        
-        # GPU Devices - FIXED
-        gpu_card = self.create_card(content, "🎮 Graphics Cards")
-        gpu_card.grid(row=row, column=1, sticky="nsew", padx=(10, 0), pady=(0, 15))
-        
-        gpu_info = tk.Frame(gpu_card, bg=ModernTheme.BG_CARD)
-        gpu_info.pack(fill=tk.BOTH, expand=True, padx=15, pady=10)
-        
-        gpu_found = False
-        try:
-            result = subprocess.run(['wmic', 'path', 'win32_VideoController', 'get', 'name'],
-                                  capture_output=True, text=True, timeout=3, creationflags=subprocess.CREATE_NO_WINDOW)
-            if result.returncode == 0:
-                gpu_names = [line.strip() for line in result.stdout.split('\n')[1:] if line.strip() and line.strip() != 'Name']
-                if gpu_names:
-                    gpu_found = True
-                    for i, gpu in enumerate(gpu_names[:3]):
-                        self.create_info_row(gpu_info, f"GPU {i+1}:", gpu[:35]).pack(fill=tk.X, pady=3)
-        except:
-            pass
-        
-        if not gpu_found:
-            tk.Label(gpu_info, text="✓ Integrated Graphics", font=("Segoe UI", 10),
-                    bg=ModernTheme.BG_CARD, fg=ModernTheme.ACCENT_LIME).pack(pady=10)
-        
-        row += 1
-        
-        # RAM Devices
-        ram_card = self.create_card(content, "💾 Memory Modules")
-        ram_card.grid(row=row, column=0, sticky="nsew", padx=(0, 10), pady=(0, 15))
-        
-        ram_info = tk.Frame(ram_card, bg=ModernTheme.BG_CARD)
-        ram_info.pack(fill=tk.BOTH, expand=True, padx=15, pady=10)
-        
-        self.create_info_row(ram_info, "Total RAM:", f"{self.total_ram_gb} GB").pack(fill=tk.X, pady=3)
-        
-        ram_found = False
-        try:
-            result = subprocess.run(['wmic', 'memorychip', 'get', 'capacity,speed'],
-                                  capture_output=True, text=True, timeout=3, creationflags=subprocess.CREATE_NO_WINDOW)
-            if result.returncode == 0:
-                lines = [l.strip() for l in result.stdout.split('\n')[1:] if l.strip() and 'Capacity' not in l]
-                for i, line in enumerate(lines[:4]):
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        ram_found = True
-                        try:
-                            size_gb = int(parts[0]) / (1024**3)
-                            speed = parts[1]
-                            self.create_info_row(ram_info, f"Module {i+1}:", 
-                                                f"{size_gb:.0f} GB @ {speed} MHz").pack(fill=tk.X, pady=2)
-                        except:
-                            pass
-        except:
-            pass
+        refresh_btn = self.create_action_button(header, "🔄 Rescan",
+                                                lambda: self.show_devices(refresh=True))
+        refresh_btn.pack(side=tk.RIGHT, padx=10)
         
-        if not ram_found:
-            self.create_info_row(ram_info, "Status:", "✓ Memory Active").pack(fill=tk.X, pady=3)
+        content = tk.Frame(page, bg=ModernTheme.BG_DARK)
+        content.pack(fill=tk.BOTH, expand=True, padx=30, pady=10)
         
-        # Storage Devices
-        storage_card = self.create_card(content, "💿 Storage Drives")
-        storage_card.grid(row=row, column=1, sticky="nsew", padx=(10, 0), pady=(0, 15))
+        if not ready:
+            # First enumeration still running; update_ui rebuilds the page when it lands
+            tk.Label(content, text="Scanning hardware...", font=("Segoe UI", 11),
+                     bg=ModernTheme.BG_DARK, fg=ModernTheme.TEXT_SECONDARY).grid(row=0, column=0, sticky="w")
+            return
         
-        storage_info = tk.Frame(storage_card, bg=ModernTheme.BG_CARD)
-        storage_info.pack(fill=tk.BOTH, expand=True, padx=15, pady=10)
+        self._populate_devices(content, devices)
+    
+    def _probe_gpu_adapters(self):
+        """Installed display adapters split into dedicated / integrated / others"""
+        gpu_list = []
+        integrated_gpu = None
+        dedicated_gpu = None
         
-        storage_found = False
+        # Method 1: WMI VideoController
         try:
-            result = subprocess.run(['wmic', 'diskdrive', 'get', 'model,size'],
+            result = subprocess.run(['wmic', 'path', 'win32_VideoController', 'get', 'name,AdapterRAM'],
                                   capture_output=True, text=True, timeout=3, creationflags=subprocess.CREATE_NO_WINDOW)
             if result.returncode == 0:
-                lines = [l.strip() for l in result.stdout.split('\n')[1:] if l.strip() and 'Model' not in l]
-                for i, line in enumerate(lines[:4]):
+                lines = [line.strip() for line in result.stdout.split('\n')[1:] 
+                        if line.strip() and 'Name' not in line and 'AdapterRAM' not in line]
+                for line in lines:
                     if line:
                         parts = line.rsplit(None, 1)
-                        if len(parts) >= 2:
-                            storage_found = True
-                            try:
-                                model = parts[0][:30]
-                                size_gb = int(parts[1]) / (1024**3)
-                                self.create_info_row(storage_info, f"Drive {i+1}:", 
-                                                    f"{model} ({size_gb:.0f} GB)").pack(fill=tk.X, pady=2)
-                            except:
-                                pass
-        except:
-            pass
-        
-        if not storage_found:
-            # Fallback to psutil
-            for i, part in enumerate(psutil.disk_partitions()[:2]):
-                try:
-                    usage = psutil.disk_usage(part.mountpoint)
-                    self.create_info_row(storage_info, f"{part.device}", 
-                                        f"{usage.total/(1024**3):.0f} GB").pack(fill=tk.X, pady=2)
-                    storage_found = True
-                except:
-                    pass
-        
-        row += 1
-        
-        # Network Adapters
-        network_card = self.create_card(content, "🌐 Network Adapters")
-        network_card.grid(row=row, column=0, sticky="nsew", padx=(0, 10), pady=(0, 15))
+                        gpu_name = parts[0] if parts else line
+                        if any(x in gpu_name.lower() for x in ['intel', 'uhd', 'iris', 'hd graphics', 'amd radeon(tm) graphics']):
+                            integrated_gpu = gpu_name[:40]
+                        elif any(x in gpu_name.lower() for x in ['nvidia', 'geforce', 'rtx', 'gtx', 'radeon rx', 'radeon pro', 'quadro']):
+                            dedicated_gpu = gpu_name[:40]
+                        else:
+                            gpu_list.append(gpu_name[:40])
+        except: pass
         
-        network_info = tk.Frame(network_card, bg=ModernTheme.BG_CARD)
-        network_info.pack(fill=tk.BOTH, expand=True, padx=15, pady=10)
+        # Method 2: Try Caption if name failed
+        if not integrated_gpu and not dedicated_gpu and not gpu_list:
+            try:
+                result = subprocess.run(['wmic', 'path', 'Win32_VideoController', 'get', 'Caption'],
+                                      capture_output=True, text=True, timeout=2, creationflags=subprocess.CREATE_NO_WINDOW)
+                if result.returncode == 0:
+                    captions = [line.strip() for line in result.stdout.split('\n')[1:] 
+                               if line.strip() and line.strip() != 'Caption']
+                    for caption in captions:
+                        if any(x in caption.lower() for x in ['intel', 'uhd', 'iris', 'hd graphics']):
+                            integrated_gpu = caption[:40]
+                        elif any(x in caption.lower() for x in ['nvidia', 'geforce', 'rtx', 'gtx', 'radeon rx']):
+                            dedicated_gpu = caption[:40]
+                        else:
+                            gpu_list.append(caption[:40])
+            except: pass
         
-        net_if_stats = psutil.net_if_stats()
-        count = 0
-        for name, stats in net_if_stats.items():
-            if count < 4 and 'Loopback' not in name:
-                status = "🟢" if stats.isup else "🔴"
-                speed_text = f"{stats.speed} Mbps" if stats.speed > 0 else "N/A"
-                self.create_info_row(network_info, f"{status} {name[:25]}:", speed_text).pack(fill=tk.X, pady=2)
-                count += 1
-        
-        # USB Devices - IMPROVED (Show actual devices, not just hubs)
-        usb_card = self.create_card(content, "🔌 USB Devices")
-        usb_card.grid(row=row, column=1, sticky="nsew", padx=(10, 0), pady=(0, 15))
+        # Method 3: PowerShell (Get-CimInstance) - Robust fallback / Second check for dedicated
+        if not dedicated_gpu:
+            try:
+                ps_script = "Get-CimInstance Win32_VideoController | Select-Object -ExpandProperty Name"
+                result = subprocess.run(['powershell', '-Command', ps_script],
+                                      capture_output=True, text=True, timeout=3, creationflags=subprocess.CREATE_NO_WINDOW)
+                if result.returncode == 0:
+                    gpus = [line.strip() for line in result.stdout.split('\n') if line.strip()]
+                    for gpu in gpus:
+                        if any(x in gpu.lower() for x in ['intel', 'uhd', 'iris', 'hd graphics', 'amd radeon(tm) graphics']):
+                            if not integrated_gpu: integrated_gpu = gpu[:40]
+                            else: gpu_list.append(gpu[:40])
+                        elif any(x in gpu.lower() for x in ['nvidia', 'geforce', 'rtx', 'gtx', 'radeon rx', 'radeon pro', 'quadro']):
+                            if not dedicated_gpu: dedicated_gpu = gpu[:40]
+                            else: gpu_list.append(gpu[:40])
+                        else: gpu_list.append(gpu[:40])
+            except: pass
+
+        # Method 4: Fallback to CPU-based detection
+        if not integrated_gpu and not dedicated_gpu and not gpu_list:
+            try:
+                import platform
+                processor = platform.processor()
+                if 'Intel' in processor: integrated_gpu = "Intel Integrated Graphics"
+                elif 'AMD' in processor: integrated_gpu = "AMD Integrated Graphics"
+            except: pass
         
-        usb_info = tk.Frame(usb_card, bg=ModernTheme.BG_CARD)
-        usb_info.pack(fill=tk.BOTH, expand=True, padx=15, pady=10)
+        return {"dedicated": dedicated_gpu, "integrated": integrated_gpu, "others": gpu_list}
+    
+    def _probe_volumes(self):
+        """(partition, usage) for every mounted fixed volume"""
+        volumes = []
+        for partition in psutil.disk_partitions():
+            if 'cdrom' in partition.opts or partition.fstype == '':
+                continue
+            try:
+                volumes.append((partition, psutil.disk_usage(partition.mountpoint)))
+            except OSError:
+                pass
+        return volumes
+    
+    def _probe_gpu_names(self):
+        result = subprocess.run(['wmic', 'path', 'win32_VideoController', 'get', 'name'],
+                              capture_output=True, text=True, timeout=3, creationflags=subprocess.CREATE_NO_WINDOW)
+        if result.returncode != 0:
+            return []
+        return [line.strip() for line in result.stdout.split('\n')[1:] if line.strip() and line.strip() != 'Name'][:3]
+    
+    def _probe_ram_modules(self):
+        result = subprocess.run(['wmic', 'memorychip', 'get', 'capacity,speed'],
+                              capture_output=True, text=True, timeout=3, creationflags=subprocess.CREATE_NO_WINDOW)
+        modules = []
+        if result.returncode == 0:
+            lines = [l.strip() for l in result.stdout.split('\n')[1:] if l.strip() and 'Capacity' not in l]
+            for i, line in enumerate(lines[:4]):
+                parts = line.split()
+                if len(parts) >= 2:
+                    try:
+                        modules.append((i, int(parts[0]) / (1024**3), parts[1]))
+                    except:
+                        pass
+        return modules
+    
+    def _probe_drives(self):
+        drives = []
+        try:
+            result = subprocess.run(['wmic', 'diskdrive', 'get', 'model,size'],
+                                  capture_output=True, text=True, timeout=3, creationflags=subprocess.CREATE_NO_WINDOW)
+            if result.returncode == 0:
+                lines = [l.strip() for l in result.stdout.split('\n')[1:] if l.strip() and 'Model' not in l]
+                for i, line in enumerate(lines[:4]):
+                    parts = line.rsplit(None, 1)
+                    if len(parts) >= 2:
+                        try:
+                            model = parts[0][:30]
+                            size_gb = int(parts[1]) / (1024**3)
+                            drives.append((f"Drive {i+1}:", f"{model} ({size_gb:.0f} GB)"))
+                        except:
+                            pass
+        except:
+            pass
         
-        usb_found = False
+        if not drives:
+            # Fallback to psutil
+            for part in psutil.disk_partitions()[:2]:
+                try:
+                    usage = psutil.disk_usage(part.mountpoint)
+                    drives.append((f"{part.device}", f"{usage.total/(1024**3):.0f} GB"))
+                except:
+                    pass
+        return drives
+    
+    def _probe_adapters(self):
+        return [(name, stats.isup, stats.speed) for name, stats in psutil.net_if_stats().items()
+                if 'Loopback' not in name][:4]
+    
+    def _probe_usb_devices(self):
+        # PnP devices first (actual devices, not hubs), controllers as a fallback
         usb_devices_list = []
-        
-        # Try multiple methods to detect USB devices
         try:
-            # Method 1: PnP devices (better for actual devices)
             result = subprocess.run(['wmic', 'path', 'Win32_PnPEntity', 'where', 
                                    'DeviceID like "%USB%"', 'get', 'Caption'],
                                   capture_output=True, text=True, timeout=5, creationflags=subprocess.CREATE_NO_WINDOW)
             if result.returncode == 0:
-                devices = [line.strip() for line in result.stdout.split('\n')[1:] 
-                          if line.strip() and line.strip() != 'Caption' 
-                          and 'USB' in line and 'Hub' not in line and 'Composite' not in line]
-                usb_devices_list.extend(devices[:5])
+                found = [line.strip() for line in result.stdout.split('\n')[1:] 
+                         if line.strip() and line.strip() != 'Caption' 
+                         and 'USB' in line and 'Hub' not in line and 'Composite' not in line]
+                usb_devices_list.extend(found[:5])
         except:
             pass
         
-        # Method 2: USB Controllers (if PnP failed)
         if not usb_devices_list:
             try:
                 result = subprocess.run(['wmic', 'path', 'Win32_USBControllerDevice', 'get', 'Dependent'],
                                       capture_output=True, text=True, timeout=3, creationflags=subprocess.CREATE_NO_WINDOW)
                 if result.returncode == 0:
-                    devices = [line.strip() for line in result.stdout.split('\n')[1:] 
-                              if line.strip() and 'USB' in line]
-                    usb_devices_list.extend(devices[:5])
+                    found = [line.strip() for line in result.stdout.split('\n')[1:] 
+                             if line.strip() and 'USB' in line]
+                    usb_devices_list.extend(found[:5])
             except:
                 pass
-        
-        if usb_devices_list:
-            usb_found = True
-            for i, device in enumerate(usb_devices_list[:5]):
-                # Clean up device name
-                clean_name = device.replace('USB\\', '').replace('VID_', '').replace('PID_', '')
-                if len(clean_name) > 35:
-                    clean_name = clean_name[:32] + "..."
-                self.create_info_row(usb_info, f"USB {i+1}:", clean_name).pack(fill=tk.X, pady=2)
-        
-        if not usb_found:
-            tk.Label(usb_info, text="✓ USB Ports Active", font=("Segoe UI", 10),
-                    bg=ModernTheme.BG_CARD, fg=ModernTheme.ACCENT_LIME).pack(pady=10)
-        
-        row += 1
-        
-        # Audio Devices with Volume Control - Enhanced to show all devices
-        audio_card = self.create_card(content, "🔊 Audio Devices & Control")
-        audio_card.grid(row=row, column=0, sticky="nsew", padx=(0, 10), pady=(0, 15))
-        
-        audio_info = tk.Frame(audio_card, bg=ModernTheme.BG_CARD)
-        audio_info.pack(fill=tk.BOTH, expand=True, padx=15, pady=10)
-        
-        audio_found = False
+        return usb_devices_list[:5]
+    
+    def _probe_audio_devices(self):
+        # Win32_SoundDevice, then PnP media class, then PowerShell
         audio_devices_list = []
-        
-        # Method 1: Try Win32_SoundDevice (better for actual devices)
         try:
             result = subprocess.run(['wmic', 'sounddev', 'get', 'name,status'],
                                   capture_output=True, text=True, timeout=3, creationflags=subprocess.CREATE_NO_WINDOW)
@@ -1622,12 +1884,10 @@ class SystemDashboardPro:
                         device_name = line.replace('OK', '').strip()
                         if device_name:
                             audio_devices_list.append(device_name[:40])
-                            audio_found = True
         except:
             pass
         
-        # Method 2: Try Win32_PnPEntity for audio devices (if sounddev failed)
-        if not audio_found:
+        if not audio_devices_list:
             try:
                 result = subprocess.run(['wmic', 'path', 'Win32_PnPEntity', 'where', 
                                        'PNPClass="MEDIA" OR PNPClass="AudioEndpoint"', 'get', 'Caption'],
@@ -1635,59 +1895,201 @@ class SystemDashboardPro:
                 if result.returncode == 0:
                     captions = [line.strip() for line in result.stdout.split('\n')[1:] 
                                if line.strip() and line.strip() != 'Caption']
-                    if captions:
-                        audio_devices_list.extend(captions[:5])
-                        audio_found = True
+                    audio_devices_list.extend(captions[:5])
             except:
                 pass
         
-        # Method 3: Use PowerShell to enumerate audio devices
-        if not audio_found:
+        if not audio_devices_list:
             try:
                 ps_script = "Get-WmiObject Win32_SoundDevice | Select-Object -ExpandProperty Name"
                 result = subprocess.run(['powershell', '-Command', ps_script],
                                       capture_output=True, text=True, timeout=3, creationflags=subprocess.CREATE_NO_WINDOW)
                 if result.returncode == 0:
-                    devices = [line.strip() for line in result.stdout.split('\n') 
-                              if line.strip() and line.strip() != '']
-                    if devices:
-                        audio_devices_list.extend(devices[:5])
-                        audio_found = True
+                    found = [line.strip() for line in result.stdout.split('\n') if line.strip()]
+                    audio_devices_list.extend(found[:5])
             except:
                 pass
         
-        # Categorize and display audio devices
-        if audio_devices_list:
-            # Remove duplicates while preserving order
-            seen = set()
-            unique_devices = []
-            for device in audio_devices_list:
-                if device not in seen:
-                    seen.add(device)
-                    unique_devices.append(device)
+        # Remove duplicates while preserving order
+        return list(dict.fromkeys(audio_devices_list))[:5]
+    
+    def _probe_monitors(self):
+        # Connected PnP monitors, DesktopMonitor, WmiMonitorID, then screen size
+        monitors_list = []
+        try:
+            result = subprocess.run(['wmic', 'path', 'Win32_PnPEntity', 'where', 
+                                   'PNPClass="Monitor" AND Status="OK"', 'get', 'Caption'],
+                                  capture_output=True, text=True, timeout=3, creationflags=subprocess.CREATE_NO_WINDOW)
+            if result.returncode == 0:
+                captions = [line.strip() for line in result.stdout.split('\n')[1:] 
+                           if line.strip() and line.strip() != 'Caption' and 'Generic' not in line]
+                monitors_list.extend(captions[:5])
+        except:
+            pass
+        
+        if not monitors_list:
+            try:
+                result = subprocess.run(['wmic', 'path', 'Win32_DesktopMonitor', 'where', 
+                                       'Availability=3', 'get', 'name,ScreenWidth,ScreenHeight'],
+                                      capture_output=True, text=True, timeout=3, creationflags=subprocess.CREATE_NO_WINDOW)
+                if result.returncode == 0:
+                    lines = [line.strip() for line in result.stdout.split('\n')[1:] 
+                            if line.strip() and 'Name' not in line and 'ScreenHeight' not in line]
+                    for line in lines:
+                        parts = line.split()
+                        if parts:
+                            monitor_name = ' '.join(parts[:-2]) if len(parts) > 2 else parts[0]
+                            width = parts[-2] if len(parts) > 2 else ''
+                            height = parts[-1] if len(parts) > 1 else ''
+                            
+                            if width and height and width.isdigit() and height.isdigit():
+                                monitors_list.append(f"{monitor_name} ({width}x{height})")
+                            else:
+                                monitors_list.append(monitor_name)
+            except:
+                pass
+        
+        if not monitors_list:
+            try:
+                ps_script = "Get-WmiObject -Namespace root\\wmi -Class WmiMonitorID | ForEach-Object { [System.Text.Encoding]::ASCII.GetString($_.UserFriendlyName -notmatch 0) }"
+                result = subprocess.run(['powershell', '-Command', ps_script],
+                                      capture_output=True, text=True, timeout=3, creationflags=subprocess.CREATE_NO_WINDOW)
+                if result.returncode == 0:
+                    lines = [line.strip() for line in result.stdout.split('\n') if line.strip()]
+                    monitors_list.extend(lines[:5])
+            except:
+                pass
+        
+        if not monitors_list and user32 is not None:
+            width = user32.GetSystemMetrics(0)
+            height = user32.GetSystemMetrics(1)
+            monitors_list.append(f"Primary Display ({width}x{height})")
+        return monitors_list[:5]
+    
+    def _populate_devices(self, content, devices):
+        """Build the device cards from a DeviceInventory snapshot"""
+        # Configure grid for 2-column layout
+        content.columnconfigure(0, weight=1)
+        content.columnconfigure(1, weight=1)
+        
+        row = 0
+        
+        # CPU Devices
+        cpu_card = self.create_card(content, "🖥️ Processor")
+        cpu_card.grid(row=row, column=0, sticky="nsew", padx=(0, 10), pady=(0, 15))
+        
+        cpu_info = tk.Frame(cpu_card, bg=ModernTheme.BG_CARD)
+        cpu_info.pack(fill=tk.BOTH, expand=True, padx=15, pady=10)
+        
+        self.create_info_row(cpu_info, "Name:", self.cpu_name[:35]).pack(fill=tk.X, pady=3)
+        self.create_info_row(cpu_info, "Cores:", f"{psutil.cpu_count(logical=False)} Physical").pack(fill=tk.X, pady=3)
+        self.create_info_row(cpu_info, "Threads:", f"{psutil.cpu_count(logical=True)} Logical").pack(fill=tk.X, pady=3)
+        
+        # GPU Devices
+        gpu_card = self.create_card(content, "🎮 Graphics Cards")
+        gpu_card.grid(row=row, column=1, sticky="nsew", padx=(10, 0), pady=(0, 15))
+        
+        gpu_info = tk.Frame(gpu_card, bg=ModernTheme.BG_CARD)
+        gpu_info.pack(fill=tk.BOTH, expand=True, padx=15, pady=10)
+        
+        for i, gpu in enumerate(devices['gpus']):
+            self.create_info_row(gpu_info, f"GPU {i+1}:", gpu[:35]).pack(fill=tk.X, pady=3)
+        
+        if not devices['gpus']:
+            tk.Label(gpu_info, text="✓ Integrated Graphics", font=("Segoe UI", 10),
+                    bg=ModernTheme.BG_CARD, fg=ModernTheme.ACCENT_LIME).pack(pady=10)
+        
+        row += 1
+        
+        # RAM Devices
+        ram_card = self.create_card(content, "💾 Memory Modules")
+        ram_card.grid(row=row, column=0, sticky="nsew", padx=(0, 10), pady=(0, 15))
+        
+        ram_info = tk.Frame(ram_card, bg=ModernTheme.BG_CARD)
+        ram_info.pack(fill=tk.BOTH, expand=True, padx=15, pady=10)
+        
+        self.create_info_row(ram_info, "Total RAM:", f"{self.total_ram_gb} GB").pack(fill=tk.X, pady=3)
+        
+        for i, size_gb, speed in devices['ram_modules']:
+            self.create_info_row(ram_info, f"Module {i+1}:", 
+                                f"{size_gb:.0f} GB @ {speed} MHz").pack(fill=tk.X, pady=2)
+        
+        if not devices['ram_modules']:
+            self.create_info_row(ram_info, "Status:", "✓ Memory Active").pack(fill=tk.X, pady=3)
+        
+        # Storage Devices
+        storage_card = self.create_card(content, "💿 Storage Drives")
+        storage_card.grid(row=row, column=1, sticky="nsew", padx=(10, 0), pady=(0, 15))
+        
+        storage_info = tk.Frame(storage_card, bg=ModernTheme.BG_CARD)
+        storage_info.pack(fill=tk.BOTH, expand=True, padx=15, pady=10)
+        
+        for label, value in devices['drives']:
+            self.create_info_row(storage_info, label, value).pack(fill=tk.X, pady=2)
+        
+        row += 1
+        
+        # Network Adapters
+        network_card = self.create_card(content, "🌐 Network Adapters")
+        network_card.grid(row=row, column=0, sticky="nsew", padx=(0, 10), pady=(0, 15))
+        
+        network_info = tk.Frame(network_card, bg=ModernTheme.BG_CARD)
+        network_info.pack(fill=tk.BOTH, expand=True, padx=15, pady=10)
+        
+        for name, isup, speed in devices['adapters']:
+            status = "🟢" if isup else "🔴"
+            speed_text = f"{speed} Mbps" if speed > 0 else "N/A"
+            self.create_info_row(network_info, f"{status} {name[:25]}:", speed_text).pack(fill=tk.X, pady=2)
+        
+        # USB Devices (actual devices, not just hubs)
+        usb_card = self.create_card(content, "🔌 USB Devices")
+        usb_card.grid(row=row, column=1, sticky="nsew", padx=(10, 0), pady=(0, 15))
+        
+        usb_info = tk.Frame(usb_card, bg=ModernTheme.BG_CARD)
+        usb_info.pack(fill=tk.BOTH, expand=True, padx=15, pady=10)
+        
+        for i, device in enumerate(devices['usb']):
+            # Clean up device name
+            clean_name = device.replace('USB\\', '').replace('VID_', '').replace('PID_', '')
+            if len(clean_name) > 35:
+                clean_name = clean_name[:32] + "..."
+            self.create_info_row(usb_info, f"USB {i+1}:", clean_name).pack(fill=tk.X, pady=2)
+        
+        if not devices['usb']:
+            tk.Label(usb_info, text="✓ USB Ports Active", font=("Segoe UI", 10),
+                    bg=ModernTheme.BG_CARD, fg=ModernTheme.ACCENT_LIME).pack(pady=10)
+        
+        row += 1
+        
+        # Audio Devices with Volume Control
+        audio_card = self.create_card(content, "🔊 Audio Devices & Control")
+        audio_card.grid(row=row, column=0, sticky="nsew", padx=(0, 10), pady=(0, 15))
+        
+        audio_info = tk.Frame(audio_card, bg=ModernTheme.BG_CARD)
+        audio_info.pack(fill=tk.BOTH, expand=True, padx=15, pady=10)
+        
+        # Display devices with icons
+        for i, device in enumerate(devices['audio']):
+            # Determine device type by name
+            if any(x in device.lower() for x in ['speaker', 'realtek', 'audio output']):
+                icon = "🔊"
+                device_type = "Speaker:"
+            elif any(x in device.lower() for x in ['headphone', 'headset']):
+                icon = "🎧"
+                device_type = "Headphone:"
+            elif any(x in device.lower() for x in ['microphone', 'mic', 'input']):
+                icon = "🎤"
+                device_type = "Microphone:"
+            elif any(x in device.lower() for x in ['hdmi', 'displayport']):
+                icon = "📺"
+                device_type = "HDMI Audio:"
+            else:
+                icon = "🔉"
+                device_type = f"Audio {i+1}:"
             
-            # Display devices with icons
-            for i, device in enumerate(unique_devices[:5]):
-                # Determine device type by name
-                if any(x in device.lower() for x in ['speaker', 'realtek', 'audio output']):
-                    icon = "🔊"
-                    device_type = "Speaker:"
-                elif any(x in device.lower() for x in ['headphone', 'headset']):
-                    icon = "🎧"
-                    device_type = "Headphone:"
-                elif any(x in device.lower() for x in ['microphone', 'mic', 'input']):
-                    icon = "🎤"
-                    device_type = "Microphone:"
-                elif any(x in device.lower() for x in ['hdmi', 'displayport']):
-                    icon = "📺"
-                    device_type = "HDMI Audio:"
-                else:
-                    icon = "🔉"
-                    device_type = f"Audio {i+1}:"
-                
-                self.create_info_row(audio_info, f"{icon} {device_type}", device[:35]).pack(fill=tk.X, pady=2)
+            self.create_info_row(audio_info, f"{icon} {device_type}", device[:35]).pack(fill=tk.X, pady=2)
         
-        if not audio_found or not audio_devices_list:
+        if not devices['audio']:
             tk.Label(audio_info, text="✓ Audio System Active", font=("Segoe UI", 10),
                     bg=ModernTheme.BG_CARD, fg=ModernTheme.ACCENT_LIME).pack(pady=5)
         
@@ -1704,12 +2106,12 @@ class SystemDashboardPro:
                                 activebackground=ModernTheme.ACCENT_LIME,
                                 command=lambda v: self.set_volume(int(v)))
         
-        # Get current volume from system
+        # Get current volume from system (COM is initialised on this thread)
         current_vol = 50
         if HAS_PYCAW:
             try:
-                devices = AudioUtilities.GetSpeakers()
-                interface = devices.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
+                speakers = AudioUtilities.GetSpeakers()
+                interface = speakers.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
                 volume = cast(interface, POINTER(IAudioEndpointVolume))
                 current_vol = int(volume.GetMasterVolumeLevelScalar() * 100)
             except: pass
@@ -1717,123 +2119,48 @@ class SystemDashboardPro:
         volume_slider.set(current_vol)
         volume_slider.pack(fill=tk.X)
         
-        # Removed delayed application - relying on system state
-        
-        # Monitors with Brightness Control - Enhanced to show only connected displays
+        # Monitors with Brightness Control (connected displays only)
         monitor_card = self.create_card(content, "🖥️ Displays & Control")
         monitor_card.grid(row=row, column=1, sticky="nsew", padx=(10, 0), pady=(0, 15))
         
         monitor_info = tk.Frame(monitor_card, bg=ModernTheme.BG_CARD)
         monitor_info.pack(fill=tk.BOTH, expand=True, padx=15, pady=10)
         
-        monitor_found = False
-        monitors_list = []
-        
-        # Method 1: Try Win32_PnPEntity for connected monitors (most reliable)
-        try:
-            result = subprocess.run(['wmic', 'path', 'Win32_PnPEntity', 'where', 
-                                   'PNPClass="Monitor" AND Status="OK"', 'get', 'Caption'],
-                                  capture_output=True, text=True, timeout=3, creationflags=subprocess.CREATE_NO_WINDOW)
-            if result.returncode == 0:
-                captions = [line.strip() for line in result.stdout.split('\n')[1:] 
-                           if line.strip() and line.strip() != 'Caption' and 'Generic' not in line]
-                if captions:
-                    monitors_list.extend(captions[:5])
-                    monitor_found = True
-        except:
-            pass
-        
-        # Method 2: Try WMI DesktopMonitor with resolution (if PnP failed)
-        if not monitor_found:
-            try:
-                result = subprocess.run(['wmic', 'path', 'Win32_DesktopMonitor', 'where', 
-                                       'Availability=3', 'get', 'name,ScreenWidth,ScreenHeight'],
-                                      capture_output=True, text=True, timeout=3, creationflags=subprocess.CREATE_NO_WINDOW)
-                if result.returncode == 0:
-                    lines = [line.strip() for line in result.stdout.split('\n')[1:] 
-                            if line.strip() and 'Name' not in line and 'ScreenHeight' not in line]
-                    for line in lines:
-                        if line:
-                            parts = line.split()
-                            if len(parts) >= 1:
-                                monitor_name = ' '.join(parts[:-2]) if len(parts) > 2 else parts[0]
-                                width = parts[-2] if len(parts) > 2 else ''
-                                height = parts[-1] if len(parts) > 1 else ''
-                                
-                                if width and height and width.isdigit() and height.isdigit():
-                                    monitors_list.append(f"{monitor_name} ({width}x{height})")
-                                else:
-                                    monitors_list.append(monitor_name)
-                                monitor_found = True
-            except:
-                pass
-        
-        # Method 3: Use PowerShell to get only active monitors
-        if not monitor_found:
-            try:
-                ps_script = "Get-WmiObject -Namespace root\\wmi -Class WmiMonitorID | ForEach-Object { [System.Text.Encoding]::ASCII.GetString($_.UserFriendlyName -notmatch 0) }"
-                result = subprocess.run(['powershell', '-Command', ps_script],
-                                      capture_output=True, text=True, timeout=3, creationflags=subprocess.CREATE_NO_WINDOW)
-                if result.returncode == 0:
-                    lines = [line.strip() for line in result.stdout.split('\n') 
-                            if line.strip() and line.strip() != '']
-                    if lines:
-                        monitors_list.extend(lines[:5])
-                        monitor_found = True
-            except:
-                pass
-        
-        # Method 4: Fallback - Get screen resolution only
-        if not monitor_found:
-            try:
-                from ctypes import windll
-                user32 = windll.user32
-                width = user32.GetSystemMetrics(0)
-                height = user32.GetSystemMetrics(1)
-                monitors_list.append(f"Primary Display ({width}x{height})")
-                monitor_found = True
-            except:
-                pass
-        
-        # Display only connected monitors with individual brightness controls
-        if monitors_list:
-            for i, monitor in enumerate(monitors_list[:5]):
-                # Monitor info row
-                icon = "🖥️" if i == 0 else "🖵"
-                label = "Primary:" if i == 0 else f"Monitor {i+1}:"
-                self.create_info_row(monitor_info, f"{icon} {label}", monitor[:35]).pack(fill=tk.X, pady=2)
-                
-                # Individual brightness control for this monitor
-                brightness_frame = tk.Frame(monitor_info, bg=ModernTheme.BG_CARD)
-                brightness_frame.pack(fill=tk.X, pady=(5, 10))
-                
-                tk.Label(brightness_frame, text=f"💡 Brightness:", font=("Segoe UI", 8),
-                        bg=ModernTheme.BG_CARD, fg=ModernTheme.TEXT_SECONDARY).pack(anchor="w")
-                
-                brightness_slider = tk.Scale(brightness_frame, from_=0, to=100, orient=tk.HORIZONTAL,
-                                            bg=ModernTheme.BG_DARK, fg=ModernTheme.ACCENT_TERTIARY,
-                                            highlightthickness=0, troughcolor=ModernTheme.BG_SIDEBAR,
-                                            activebackground=ModernTheme.ACCENT_ORANGE,
-                                            command=lambda v, idx=i: self.set_brightness(int(v), idx))
-                
-                # Get current system brightness
-                current_br = 75
-                if HAS_SBC:
-                    try:
-                        vals = sbc.get_brightness(display=i)
+        # Individual brightness control per connected monitor
+        for i, monitor in enumerate(devices['monitors']):
+            # Monitor info row
+            icon = "🖥️" if i == 0 else "🖵"
+            label = "Primary:" if i == 0 else f"Monitor {i+1}:"
+            self.create_info_row(monitor_info, f"{icon} {label}", monitor[:35]).pack(fill=tk.X, pady=2)
+            
+            brightness_frame = tk.Frame(monitor_info, bg=ModernTheme.BG_CARD)
+            brightness_frame.pack(fill=tk.X, pady=(5, 10))
+            
+            tk.Label(brightness_frame, text=f"💡 Brightness:", font=("Segoe UI", 8),
+                    bg=ModernTheme.BG_CARD, fg=ModernTheme.TEXT_SECONDARY).pack(anchor="w")
+            
+            brightness_slider = tk.Scale(brightness_frame, from_=0, to=100, orient=tk.HORIZONTAL,
+                                        bg=ModernTheme.BG_DARK, fg=ModernTheme.ACCENT_TERTIARY,
+                                        highlightthickness=0, troughcolor=ModernTheme.BG_SIDEBAR,
+                                        activebackground=ModernTheme.ACCENT_ORANGE,
+                                        command=lambda v, idx=i: self.set_brightness(int(v), idx))
+            
+            # Get current system brightness
+            current_br = 75
+            if HAS_SBC:
+                try:
+                    vals = sbc.get_brightness(display=i)
+                    if vals: current_br = vals[0]
+                except: 
+                    try: 
+                        vals = sbc.get_brightness()
                         if vals: current_br = vals[0]
-                    except: 
-                        try: 
-                            vals = sbc.get_brightness()
-                            if vals: current_br = vals[0]
-                        except: pass
-                
-                brightness_slider.set(current_br)
-                brightness_slider.pack(fill=tk.X)
-                
-                # Removed delayed application - relying on system state
+                    except: pass
+            
+            brightness_slider.set(current_br)
+            brightness_slider.pack(fill=tk.X)
         
-        if not monitor_found or not monitors_list:
+        if not devices['monitors']:
             tk.Label(monitor_info, text="✓ Primary Display Active", font=("Segoe UI", 10),
                     bg=ModernTheme.BG_CARD, fg=ModernTheme.ACCENT_LIME).pack(pady=5)
             
@@ -2002,9 +2329,17 @@ class SystemDashboardPro:
     
     def show_network(self):
         """Network monitoring view with all adapters"""
-        self.switch_section("network")
+        # The page lists adapters, so rebuild it only when the adapter set changes
+        try:
+            adapters = tuple(sorted((name, st.isup) for name, st in psutil.net_if_stats().items()))
+        except Exception:
+            adapters = None
+        page = self.switch_section("network", rebuild=adapters != self.network_adapters)
+        self.network_adapters = adapters
+        if page is None:
+            return
         
-        header = tk.Frame(self.content_frame, bg=ModernTheme.BG_DARK)
+        header = tk.Frame(page, bg=ModernTheme.BG_DARK)
         header.pack(fill=tk.X, padx=30, pady=20)
         
         tk.Label(header, text="Network Monitor", font=("Segoe UI", 24, "bold"),
@@ -2015,7 +2350,7 @@ class SystemDashboardPro:
                              bg=ModernTheme.BG_DARK, fg=ModernTheme.ACCENT_PRIMARY)
         self.net_time_label.pack(side=tk.RIGHT)
         
-        content = tk.Frame(self.content_frame, bg=ModernTheme.BG_DARK)
+        content = tk.Frame(page, bg=ModernTheme.BG_DARK)
         content.pack(fill=tk.BOTH, expand=True, padx=30, pady=10)
         
         # Get network interfaces
@@ -2131,9 +2466,11 @@ class SystemDashboardPro:
     
     def show_settings(self):
         """Settings view with configuration options"""
-        self.switch_section("settings")
+        page = self.switch_section("settings")
+        if page is None:
+            return
         
-        header = tk.Frame(self.content_frame, bg=ModernTheme.BG_DARK)
+        header = tk.Frame(page, bg=ModernTheme.BG_DARK)
         header.pack(fill=tk.X, padx=30, pady=20)
         
         tk.Label(header, text="Settings", font=("Segoe UI", 24, "bold"),
@@ -2144,7 +2481,7 @@ class SystemDashboardPro:
                              bg=ModernTheme.BG_DARK, fg=ModernTheme.ACCENT_PRIMARY)
         self.set_time_label.pack(side=tk.RIGHT)
         
-        content = tk.Frame(self.content_frame, bg=ModernTheme.BG_DARK)
+        content = tk.Frame(page, bg=ModernTheme.BG_DARK)
         content.pack(fill=tk.BOTH, expand=True, padx=30, pady=10)
         
         # Monitoring Thresholds
@@ -2260,7 +2597,10 @@ class SystemDashboardPro:
         """Save settings"""
         try:
             self.threshold_cpu = int(self.cpu_threshold_var.get())
+            self.cpu_throttler.arm_percent = self.threshold_cpu
             self.threshold_ram = int(self.ram_threshold_var.get())
+            self.policy.set_param("threshold_cpu", self.threshold_cpu)
+            self.policy.set_param("threshold_ram", self.threshold_ram)
             self.monitor_interval = int(self.interval_var.get())
             self.save_config()
             messagebox.showinfo("Settings", "Settings saved successfully!")
@@ -2270,7 +2610,10 @@ class SystemDashboardPro:
     def reset_settings(self):
         """Reset to default settings"""
         self.threshold_cpu = 85
+        self.cpu_throttler.arm_percent = self.threshold_cpu
         self.threshold_ram = 85
+        self.policy.set_param("threshold_cpu", self.threshold_cpu)
+        self.policy.set_param("threshold_ram", self.threshold_ram)
         self.monitor_interval = 250
         self.cpu_threshold_var.set("85")
         self.ram_threshold_var.set("85")
@@ -2279,9 +2622,9 @@ class SystemDashboardPro:
         messagebox.showinfo("Settings", "Settings reset to defaults")
     
     def export_logs(self):
-        """Export performance logs"""
-        if os.path.exists(self.csv_file):
-            messagebox.showinfo("Export", f"Logs available at:\n{os.path.abspath(self.csv_file)}")
+        """Export performance logs (the metrics history the dashboard writes)"""
+        if os.path.exists(self.metrics_store.path):
+            messagebox.showinfo("Export", f"Logs available at:\n{os.path.abspath(self.metrics_store.path)}")
         else:
             messagebox.showwarning("Export", "No logs available yet")
     
@@ -2374,189 +2717,233 @@ class SystemDashboardPro:
         
         return btn_frame
     
+    def create_device_inventory(self):
+        """Device probes for the Devices page and the signature keys each depends on"""
+        inventory = DeviceInventory(ttl=self.config.get('device_inventory_ttl', 600),
+                                    poll_interval=self.config.get('device_poll_interval', 2.0))
+        inventory.add("gpus", self._probe_gpu_names, watch=("pnp", "display"), default=[])
+        inventory.add("ram_modules", self._probe_ram_modules, default=[])
+        inventory.add("drives", self._probe_drives, watch=("pnp", "storage"), default=[])
+        inventory.add("adapters", self._probe_adapters, watch=("net",), default=[])
+        inventory.add("usb", self._probe_usb_devices, watch=("pnp", "usb"), default=[])
+        inventory.add("audio", self._probe_audio_devices, watch=("pnp", "audio"), default=[])
+        inventory.add("monitors", self._probe_monitors, watch=("pnp", "display"), default=[])
+        # Performance page
+        inventory.add("gpu_adapters", self._probe_gpu_adapters, watch=("pnp", "display"), default={})
+        inventory.add("volumes", self._probe_volumes, watch=("storage",), default=[])
+        return inventory
+    
+    def create_collectors(self):
+        """Register one collector per metric source with its own cadence"""
+        overrides = self.config.get('collector_intervals', {})
+        
+        def interval(name, default):
+            try:
+                return float(overrides.get(name, default))
+            except (TypeError, ValueError):
+                return default
+        
+        registry = CollectorRegistry()
+        # Fast counters
+        registry.add("cpu", self._probe_cpu, interval("cpu", 0.25), timeout=1)
+        registry.add("memory", self._probe_memory, interval("memory", 0.25), timeout=1)
+        registry.add("net", self._probe_net, interval("net", 0.5), timeout=1)
+        registry.add("disk", self._probe_disk, interval("disk", 0.5), timeout=1)
+        registry.add("perf_info", self._probe_perf_info, interval("perf_info", 1.0), timeout=1)
+        # Slow probes (WMI / subprocess)
+        registry.add("cpu_freq", self._probe_cpu_freq, interval("cpu_freq", 1.0), timeout=3)
+        registry.add("thermal", self._probe_thermal, interval("thermal", 2.0), timeout=5)
+        registry.add("fans", self._probe_fans, interval("fans", 2.0), timeout=5)
+        registry.add("gpu", self._probe_gpu, interval("gpu", 1.0), timeout=2)
+        # Per-process CPU windows; only samples while the CPU throttler is armed
+        registry.add("cpu_procs", self.cpu_throttler.sample, interval("cpu_procs", 1.0), timeout=5)
+        return registry
+    
+    def _probe_cpu(self):
+        # Non-blocking: measures usage since the previous call
+        return self.backend.cpu_percent()
+    
+    def _probe_memory(self):
+        total, used, percent, available, cached = self.backend.memory()
+        return {
+            "ram_p": percent,
+            "ram_used": round(used / (1024**3), 1),
+            "ram_total": round(total / (1024**3), 1),
+            "ram_avail": round(available / (1024**3), 1),
+            "ram_cached": round(cached / (1024**3), 1),
+        }
+    
+    def _probe_cpu_freq(self):
+        """Current CPU clock in GHz (wmic fallback when psutil reports nothing)"""
+        cpu_freq = psutil.cpu_freq()
+        if cpu_freq and cpu_freq.current > 0:
+            return cpu_freq.current / 1000
+        result = subprocess.run(['wmic', 'cpu', 'get', 'CurrentClockSpeed'],
+                                capture_output=True, text=True, timeout=2,
+                                creationflags=subprocess.CREATE_NO_WINDOW)
+        lines = [l.strip() for l in result.stdout.split('\n') if l.strip() and l.strip() != 'CurrentClockSpeed']
+        return int(lines[0]) / 1000
+    
+    def _probe_fans(self):
+        """Fan speeds (RPM) from OpenHardwareMonitor"""
+        if not self.wmi_obj:
+            return ()
+        return tuple(int(sensor.Value) for sensor in self.wmi_obj.Sensor()
+                     if sensor.SensorType == u'Fan')
+    
+    def _probe_perf_info(self):
+        processes, threads = self.backend.task_counts()
+        return {"processes": processes, "threads": threads}
+    
+    def _probe_net(self):
+        self.rates.update_nics(self.backend.nic_counters())
+        total = self.rates.net_total
+        return {"net_send": total["send_bits_s"] / 1000000, "net_recv": total["recv_bits_s"] / 1000000}  # Mbps
+    
+    def _probe_disk(self):
+        self.rates.update_disks(self.backend.disk_counters())
+        total = self.rates.disk_total
+        return min(100, ((total["read_bytes_s"] + total["write_bytes_s"]) / (1024**2)) * 2)
+    
+    def create_temp_cascade(self):
+        """CPU temperature sources in priority order (first working one is pinned)"""
+        sources = []
+        if self.backend.name == "procfs":
+            # Open hwmon/thermal_zone file, re-read with pread
+            sources.append(("sysfs hwmon", self.backend.cpu_temperature))
+        return SourceCascade(sources + [
+            ("OpenHardwareMonitor", self._temp_ohm),
+            ("ACPI Thermal Zone", self._temp_acpi),
+            ("psutil sensors", self._temp_psutil),
+            ("LibreHardwareMonitor", self._temp_lhm),
+            ("PowerShell", self._temp_powershell),
+        ], accept=lambda t: t > 0)
+    
+    def _probe_thermal(self):
+        """CPU temperature from the pinned source (0 if none works)"""
+        return self.temp_sources.read() or 0
+    
+    # Each source returns a temperature in °C, or None if it can't provide one
+    def _temp_ohm(self):
+        # Method 1: WMI OpenHardwareMonitor
+        if not self.wmi_obj:
+            return None
+        for s in self.wmi_obj.Sensor():
+            if s.SensorType == u'Temperature' and 'cpu' in s.Name.lower():
+                return int(s.Value) or None
+        return None
+    
+    def _temp_acpi(self):
+        # Method 2: WMI MSAcpi_ThermalZoneTemperature (connection reused between reads)
+        if not HAS_WMI:
+            return None
+        if self._wmi_root is None:
+            self._wmi_root = wmi.WMI(namespace="root\\wmi")
+        temperature_info = self._wmi_root.MSAcpi_ThermalZoneTemperature()[0]
+        return int((temperature_info.CurrentTemperature / 10.0) - 273.15)
+    
+    def _temp_psutil(self):
+        # Method 3: psutil sensors (Linux/some systems)
+        if not hasattr(psutil, 'sensors_temperatures'):
+            return None
+        temps = psutil.sensors_temperatures()
+        for name, entries in (temps or {}).items():
+            if 'coretemp' in name.lower() or 'cpu' in name.lower():
+                if entries:
+                    return int(entries[0].current)
+        return None
+    
+    def _temp_lhm(self):
+        # Method 4: LibreHardwareMonitor via WMI
+        if not HAS_WMI:
+            return None
+        if self._wmi_lhm is None:
+            self._wmi_lhm = wmi.WMI(namespace="root\\LibreHardwareMonitor")
+        for sensor in self._wmi_lhm.Sensor():
+            if 'temperature' in sensor.SensorType.lower() and 'cpu' in sensor.Name.lower():
+                return int(sensor.Value)
+        return None
+    
+    def _temp_powershell(self):
+        # Method 5: PowerShell WMI query (persistent session)
+        out = get_broker().query(
+            'Get-WmiObject MSAcpi_ThermalZoneTemperature -Namespace root/wmi | Select-Object -First 1 -ExpandProperty CurrentTemperature',
+            timeout=2)
+        if not out:
+            return None
+        kelvin = float(out)
+        return int((kelvin / 10.0) - 273.15)
+    
+    def _probe_gpu(self):
+        """First GPU's load and temperature from the shared telemetry stream"""
+        telemetry = get_gpu_telemetry()
+        gpu = telemetry.gpu(0)
+        if gpu is None or telemetry.is_stale():
+            raise RuntimeError("no GPU telemetry")
+        return {"gpu_p": gpu["util"] or 0, "gpu_temp": int(gpu["temp"] or 0)}
+    
     def monitor_thread(self):
-        """Background monitoring thread with complete system info"""
-        last_disk_io = psutil.disk_io_counters(perdisk=True)
-        last_net_io = psutil.net_io_counters()
-        last_check = time.time()
+        """Background thread that publishes collector values and drives auto-optimization"""
+        self.collectors.start()
+        last_history = 0.0
         
         while True:
             try:
                 now = time.time()
-                dt = max(0.5, now - last_check)
-                
-                # CPU & RAM
-                cpu_p = psutil.cpu_percent(interval=0.1)
-                mem = psutil.virtual_memory()
-                
-                self.ui_data["cpu_p"] = cpu_p
-                self.ui_data["ram_p"] = mem.percent
-                self.ui_data["ram_used"] = round(mem.used / (1024**3), 1)
-                self.ui_data["ram_total"] = round(mem.total / (1024**3), 1)
-                
-                # Performance info
-                pi = PERFORMANCE_INFORMATION()
-                pi.cb = ctypes.sizeof(pi)
-                psapi.GetPerformanceInfo(ctypes.byref(pi), pi.cb)
-                
-                self.ui_data["processes"] = pi.ProcessCount
-                self.ui_data["threads"] = pi.ThreadCount
+                c = self.collectors
+                
+                # Gather this tick's values, then publish them in one swap
+                cpu_p = c.get("cpu", 0)
+                values = {"cpu_p": cpu_p, "disk_p": c.get("disk", 0), "cpu_temp": c.get("thermal", 0),
+                          "cpu_freq": c.get("cpu_freq", 0), "fan_speeds": c.get("fans", ())}
+                values.update(c.get("memory", {}))
+                values.update(c.get("perf_info", {}))
+                values.update(c.get("net", {}))
+                
+                # GPU: fall back to an estimate when there is no NVIDIA telemetry
+                if c["gpu"].is_stale():
+                    values["gpu_p"] = min(100, cpu_p * 0.7)
+                    values["gpu_temp"] = 0
+                else:
+                    values.update(c.get("gpu", {}))
                 
                 # Uptime
-                uptime_sec = time.time() - psutil.boot_time()
-                self.ui_data["uptime"] = str(timedelta(seconds=int(uptime_sec)))
-                
-                # CPU Temp (multiple methods)
-                cpu_temp_value = 0
-                
-                # Method 1: WMI OpenHardwareMonitor
-                if self.wmi_obj:
-                    try:
-                        for s in self.wmi_obj.Sensor():
-                            if s.SensorType == u'Temperature' and 'cpu' in s.Name.lower():
-                                cpu_temp_value = int(s.Value)
-                                break
-                    except: pass
-                
-                # Method 2: WMI MSAcpi_ThermalZoneTemperature (if OHM failed)
-                if cpu_temp_value == 0:
-                    try:
-                        import wmi
-                        w = wmi.WMI(namespace="root\\wmi")
-                        temperature_info = w.MSAcpi_ThermalZoneTemperature()[0]
-                        cpu_temp_value = int((temperature_info.CurrentTemperature / 10.0) - 273.15)
-                    except: pass
-                
-                # Method 3: psutil sensors (Linux/some systems)
-                if cpu_temp_value == 0:
-                    try:
-                        if hasattr(psutil, 'sensors_temperatures'):
-                            temps = psutil.sensors_temperatures()
-                            if temps:
-                                for name, entries in temps.items():
-                                    if 'coretemp' in name.lower() or 'cpu' in name.lower():
-                                        if entries:
-                                            cpu_temp_value = int(entries[0].current)
-                                            break
-                    except: pass
-                
-                # Method 4: LibreHardwareMonitor via WMI
-                if cpu_temp_value == 0:
-                    try:
-                        import wmi
-                        w = wmi.WMI(namespace="root\\LibreHardwareMonitor")
-                        for sensor in w.Sensor():
-                            if 'temperature' in sensor.SensorType.lower() and 'cpu' in sensor.Name.lower():
-                                cpu_temp_value = int(sensor.Value)
-                                break
-                    except: pass
-                
-                # Method 5: PowerShell WMI query
-                if cpu_temp_value == 0:
-                    try:
-                        result = subprocess.run(
-                            ['powershell', '-Command', 
-                             'Get-WmiObject MSAcpi_ThermalZoneTemperature -Namespace root/wmi | Select-Object -First 1 -ExpandProperty CurrentTemperature'],
-                            capture_output=True, text=True, timeout=2
-                        )
-                        if result.returncode == 0 and result.stdout.strip():
-                            kelvin = float(result.stdout.strip())
-                            cpu_temp_value = int((kelvin / 10.0) - 273.15)
-                    except: pass
-                
-                self.ui_data["cpu_temp"] = cpu_temp_value if cpu_temp_value > 0 else 0
-                
-                # GPU (try nvidia-smi)
-                try:
-                    result = subprocess.run(['nvidia-smi', '--query-gpu=utilization.gpu', 
-                                           '--format=csv,noheader,nounits'], 
-                                          capture_output=True, text=True, timeout=1)
-                    if result.returncode == 0:
-                        self.ui_data["gpu_p"] = float(result.stdout.strip())
-                except:
-                    self.ui_data["gpu_p"] = min(100, cpu_p * 0.7)
-                
-                # Network
-                nio = psutil.net_io_counters()
-                send_bps = ((nio.bytes_sent - last_net_io.bytes_sent) * 8) / dt
-                recv_bps = ((nio.bytes_recv - last_net_io.bytes_recv) * 8) / dt
-                
-                self.ui_data["net_send"] = send_bps / 1000000  # Mbps
-                self.ui_data["net_recv"] = recv_bps / 1000000
-                
-                last_net_io = nio
+                uptime_sec = now - self.boot_timestamp
+                values["uptime"] = str(timedelta(seconds=int(uptime_sec)))
                 
-                # Disk
-                dio = psutil.disk_io_counters(perdisk=True)
-                total_read = total_write = 0
-                for dname, cnt in dio.items():
-                    if dname in last_disk_io:
-                        prev = last_disk_io[dname]
-                        total_read += (cnt.read_bytes - prev.read_bytes) / dt
-                        total_write += (cnt.write_bytes - prev.write_bytes) / dt
-                
-                self.ui_data["disk_p"] = min(100, ((total_read + total_write) / (1024**2)) * 2)
-                last_disk_io = dio
+                snap = MetricSnapshot(seq=self.ui_data.seq + 1, timestamp=time.monotonic(), **values)
+                self.ui_data = snap
                 
                 # History
-                self.history_cpu.append(cpu_p)
-                self.history_ram.append(mem.percent)
-                self.history_gpu.append(self.ui_data["gpu_p"])
-                
-                last_check = now
-                
-                # Auto-optimization check (RAM)
+                self.history_cpu.append(snap.cpu_p)
+                self.history_ram.append(snap.ram_p)
+                self.history_gpu.append(snap.gpu_p)
+                
+                # Arms per-process CPU sampling under load, restores priorities when calm
+                if self.auto_optimize_enabled or self.cpu_throttler.demoted:
+                    self.cpu_throttler.on_load(cpu_p)
+                
+                # History: one sample per second of this 4 Hz loop (written on the store's own thread)
+                if now - last_history >= self.metrics_store.sample_interval:
+                    last_history = now
+                    self.metrics_store.add(now, {"cpu_p": snap.cpu_p, "ram_p": snap.ram_p,
+                                                 "gpu_p": snap.gpu_p, "disk_p": snap.disk_p,
+                                                 "cpu_temp": snap.cpu_temp or None})
+                
+                # RAM trend forecast
+                self.ram_forecaster.update(snap.ram_p, snap.timestamp)
+                forecast = self.ram_forecast = self.ram_forecaster.forecast(self.threshold_ram)
+                
+                # Auto-optimization rules (dashboard_config.json)
                 if self.auto_optimize_enabled:
-                    ram_percent = self.ui_data["ram_p"]
-                    cpu_percent = self.ui_data["cpu_p"]
-                    
-                    # Check RAM threshold with 10s persistence
-                    if ram_percent >= self.threshold_ram:
-                        if self.ram_high_start_time is None:
-                            self.ram_high_start_time = now
-                        
-                        elif (now - self.ram_high_start_time) >= 10:
-                            # High for > 10 seconds
-                            time_since_last = now - self.last_auto_optimize_time
-                            
-                            if time_since_last >= self.auto_optimize_cooldown:
-                                self.last_auto_optimize_time = now
-                                self.ram_high_start_time = None # Reset counter
-                                # Silent auto-optimization (no popup)
-                                if not self.silent_mode:
-                                    self.root.after(0, lambda rp=ram_percent: messagebox.showwarning(
-                                        "Auto-Optimization",
-                                        f"⚠️ RAM usage is high ({rp:.1f}%)\n\n"
-                                        f"Auto-optimization starting now..."
-                                    ))
-                                threading.Thread(target=self._optimize_ram_thread, daemon=True).start()
-                            else:
-                                # Cooldown active - reset timer for next cycle
-                                self.ram_high_start_time = now
-                    else:
-                        self.ram_high_start_time = None
-                    
-                    # Check CPU threshold with 10s persistence
-                    if cpu_percent >= self.threshold_cpu:
-                        if self.cpu_high_start_time is None:
-                            self.cpu_high_start_time = now
-                        
-                        elif (now - self.cpu_high_start_time) >= 10:
-                            # High for > 10 seconds
-                            time_since_last_cpu = now - self.last_cpu_optimize_time
-                            
-                            if time_since_last_cpu >= self.auto_optimize_cooldown:
-                                self.last_cpu_optimize_time = now
-                                self.cpu_high_start_time = None # Reset counter
-                                # Silent CPU optimization
-                                threading.Thread(target=self._optimize_cpu_thread, daemon=True).start()
-                            else:
-                                # Cooldown active - reset for next cycle
-                                self.cpu_high_start_time = now
-                    else:
-                        self.cpu_high_start_time = None
+                    self.policy.evaluate({"ram_p": snap.ram_p, "cpu_p": snap.cpu_p,
+                                          "gpu_p": snap.gpu_p, "disk_p": snap.disk_p,
+                                          "cpu_temp": snap.cpu_temp,
+                                          "ram_eta": forecast.eta if forecast.eta is not None
+                                          else float('inf')},
+                                         snap.timestamp)
                 
-                time.sleep(0.5)
+                time.sleep(0.25)
                 
             except Exception as e:
                 print(f"Monitor error: {e}")
@@ -2567,265 +2954,288 @@ class SystemDashboardPro:
         try:
             # Update clock
             if hasattr(self, 'clock_label') and self.clock_label.winfo_exists():
-                self.clock_label.config(text=datetime.now().strftime("%H:%M:%S"))
+                self.binder.config(self.clock_label, text=datetime.now().strftime("%H:%M:%S"))
             
             # Update time labels on all pages
             current_time = datetime.now().strftime("%H:%M:%S")
             if hasattr(self, 'perf_time_label') and self.perf_time_label.winfo_exists():
-                self.perf_time_label.config(text=current_time)
+                self.binder.config(self.perf_time_label, text=current_time)
             if hasattr(self, 'mon_time_label') and self.mon_time_label.winfo_exists():
-                self.mon_time_label.config(text=current_time)
+                self.binder.config(self.mon_time_label, text=current_time)
             if hasattr(self, 'dev_time_label') and self.dev_time_label.winfo_exists():
-                self.dev_time_label.config(text=current_time)
+                self.binder.config(self.dev_time_label, text=current_time)
             if hasattr(self, 'net_time_label') and self.net_time_label.winfo_exists():
-                self.net_time_label.config(text=current_time)
+                self.binder.config(self.net_time_label, text=current_time)
             if hasattr(self, 'set_time_label') and self.set_time_label.winfo_exists():
-                self.set_time_label.config(text=current_time)
+                self.binder.config(self.set_time_label, text=current_time)
             
-            # Update dashboard if active
-            if self.current_section == "dashboard":
-                # CPU
-                if hasattr(self, 'cpu_progress') and self.cpu_progress.winfo_exists():
-                    cpu_color = ModernTheme.ACCENT_LIME if self.ui_data["cpu_p"] < 50 else \
-                               ModernTheme.ACCENT_ORANGE if self.ui_data["cpu_p"] < 80 else ModernTheme.DANGER
-                    
-                    cpu_label = "CPU Load"
-                    if self.cpu_high_start_time:
-                        d = int(time.time() - self.cpu_high_start_time)
-                        cpu_label = f"High Load ({d}s)"
-                        
-                    self.cpu_progress.set_value(self.ui_data["cpu_p"], 
-                                               f"{int(self.ui_data['cpu_p'])}%",
-                                               cpu_label, cpu_color)
-                
-                if hasattr(self, 'cpu_graph') and self.cpu_graph.winfo_exists():
-                    self.cpu_graph.add_value(self.ui_data["cpu_p"])
-                
-                # RAM
-                if hasattr(self, 'ram_progress') and self.ram_progress.winfo_exists():
-                    ram_color = ModernTheme.ACCENT_PRIMARY if self.ui_data["ram_p"] < 50 else \
-                               ModernTheme.ACCENT_SECONDARY if self.ui_data["ram_p"] < 80 else ModernTheme.DANGER
-                    
-                    ram_label = f"{self.ui_data['ram_used']}/{self.ui_data['ram_total']} GB"
-                    if self.ram_high_start_time:
-                        d = int(time.time() - self.ram_high_start_time)
-                        ram_label += f"\nHigh ({d}s)"
-                        
-                    self.ram_progress.set_value(self.ui_data["ram_p"],
-                                               f"{int(self.ui_data['ram_p'])}%",
-                                               ram_label,
-                                               ram_color)
-                
-                if hasattr(self, 'ram_graph') and self.ram_graph.winfo_exists():
-                    self.ram_graph.add_value(self.ui_data["ram_p"])
-                
-                # GPU
-                if hasattr(self, 'gpu_progress') and self.gpu_progress.winfo_exists():
-                    gpu_color = ModernTheme.ACCENT_TERTIARY if self.ui_data["gpu_p"] < 70 else ModernTheme.ACCENT_ORANGE
-                    self.gpu_progress.set_value(self.ui_data["gpu_p"],
-                                               f"{int(self.ui_data['gpu_p'])}%",
-                                               "GPU Load", gpu_color)
-                
-                # Info labels
-                if hasattr(self, 'info_labels'):
-                    for label_key, label_widget in self.info_labels.items():
-                        if label_widget.winfo_exists():
-                            if "Processes:" in label_key:
-                                label_widget.config(text=str(self.ui_data["processes"]))
-                            elif "Threads:" in label_key:
-                                label_widget.config(text=str(self.ui_data.get("threads", 0)))
-                            elif "Uptime:" in label_key:
-                                label_widget.config(text=self.ui_data["uptime"])
-            
-            # Update performance page if active
-            elif self.current_section == "performance":
-                # Update CPU gauge and frequency
-                if hasattr(self, 'perf_cpu_gauge') and self.perf_cpu_gauge.winfo_exists():
-                    cpu_pct = self.ui_data["cpu_p"]
-                    cpu_color = ModernTheme.ACCENT_LIME if cpu_pct < 50 else \
-                               ModernTheme.ACCENT_ORANGE if cpu_pct < 80 else ModernTheme.DANGER
-                    self.perf_cpu_gauge.set_value(cpu_pct, f"{int(cpu_pct)}%", "CPU", cpu_color)
-                
-                if hasattr(self, 'perf_cpu_freq') and self.perf_cpu_freq.winfo_exists():
-                    cpu_freq = psutil.cpu_freq()
-                    if cpu_freq and cpu_freq.current > 0:
-                        # Show actual current frequency (not max)
-                        self.perf_cpu_freq.config(text=f"{cpu_freq.current/1000:.2f} GHz")
-                    else:
-                        # Fallback: Try to get from WMI
-                        try:
-                            result = subprocess.run(['wmic', 'cpu', 'get', 'CurrentClockSpeed'],
-                                                  capture_output=True, text=True, timeout=1, 
-                                                  creationflags=subprocess.CREATE_NO_WINDOW)
-                            if result.returncode == 0:
-                                lines = [l.strip() for l in result.stdout.split('\n') if l.strip() and l.strip() != 'CurrentClockSpeed']
-                                if lines:
-                                    mhz = int(lines[0])
-                                    self.perf_cpu_freq.config(text=f"{mhz/1000:.2f} GHz")
-                        except:
-                            pass
-                
-                # Update RAM gauge and metrics
-                if hasattr(self, 'perf_ram_gauge') and self.perf_ram_gauge.winfo_exists():
-                    ram_pct = self.ui_data["ram_p"]
-                    ram_color = ModernTheme.ACCENT_PRIMARY if ram_pct < 50 else \
-                               ModernTheme.ACCENT_SECONDARY if ram_pct < 80 else ModernTheme.DANGER
-                    self.perf_ram_gauge.set_value(ram_pct, f"{int(ram_pct)}%", "Memory", ram_color)
-                
-                if hasattr(self, 'perf_ram_used') and self.perf_ram_used.winfo_exists():
-                    mem = psutil.virtual_memory()
-                    self.perf_ram_used.config(text=f"{mem.used/(1024**3):.1f} GB")
-                    if hasattr(self, 'perf_ram_avail') and self.perf_ram_avail.winfo_exists():
-                        self.perf_ram_avail.config(text=f"{mem.available/(1024**3):.1f} GB")
-                    
-                    # Update cached memory
-                    if hasattr(self, 'perf_ram_cached') and self.perf_ram_cached.winfo_exists():
-                        try:
-                            pi = PERFORMANCE_INFORMATION()
-                            pi.cb = ctypes.sizeof(pi)
-                            psapi.GetPerformanceInfo(ctypes.byref(pi), pi.cb)
-                            cached_gb = (pi.SystemCache * pi.PageSize) / (1024**3)
-                            self.perf_ram_cached.config(text=f"{cached_gb:.1f} GB")
-                        except:
-                            # Fallback calculation
-                            try:
-                                cached_gb = (mem.available - mem.free) / (1024**3)
-                                if cached_gb > 0:
-                                    self.perf_ram_cached.config(text=f"{cached_gb:.1f} GB")
-                            except:
-                                pass
-                
-                # Update GPU gauge and utilization
-                if getattr(self, 'perf_gpu_gauge', None) and self.perf_gpu_gauge.winfo_exists():
-                    gpu_pct = self.ui_data["gpu_p"]
-                    gpu_color = ModernTheme.ACCENT_TERTIARY if gpu_pct < 70 else ModernTheme.ACCENT_ORANGE
-                    self.perf_gpu_gauge.set_value(gpu_pct, f"{int(gpu_pct)}%", "GPU", gpu_color)
-                
-                if getattr(self, 'perf_gpu_util', None) and self.perf_gpu_util.winfo_exists():
-                    self.perf_gpu_util.config(text=f"{int(self.ui_data['gpu_p'])}%")
+            # Devices page: rebuild from the inventory cache once it changes
+            if self.current_section == "devices" and self.device_inventory.ready and \
+                    self.device_inventory.version != self.devices_version:
+                self.show_devices()
             
-            # Update monitoring page if active
-            elif self.current_section == "monitoring":
-                # Update CPU temperature
-                if hasattr(self, 'mon_cpu_temp') and self.mon_cpu_temp.winfo_exists():
-                    cpu_temp = self.ui_data.get("cpu_temp", 0)
-                    if cpu_temp and cpu_temp > 0:
-                        temp_color = ModernTheme.SUCCESS if cpu_temp < 60 else \
-                                    ModernTheme.WARNING if cpu_temp < 80 else ModernTheme.DANGER
-                        self.mon_cpu_temp.config(text=f"{cpu_temp}°C", fg=temp_color)
-                    else:
-                        self.mon_cpu_temp.config(text="--°C")
-                
-                # Update GPU temperature
-                if hasattr(self, 'mon_gpu_temp') and self.mon_gpu_temp.winfo_exists():
-                    try:
-                        result = subprocess.run(['nvidia-smi', '--query-gpu=temperature.gpu',
-                                               '--format=csv,noheader,nounits'],
-                                              capture_output=True, text=True, timeout=1)
-                        if result.returncode == 0:
-                            gpu_temp = int(result.stdout.strip())
-                            temp_color = ModernTheme.SUCCESS if gpu_temp < 70 else \
-                                        ModernTheme.WARNING if gpu_temp < 85 else ModernTheme.DANGER
-                            self.mon_gpu_temp.config(text=f"{gpu_temp}°C", fg=temp_color)
-                    except:
-                        pass
-                
-                # Update fan speeds
-                if hasattr(self, 'mon_fan1') and self.mon_fan1.winfo_exists() and self.wmi_obj:
-                    try:
-                        fan_speeds = []
-                        for sensor in self.wmi_obj.Sensor():
-                            if sensor.SensorType == u'Fan':
-                                fan_speeds.append(int(sensor.Value))
-                        
-                        if len(fan_speeds) > 0:
-                            self.mon_fan1.config(text=f"{fan_speeds[0]} RPM")
-                        if len(fan_speeds) > 1 and hasattr(self, 'mon_fan2') and self.mon_fan2.winfo_exists():
-                            self.mon_fan2.config(text=f"{fan_speeds[1]} RPM")
-                    except:
-                        pass
+            # Performance page: fill adapters and drives in once the inventory has them
+            if self.current_section == "performance" and self.device_inventory.ready and \
+                    self.device_inventory.version != getattr(self, 'perf_inventory_version', None):
+                self._fill_performance_inventory()
             
-            # Update storage page if active
-            elif self.current_section == "storage":
-                if hasattr(self, 'storage_io_labels') and hasattr(self, 'last_disk_io_time'):
-                    try:
-                        current_io = psutil.disk_io_counters(perdisk=True)
-                        current_time = time.time()
-                        dt = current_time - self.last_disk_io_time
-                        
-                        if dt > 0:
-                            for drive_key, labels in self.storage_io_labels.items():
-                                physical_drives = list(current_io.keys())
-                                
-                                if physical_drives:
-                                    physical_drive = physical_drives[0]
-                                    
-                                    if physical_drive in current_io and physical_drive in self.last_disk_io_data:
-                                        curr = current_io[physical_drive]
-                                        prev = self.last_disk_io_data[physical_drive]
-                                        
-                                        read_speed = (curr.read_bytes - prev.read_bytes) / dt / (1024**2)
-                                        write_speed = (curr.write_bytes - prev.write_bytes) / dt / (1024**2)
-                                        
-                                        if labels['read'] and labels['read'].winfo_exists():
-                                            labels['read'].config(text=f"{read_speed:.1f} MB/s")
-                                        if labels['write'] and labels['write'].winfo_exists():
-                                            labels['write'].config(text=f"{write_speed:.1f} MB/s")
-                            
-                            self.last_disk_io_data = current_io
-                            self.last_disk_io_time = current_time
-                    except Exception as e:
-                        pass
+            # Process Manager: apply rows only when the engine re-ranked
+            on_processes = self.current_section == "processes"
+            self.process_table.set_active(on_processes)
+            if on_processes and self.process_table.version != self.process_view_version:
+                self.render_process_table()
             
+            # Redraw data only when the sampler has published a new snapshot
+            snap = self.ui_data
+            if snap.seq != self.rendered_seq:
+                self.rendered_seq = snap.seq
+                with self.io_guard.section("update_ui"), \
+                        self.frame_stats.timed(f"update_ui:{self.current_section}"):
+                    self.render_snapshot(snap)
         except Exception as e:
             print(f"UI update error: {e}")
         
         self.root.after(250, self.update_ui)  # 250ms for ultra-responsive 144fps UI
     
+    def format_ram_forecast(self, forecast):
+        """Memory card trend line: (text, color)"""
+        if forecast.level is None:
+            return "Trend: collecting...", ModernTheme.TEXT_SECONDARY
+        confidence = f"{int(forecast.confidence * 100)}% conf"
+        if forecast.eta is None:
+            per_min = forecast.slope * 60
+            trend = "stable" if abs(per_min) < 0.5 else f"{per_min:+.1f}%/min"
+            return f"Trend: {trend} ({confidence})", ModernTheme.TEXT_SECONDARY
+        eta = int(forecast.eta)
+        eta_text = f"{eta // 60}m {eta % 60:02d}s" if eta >= 60 else f"{eta}s"
+        color = ModernTheme.DANGER if forecast.eta <= self.policy.params.get("forecast_lead_s", 30) \
+            else ModernTheme.ACCENT_ORANGE
+        return f"{self.threshold_ram}% in ~{eta_text} ({confidence})", color
+    
+    def render_snapshot(self, snap):
+        """Draw one metric snapshot on the active page (no I/O: sampler data only)"""
+        # Update dashboard if active
+        if self.current_section == "dashboard":
+            # CPU
+            if hasattr(self, 'cpu_progress') and self.cpu_progress.winfo_exists():
+                cpu_color = ModernTheme.ACCENT_LIME if snap.cpu_p < 50 else \
+                           ModernTheme.ACCENT_ORANGE if snap.cpu_p < 80 else ModernTheme.DANGER
+                
+                cpu_label = "CPU Load"
+                held = self.policy.held_for("high_cpu")
+                if held is not None:
+                    cpu_label = f"High Load ({int(held)}s)"
+                    
+                self.cpu_progress.set_value(snap.cpu_p, 
+                                           f"{int(snap.cpu_p)}%",
+                                           cpu_label, cpu_color)
+            
+            if hasattr(self, 'cpu_graph') and self.cpu_graph.winfo_exists():
+                self.cpu_graph.add_value(snap.cpu_p)
+            
+            # RAM
+            if hasattr(self, 'ram_progress') and self.ram_progress.winfo_exists():
+                ram_color = ModernTheme.ACCENT_PRIMARY if snap.ram_p < 50 else \
+                           ModernTheme.ACCENT_SECONDARY if snap.ram_p < 80 else ModernTheme.DANGER
+                
+                ram_label = f"{snap.ram_used}/{snap.ram_total} GB"
+                held = self.policy.held_for("high_ram")
+                if held is not None:
+                    ram_label += f"\nHigh ({int(held)}s)"
+                    
+                self.ram_progress.set_value(snap.ram_p,
+                                           f"{int(snap.ram_p)}%",
+                                           ram_label,
+                                           ram_color)
+            
+            if hasattr(self, 'ram_forecast_label') and self.ram_forecast_label.winfo_exists():
+                text, color = self.format_ram_forecast(self.ram_forecast)
+                self.binder.config(self.ram_forecast_label, text=text, fg=color)
+            
+            if hasattr(self, 'ram_graph') and self.ram_graph.winfo_exists():
+                self.ram_graph.add_value(snap.ram_p)
+            
+            # GPU
+            if hasattr(self, 'gpu_progress') and self.gpu_progress.winfo_exists():
+                gpu_color = ModernTheme.ACCENT_TERTIARY if snap.gpu_p < 70 else ModernTheme.ACCENT_ORANGE
+                self.gpu_progress.set_value(snap.gpu_p,
+                                           f"{int(snap.gpu_p)}%",
+                                           "GPU Load", gpu_color)
+            
+            # Info labels
+            if hasattr(self, 'info_labels'):
+                for label_key, label_widget in self.info_labels.items():
+                    if label_widget.winfo_exists():
+                        if "Processes:" in label_key:
+                            self.binder.config(label_widget, text=str(snap.processes))
+                        elif "Threads:" in label_key:
+                            self.binder.config(label_widget, text=str(snap.threads))
+                        elif "Uptime:" in label_key:
+                            self.binder.config(label_widget, text=snap.uptime)
+        
+        # Update performance page if active
+        elif self.current_section == "performance":
+            # Update CPU gauge and frequency
+            if hasattr(self, 'perf_cpu_gauge') and self.perf_cpu_gauge.winfo_exists():
+                cpu_pct = snap.cpu_p
+                cpu_color = ModernTheme.ACCENT_LIME if cpu_pct < 50 else \
+                           ModernTheme.ACCENT_ORANGE if cpu_pct < 80 else ModernTheme.DANGER
+                self.perf_cpu_gauge.set_value(cpu_pct, f"{int(cpu_pct)}%", "CPU", cpu_color)
+            
+            if hasattr(self, 'perf_cpu_freq') and self.perf_cpu_freq.winfo_exists():
+                if snap.cpu_freq > 0:
+                    # Show actual current frequency (not max)
+                    self.binder.config(self.perf_cpu_freq, text=f"{snap.cpu_freq:.2f} GHz")
+            
+            # Update RAM gauge and metrics
+            if hasattr(self, 'perf_ram_gauge') and self.perf_ram_gauge.winfo_exists():
+                ram_pct = snap.ram_p
+                ram_color = ModernTheme.ACCENT_PRIMARY if ram_pct < 50 else \
+                           ModernTheme.ACCENT_SECONDARY if ram_pct < 80 else ModernTheme.DANGER
+                self.perf_ram_gauge.set_value(ram_pct, f"{int(ram_pct)}%", "Memory", ram_color)
+            
+            if hasattr(self, 'perf_ram_used') and self.perf_ram_used.winfo_exists():
+                self.binder.config(self.perf_ram_used, text=f"{snap.ram_used:.1f} GB")
+                if hasattr(self, 'perf_ram_avail') and self.perf_ram_avail.winfo_exists():
+                    self.binder.config(self.perf_ram_avail, text=f"{snap.ram_avail:.1f} GB")
+                
+                # Update cached memory (PERFORMANCE_INFORMATION on Windows, sampled by the memory collector)
+                if hasattr(self, 'perf_ram_cached') and self.perf_ram_cached.winfo_exists() and snap.ram_cached > 0:
+                    self.binder.config(self.perf_ram_cached, text=f"{snap.ram_cached:.1f} GB")
+            
+            # Update GPU gauge and utilization
+            if getattr(self, 'perf_gpu_gauge', None) and self.perf_gpu_gauge.winfo_exists():
+                gpu_pct = snap.gpu_p
+                gpu_color = ModernTheme.ACCENT_TERTIARY if gpu_pct < 70 else ModernTheme.ACCENT_ORANGE
+                self.perf_gpu_gauge.set_value(gpu_pct, f"{int(gpu_pct)}%", "GPU", gpu_color)
+            
+            if getattr(self, 'perf_gpu_util', None) and self.perf_gpu_util.winfo_exists():
+                self.binder.config(self.perf_gpu_util, text=f"{int(snap.gpu_p)}%")
+        
+        # Update monitoring page if active
+        elif self.current_section == "monitoring":
+            # Update CPU temperature
+            if hasattr(self, 'mon_cpu_temp') and self.mon_cpu_temp.winfo_exists():
+                cpu_temp = snap.cpu_temp
+                if cpu_temp and cpu_temp > 0:
+                    temp_color = ModernTheme.SUCCESS if cpu_temp < 60 else \
+                                ModernTheme.WARNING if cpu_temp < 80 else ModernTheme.DANGER
+                    self.binder.config(self.mon_cpu_temp, text=f"{cpu_temp}°C", fg=temp_color)
+                else:
+                    self.binder.config(self.mon_cpu_temp, text="--°C")
+            
+            # Active temperature source and its average cost
+            if hasattr(self, 'mon_temp_source') and self.mon_temp_source.winfo_exists():
+                source = self.temp_sources.active
+                if source:
+                    avg_ms = self.temp_sources.average_ms() or 0
+                    self.binder.config(self.mon_temp_source, text=f"Source: {source} ({avg_ms:.1f} ms avg)")
+                else:
+                    self.binder.config(self.mon_temp_source, text="Source: none available (retrying)")
+            
+            # Update GPU temperature
+            if hasattr(self, 'mon_gpu_temp') and self.mon_gpu_temp.winfo_exists():
+                gpu_temp = snap.gpu_temp
+                if gpu_temp and gpu_temp > 0:
+                    temp_color = ModernTheme.SUCCESS if gpu_temp < 70 else \
+                                ModernTheme.WARNING if gpu_temp < 85 else ModernTheme.DANGER
+                    self.binder.config(self.mon_gpu_temp, text=f"{gpu_temp}°C", fg=temp_color)
+            
+            # Update fan speeds
+            if hasattr(self, 'mon_fan1') and self.mon_fan1.winfo_exists():
+                fan_speeds = snap.fan_speeds
+                if len(fan_speeds) > 0:
+                    self.binder.config(self.mon_fan1, text=f"{fan_speeds[0]} RPM")
+                if len(fan_speeds) > 1 and hasattr(self, 'mon_fan2') and self.mon_fan2.winfo_exists():
+                    self.binder.config(self.mon_fan2, text=f"{fan_speeds[1]} RPM")
+        
+        # Update storage page if active
+        elif self.current_section == "storage":
+            if hasattr(self, 'storage_io_labels'):
+                try:
+                    # Rates come from the disk collector's last tick
+                    disk_rates = self.rates.disks
+                    for drive_key, labels in self.storage_io_labels.items():
+                        physical_drives = list(disk_rates.keys())
+                        
+                        if physical_drives:
+                            rate = disk_rates[physical_drives[0]]
+                            read_speed = rate["read_bytes_s"] / (1024**2)
+                            write_speed = rate["write_bytes_s"] / (1024**2)
+                            
+                            if labels['read'] and labels['read'].winfo_exists():
+                                self.binder.config(labels['read'], text=f"{read_speed:.1f} MB/s")
+                            if labels['write'] and labels['write'].winfo_exists():
+                                self.binder.config(labels['write'], text=f"{write_speed:.1f} MB/s")
+                except Exception as e:
+                    pass
+    
     def optimize_ram(self):
         """Optimize RAM usage - Silent mode"""
+        if not self.trimmer.try_begin():
+            print("RAM optimization already running, skipped")
+            return
+        threading.Thread(target=self._optimize_ram_thread, daemon=True).start()
+    
+    def _auto_optimize_ram(self, rule, value):
+        """Policy action: silent RAM optimization (popup unless silent mode)"""
+        # One pass at a time: a trim during another pass's settle skews its refaults
+        if not self.trimmer.try_begin():
+            return
+        if not self.silent_mode:
+            if rule.metric == "ram_eta":
+                # Forecast trigger: value is seconds until threshold_ram, not a percentage
+                message = (f"⚠️ RAM expected to reach {self.threshold_ram}% in {value:.0f} s "
+                           f"(now {self.ui_data.ram_p:.1f}%)")
+            else:
+                message = f"⚠️ RAM usage is high ({value:.1f}%)"
+            self.root.after(0, lambda m=message: messagebox.showwarning(
+                "Auto-Optimization",
+                f"{m}\n\n"
+                f"Auto-optimization starting now..."
+            ))
         threading.Thread(target=self._optimize_ram_thread, daemon=True).start()
     
+    def _auto_optimize_cpu(self, rule, value):
+        """Policy action: demote sustained CPU offenders"""
+        threading.Thread(target=self._optimize_cpu_thread, daemon=True).start()
+    
     def _optimize_ram_thread(self):
-        """Background RAM optimization - Silent"""
+        """Background RAM optimization - Silent (caller holds trimmer.try_begin())"""
         try:
             initial_ram = psutil.virtual_memory().percent
             
             # Python garbage collection
             gc.collect()
             
-            # Empty working sets for all processes
-            optimized_count = 0
-            for proc in psutil.process_iter(['pid', 'name']):
-                try:
-                    if empty_working_set(proc.info['pid']):
-                        optimized_count += 1
-                except:
-                    pass
-            
-            # Wait a moment for changes to take effect
-            time.sleep(1)
+            # Trim the largest working sets in parallel
+            report = self.trimmer.run()
             
             final_ram = psutil.virtual_memory().percent
-            freed = initial_ram - final_ram
             
             # Silent - just log to console
-            print(f"RAM Optimized: {optimized_count} processes, {freed:.1f}% freed, now at {final_ram:.1f}%")
+            print(f"RAM Optimized: {report.summary()}, {initial_ram:.1f}% -> {final_ram:.1f}%")
+            for r in report.results[:5]:
+                print(f"  {r.name} (PID {r.pid}): {r.reclaimed / (1024 * 1024):.1f} MB")
+            
+            # Check how much of it was faulted straight back in
+            self.trimmer.settle(report)
+            print(f"RAM Optimization settled: {report.summary()}")
+            if report.thrashing:
+                print(f"  Refaulting, excluded from next passes: {', '.join(report.thrashing)}")
         except Exception as e:
             print(f"Optimization error: {e}")
+        finally:
+            self.trimmer.end()
     
     def _optimize_cpu_thread(self):
         """Background CPU optimization"""
         try:
-            # Lower priority of high-CPU processes
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent']):
-                try:
-                    if proc.info['cpu_percent'] and proc.info['cpu_percent'] > 50:
-                        p = psutil.Process(proc.info['pid'])
-                        # Lower priority (Windows: BELOW_NORMAL_PRIORITY_CLASS)
-                        p.nice(psutil.BELOW_NORMAL_PRIORITY_CLASS)
-                except:
-                    pass
+            # Lower priority of processes that stayed hot for the whole window;
+            # on_load() restores them once system load has dropped
+            for entry in self.cpu_throttler.throttle():
+                print(f"CPU Optimized: {entry['name']} (PID {entry['pid']}) at {entry['cpu']:.0f}% "
+                      f"-> priority {entry['to']}")
         except Exception as e:
             print(f"CPU optimization error: {e}")
     
@@ -2846,8 +3256,25 @@ class SystemDashboardPro:
         except Exception as e:
             print(f"Cache clearing error: {e}")
     
+    def report_history(self, span=86400):
+        """Report section: min/avg/p95/max over the last ``span`` seconds from the metrics store"""
+        now = time.time()
+        try:
+            stats = self.metrics_store.summary(now - span, now, ("cpu_p", "ram_p", "gpu_p"))
+        except Exception as e:
+            return f"   • Unavailable ({e})"
+        if not stats:
+            return "   • No samples yet"
+        names = {"cpu_p": "CPU", "ram_p": "RAM", "gpu_p": "GPU"}
+        return "\n".join(
+            f"   • {names[field]}: avg {s['avg']:.1f}%, p95 {s['p95']:.1f}%, "
+            f"max {s['max']:.1f}% (min {s['min']:.1f}%)"
+            for field, s in stats.items())
+    
     def show_report(self):
         """Show full system report"""
+        snap = self.ui_data
+        history = self.report_history()
         report = f"""
 ╔══════════════════════════════════════╗
 ║     SYSTEM PERFORMANCE REPORT        ║
@@ -2855,29 +3282,32 @@ class SystemDashboardPro:
 
 📊 CPU Information:
    • Processor: {self.cpu_name[:35]}
-   • Usage: {self.ui_data['cpu_p']:.1f}%
+   • Usage: {snap.cpu_p:.1f}%
    • Cores: {psutil.cpu_count(logical=False)} Physical
    • Threads: {psutil.cpu_count(logical=True)} Logical
 
 💾 Memory Information:
    • Total RAM: {self.total_ram_gb} GB
-   • Used: {self.ui_data['ram_used']:.1f} GB
-   • Usage: {self.ui_data['ram_p']:.1f}%
+   • Used: {snap.ram_used:.1f} GB
+   • Usage: {snap.ram_p:.1f}%
 
 🎮 GPU Information:
-   • Usage: {self.ui_data['gpu_p']:.1f}%
+   • Usage: {snap.gpu_p:.1f}%
 
 🌐 Network:
-   • Sent: {self.ui_data['net_send']:.1f} MB
-   • Received: {self.ui_data['net_recv']:.1f} MB
+   • Sent: {snap.net_send:.1f} MB
+   • Received: {snap.net_recv:.1f} MB
 
 ⚙️ System:
-   • Processes: {self.ui_data['processes']}
-   • Threads: {self.ui_data['threads']}
-   • Uptime: {self.ui_data['uptime']}
+   • Processes: {snap.processes}
+   • Threads: {snap.threads}
+   • Uptime: {snap.uptime}
    • Boot Time: {self.boot_time}
 
-📁 Log File: {os.path.abspath(self.csv_file)}
+📈 Last 24 Hours:
+{history}
+
+📁 History: {os.path.abspath(self.metrics_store.path)}
 """
         
         # Create report window
@@ -2897,3 +3327,5 @@ if __name__ == "__main__":
     root = tk.Tk()
     app = SystemDashboardPro(root)
     root.mainloop()
+    app.cpu_throttler.restore_all()
+    app.metrics_store.close()
@@ -0,0 +1,49 @@
+"""Dirty-checked widget updates.
+
+``WidgetBinder.config(widget, text=...)`` remembers the last value applied to
+each option of each widget and only calls into Tk when the new value differs.
+On an idle machine most labels show the same text tick after tick, so this
+skips most Tcl round trips and the repaints they trigger.
+"""
+import weakref
+
+
+class WidgetBinder:
+    """Applies widget options only when they changed since the last update."""
+
+    def __init__(self):
+        # widget -> {option: last applied value}; entries go away with the widget
+        self._last = weakref.WeakKeyDictionary()
+        self.applied = 0
+        self.skipped = 0
+
+    def config(self, widget, **options):
+        """Apply the changed subset of ``options`` in one call. Returns True if Tk was touched."""
+        last = self._last.get(widget)
+        if last is None:
+            last = self._last[widget] = {}
+
+        changed = {k: v for k, v in options.items() if last.get(k, _UNSET) != v}
+        if not changed:
+            self.skipped += 1
+            return False
+
+        widget.config(**changed)
+        last.update(changed)
+        self.applied += 1
+        return True
+
+    def forget(self, widget):
+        """Drop the cached values (e.g. after the widget was changed directly)."""
+        self._last.pop(widget, None)
+
+    def stats(self):
+        total = self.applied + self.skipped
+        return {
+            "applied": self.applied,
+            "skipped": self.skipped,
+            "skip_ratio": round(self.skipped / total, 3) if total else 0.0,
+        }
+
+
+_UNSET = object()